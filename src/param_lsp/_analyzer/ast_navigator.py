@@ -14,16 +14,70 @@ Components:
 from __future__ import annotations
 
 import logging
+import re
+import tokenize
+from bisect import bisect_right
+from itertools import accumulate
 from typing import TYPE_CHECKING
 
+import msgspec
+
 from param_lsp import _treesitter
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from tree_sitter import Node
 
 logger = logging.getLogger(__name__)
 
 
+# Matches a line whose right side of the first "=" looks like a call, not a literal
+_PARAMETER_ASSIGNMENT_RE = re.compile(r"[^=]*=(?!\s*(?:[\'\"\[{]|True|False)).*\(", re.DOTALL)
+
+# Characters the fallback multiline scanner has to look at
+_BRACKET_OR_QUOTE_RE = re.compile(r"[\"'()\[\]{}]")
+
+# The `=` (but not `==`) following an assignment target
+_ASSIGNMENT_OPERATOR_RE = re.compile(r"[^\S\n]*=(?!=)")
+
+
+class SourceText(msgspec.Struct, frozen=True):
+    """Source code as one string with the offset at which each line starts.
+
+    Lines are located and sliced through the offsets instead of re-joining or
+    re-splitting the source. line_starts ends with an entry one past the text.
+    """
+
+    text: str
+    line_starts: list[int]
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts) - 1
+
+    def line_index(self, offset: int) -> int:
+        """Return the index of the line containing the character at offset."""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def line_span(self, start_index: int, end_index: int) -> str:
+        """Return lines start_index to end_index (inclusive) joined by newlines."""
+        end_offset = self.line_starts[min(end_index + 1, self.line_count)] - 1
+        return self.text[self.line_starts[start_index] : end_offset]
+
+
+def source_text(text: str) -> SourceText:
+    """Build the SourceText of a source string."""
+    lengths = (len(line) + 1 for line in text.split("\n"))
+    return SourceText(text, [0, *accumulate(lengths)])
+
+
+def source_text_from_lines(source_lines: list[str]) -> SourceText:
+    """Build the SourceText of a list of source lines."""
+    lengths = (len(line) + 1 for line in source_lines)
+    return SourceText("\n".join(source_lines), [0, *accumulate(lengths)])
+
+
 class ParameterDetector:
     """Handles detection of parameter assignments and calls in AST."""
 
@@ -36,6 +90,14 @@ class ParameterDetector:
         """
         self.imports = imports
         self.parameter_types = parameter_types or set()
+        # Class names of the dotted parameter types, for matching relative imports
+        self._parameter_type_names = {
+            param_type.rpartition(".")[2]
+            for param_type in self.parameter_types
+            if "." in param_type
+        }
+        # Whether an imported full name is a parameter type, see _is_parameter_type_import
+        self._parameter_type_imports: dict[str, bool] = {}
 
     def is_parameter_assignment(self, node: Node) -> bool:
         """Check if a tree-sitter assignment statement looks like a parameter definition.
@@ -55,7 +117,7 @@ class ParameterDetector:
         # Fallback: scan children for '=' and check right side
         found_equals = False
         for child in _treesitter.get_children(node):
-            if child.text == b"=" or _treesitter.get_value(child) == "=":
+            if child.text == b"=":
                 found_equals = True
             elif found_equals and child.type == "call":
                 # Check if it's a parameter type call
@@ -81,53 +143,57 @@ class ParameterDetector:
 
         # Extract the function name
         func_name = None
+        func_type = func_node.type
 
-        if func_node.type == "identifier":
+        if func_type == "identifier":
             # Simple call: String()
             func_name = _treesitter.get_value(func_node)
-        elif func_node.type == "attribute":
+        elif func_type == "attribute":
             # Dotted call: param.String()
             attr_node = func_node.child_by_field_name("attribute")
             if attr_node:
                 func_name = _treesitter.get_value(attr_node)
 
-        if func_name and func_name in self.imports:
-            # Check if it's an imported type
-            imported_full_name = self.imports[func_name]
-
-            # PRIMARY CHECK: Use statically detected parameter types
-            if self.parameter_types:
-                # Direct match
-                if imported_full_name in self.parameter_types:
-                    return True
-
-                # Handle relative imports (..viewable.Children, .parameters.List, etc.)
-                # Match by class name suffix
-                if imported_full_name.startswith("."):
-                    class_name = imported_full_name.split(".")[-1]
-                    for param_type in self.parameter_types:
-                        if param_type.endswith(f".{class_name}"):
-                            return True
-
-            # FALLBACK: If no parameter_types provided, accept anything from param module
-            # This maintains backward compatibility for tests and cold starts
-            if imported_full_name.startswith("param."):
-                return True
+        # Check if it's an imported type
+        imported_full_name = self.imports.get(func_name) if func_name else None
+        if imported_full_name and self._is_parameter_type_import(imported_full_name):
+            return True
 
         # Also check direct param.* calls (not through imports)
         # e.g., param.String() when param is imported
-        if func_node.type == "attribute":
+        if func_type == "attribute":
             obj_node = func_node.child_by_field_name("object")
             if obj_node and obj_node.type == "identifier":
                 module_name = _treesitter.get_value(obj_node)
-                if module_name in self.imports:
-                    imported_module = self.imports[module_name]
-                    # Accept if the module is "param"
-                    if imported_module == "param":
-                        return True
+                # Accept if the module is "param"
+                if module_name and self.imports.get(module_name) == "param":
+                    return True
 
         return False
 
+    def _is_parameter_type_import(self, imported_full_name: str) -> bool:
+        """Check if an imported full name refers to a parameter type.
+
+        The answer only depends on the full name and the parameter types, so it is
+        memoized per full name.
+        """
+        is_parameter_type = self._parameter_type_imports.get(imported_full_name)
+        if is_parameter_type is None:
+            is_parameter_type = self._parameter_type_imports[imported_full_name] = (
+                # PRIMARY CHECK: Use statically detected parameter types (direct match)
+                imported_full_name in self.parameter_types
+                # Handle relative imports (..viewable.Children, .parameters.List, etc.)
+                # Match by class name suffix
+                or (
+                    imported_full_name.startswith(".")
+                    and imported_full_name.rpartition(".")[2] in self._parameter_type_names
+                )
+                # FALLBACK: If no parameter_types provided, accept anything from param module
+                # This maintains backward compatibility for tests and cold starts
+                or imported_full_name.startswith("param.")
+            )
+        return is_parameter_type
+
 
 class ImportHandler:
     """Handles parsing of import statements in AST."""
@@ -139,6 +205,23 @@ class ImportHandler:
             imports: Dictionary to store import mappings
         """
         self.imports = imports
+        # Dispatch table from import node type to its handler
+        self._handlers = {
+            "import_statement": self.handle_import,
+            "import_from_statement": self.handle_import_from,
+        }
+
+    def handle(self, node: Node) -> None:
+        """Handle an 'import' or 'from ... import ...' statement (tree-sitter node).
+
+        Other node types are ignored.
+
+        Args:
+            node: AST node representing an import statement
+        """
+        handler = self._handlers.get(node.type)
+        if handler is not None:
+            handler(node)
 
     def _reconstruct_dotted_name(self, node: Node) -> str | None:
         """Reconstruct a dotted name from a tree-sitter dotted_name/attribute node.
@@ -149,10 +232,11 @@ class ImportHandler:
         Returns:
             The reconstructed dotted name string
         """
-        if node.type == "identifier":
+        node_type = node.type
+        if node_type == "identifier":
             return _treesitter.get_value(node)
 
-        if node.type == "dotted_name":
+        if node_type == "dotted_name":
             parts = [
                 _treesitter.get_value(child)
                 for child in _treesitter.get_children(node)
@@ -162,7 +246,7 @@ class ImportHandler:
             valid_parts = [part for part in parts if part is not None]
             return ".".join(valid_parts) if valid_parts else None
 
-        if node.type == "attribute":
+        if node_type == "attribute":
             # Recursively build dotted name from attribute chain
             obj_node = node.child_by_field_name("object")
             attr_node = node.child_by_field_name("attribute")
@@ -183,7 +267,8 @@ class ImportHandler:
         # Tree-sitter import_statement structure:
         # import_statement -> name: dotted_name/identifier, alias: (as) identifier?
         for child in _treesitter.get_children(node):
-            if child.type == "aliased_import":
+            child_type = child.type
+            if child_type == "aliased_import":
                 # Handle "import module as alias"
                 name_node = child.child_by_field_name("name")
                 alias_node = child.child_by_field_name("alias")
@@ -192,7 +277,7 @@ class ImportHandler:
                     alias_name = _treesitter.get_value(alias_node) if alias_node else None
                     if module_name:
                         self.imports[alias_name or module_name] = module_name
-            elif child.type in ("dotted_name", "identifier"):
+            elif child_type in ("dotted_name", "identifier"):
                 # Handle "import module"
                 module_name = self._reconstruct_dotted_name(child)
                 if module_name:
@@ -213,8 +298,10 @@ class ImportHandler:
         if not module_name:
             return
 
-        # Find imported names - look for aliased_import, identifier, or dotted_name children
-        for child in _treesitter.get_children(node):
+        # The imported names are the "name" field children, so keywords, punctuation
+        # and the module name are never visited. Wildcard imports have none.
+        imported: dict[str, str] = {}
+        for child in node.children_by_field_name("name"):
             if child.type == "aliased_import":
                 # Handle "from module import name as alias"
                 name_node = child.child_by_field_name("name")
@@ -223,14 +310,13 @@ class ImportHandler:
                     import_name = _treesitter.get_value(name_node)
                     alias_name = _treesitter.get_value(alias_node) if alias_node else None
                     if import_name:
-                        full_name = f"{module_name}.{import_name}"
-                        self.imports[alias_name or import_name] = full_name
-            elif child.type in ("identifier", "dotted_name") and child != module_node:
+                        imported[alias_name or import_name] = f"{module_name}.{import_name}"
+            else:
                 # Handle "from module import name"
                 import_name = self._reconstruct_dotted_name(child)
-                if import_name and import_name not in ("from", "import"):
-                    full_name = f"{module_name}.{import_name}"
-                    self.imports[import_name] = full_name
+                if import_name:
+                    imported[import_name] = f"{module_name}.{import_name}"
+        self.imports.update(imported)
 
 
 class SourceAnalyzer:
@@ -246,20 +332,9 @@ class SourceAnalyzer:
         Returns:
             True if line appears to be a parameter assignment
         """
-        # Remove the assignment part and check if there's a function call
-        if "=" not in line:
-            return False
-
-        right_side = line.split("=", 1)[1].strip()
-
-        # Look for patterns that suggest this is a parameter:
-        # - Contains a function call with parentheses
-        # - Doesn't look like a simple value assignment
-        return (
-            "(" in right_side
-            and not right_side.startswith(("'", '"', "[", "{", "True", "False"))
-            and not right_side.replace(".", "").replace("_", "").isdigit()
-        )
+        # The right side of the first "=" must contain a function call and must not
+        # start like a literal value (string, list, dict or boolean)
+        return _PARAMETER_ASSIGNMENT_RE.match(line) is not None
 
     @staticmethod
     def extract_multiline_definition(source_lines: list[str], start_index: int) -> str:
@@ -272,6 +347,60 @@ class SourceAnalyzer:
         Returns:
             Complete multiline definition as string
         """
+        end_index = SourceAnalyzer._find_definition_end(source_lines, start_index)
+        if end_index is None:
+            return SourceAnalyzer._scan_multiline_definition(source_lines, start_index)
+
+        # Join the lines and clean up the formatting
+        definition_lines = [line.rstrip() for line in source_lines[start_index : end_index + 1]]
+        return "\n".join(definition_lines).strip()
+
+    @staticmethod
+    def _find_definition_end(source_lines: list[str], start_index: int) -> int | None:
+        """Find the index of the last line of the statement starting at start_index.
+
+        Uses the tokenizer to track bracket depth, so brackets inside strings and
+        comments are ignored. Returns None if the source cannot be tokenized, e.g.
+        for an unterminated definition while the user is still typing.
+        """
+        # Most definitions fit on one line. Without quotes, comments or a line
+        # continuation every bracket on it is code, so str.count can tell in C that
+        # the brackets balance and the statement ends on this line
+        first_line = source_lines[start_index]
+        if (
+            '"' not in first_line
+            and "'" not in first_line
+            and "#" not in first_line
+            and not first_line.rstrip().endswith("\\")
+            and first_line.count("(") == first_line.count(")")
+            and first_line.count("[") == first_line.count("]")
+            and first_line.count("{") == first_line.count("}")
+        ):
+            return start_index
+
+        lines = (
+            line if line.endswith("\n") else f"{line}\n" for line in source_lines[start_index:]
+        )
+        depth = 0
+        try:
+            for token in tokenize.generate_tokens(lines.__next__):
+                if token.type == tokenize.OP:
+                    if token.string in "([{":
+                        depth += 1
+                    elif token.string in ")]}":
+                        depth -= 1
+                elif token.type in (tokenize.NEWLINE, tokenize.NL) and depth <= 0:
+                    return start_index + token.start[0] - 1
+        except (tokenize.TokenError, SyntaxError):
+            return None
+        return None
+
+    @staticmethod
+    def _scan_multiline_definition(source_lines: list[str], start_index: int) -> str:
+        """Extract a multiline definition by scanning characters for matching brackets.
+
+        Fallback for extract_multiline_definition when the source cannot be tokenized.
+        """
         definition_lines = []
         paren_count = 0
         bracket_count = 0
@@ -283,36 +412,42 @@ class SourceAnalyzer:
             line = source_lines[i]
             definition_lines.append(line.rstrip())
 
-            # Parse character by character to handle nested structures properly
-            j = 0
-            while j < len(line):
-                char = line[j]
-
-                # Handle string literals
-                if char in ('"', "'") and (j == 0 or line[j - 1] != "\\"):
-                    if not in_string:
-                        in_string = True
-                        string_char = char
-                    elif char == string_char:
-                        in_string = False
-                        string_char = None
-
-                # Skip counting if we're inside a string
-                if not in_string:
-                    if char == "(":
-                        paren_count += 1
-                    elif char == ")":
-                        paren_count -= 1
-                    elif char == "[":
-                        bracket_count += 1
-                    elif char == "]":
-                        bracket_count -= 1
-                    elif char == "{":
-                        brace_count += 1
-                    elif char == "}":
-                        brace_count -= 1
-
-                j += 1
+            # Without quotes every bracket counts, so let str.count do the work in C
+            if not in_string and '"' not in line and "'" not in line:
+                paren_count += line.count("(") - line.count(")")
+                bracket_count += line.count("[") - line.count("]")
+                brace_count += line.count("{") - line.count("}")
+
+            # Otherwise jump straight to quotes and brackets
+            else:
+                for match in _BRACKET_OR_QUOTE_RE.finditer(line):
+                    char = match.group()
+                    j = match.start()
+
+                    # Handle string literals
+                    if char in ('"', "'"):
+                        if j == 0 or line[j - 1] != "\\":
+                            if not in_string:
+                                in_string = True
+                                string_char = char
+                            elif char == string_char:
+                                in_string = False
+                                string_char = None
+
+                    # Skip counting if we're inside a string
+                    elif not in_string:
+                        if char == "(":
+                            paren_count += 1
+                        elif char == ")":
+                            paren_count -= 1
+                        elif char == "[":
+                            bracket_count += 1
+                        elif char == "]":
+                            bracket_count -= 1
+                        elif char == "{":
+                            brace_count += 1
+                        else:
+                            brace_count -= 1
 
             # Check if we've closed all parentheses/brackets/braces
             if paren_count <= 0 and bracket_count <= 0 and brace_count <= 0:
@@ -335,15 +470,13 @@ class SourceAnalyzer:
         Returns:
             Complete parameter definition or None if not found
         """
-        # Find the parameter line first using simple string matching (more reliable)
-        for i, line in enumerate(source_lines):
-            if (
-                (f"{param_name} =" in line or f"{param_name}=" in line)
-                and not line.strip().startswith("#")
-                and SourceAnalyzer.looks_like_parameter_assignment(line)
-            ):
-                # Extract the complete multiline definition
-                return SourceAnalyzer.extract_multiline_definition(source_lines, i)
+        # Find the parameter line first, jumping between occurrences of the name
+        index = SourceAnalyzer._find_parameter_line_index(
+            source_text_from_lines(source_lines), param_name
+        )
+        if index is not None:
+            # Extract the complete multiline definition
+            return SourceAnalyzer.extract_multiline_definition(source_lines, index)
 
         return None
 
@@ -362,11 +495,57 @@ class SourceAnalyzer:
             Line number where parameter is defined or None if not found
         """
         # Use the same generic detection logic
-        for i, line in enumerate(source_lines):
-            if (
-                (f"{param_name} =" in line or f"{param_name}=" in line)
-                and not line.strip().startswith("#")
-                and SourceAnalyzer.looks_like_parameter_assignment(line)
+        index = SourceAnalyzer._find_parameter_line_index(
+            source_text_from_lines(source_lines), param_name
+        )
+        return start_line + index if index is not None else None
+
+    @staticmethod
+    def find_parameter_lines_in_source(
+        source_lines: list[str], start_line: int, param_names: Iterable[str]
+    ) -> dict[str, int]:
+        """Find the line numbers where several parameters are defined, joining the source once.
+
+        Args:
+            source_lines: List of source code lines
+            start_line: Starting line number offset
+            param_names: Names of parameters to find
+
+        Returns:
+            Mapping of each found parameter name to the line where it is defined
+        """
+        buf = source_text_from_lines(source_lines)
+        lines = {}
+        for name in param_names:
+            index = SourceAnalyzer._find_parameter_line_index(buf, name)
+            if index is not None:
+                lines[name] = start_line + index
+        return lines
+
+    @staticmethod
+    def _find_parameter_line_index(buf: SourceText, param_name: str) -> int | None:
+        """Find the first line index assigning a parameter-like value to param_name.
+
+        Only looks at occurrences of the name: str.find jumps between them in the
+        source, each one is verified in place as a whole-word `name =` target outside
+        a comment, and the line start offsets map it back to its line. Sources that
+        do not mention the name at all are rejected with a single search.
+        """
+        source = buf.text
+        line_starts = buf.line_starts
+        offset = source.find(param_name)
+        while offset != -1:
+            end = offset + len(param_name)
+            before = source[offset - 1] if offset else ""
+            # Whole-word `name =` target; \w is exactly isalnum() plus underscore
+            if not (before.isalnum() or before == "_") and _ASSIGNMENT_OPERATOR_RE.match(
+                source, end
             ):
-                return start_line + i
+                index = buf.line_index(offset)
+                line_start = line_starts[index]
+                if "#" not in source[line_start:offset] and _PARAMETER_ASSIGNMENT_RE.match(
+                    source[line_start : line_starts[index + 1] - 1]
+                ):
+                    return index
+            offset = source.find(param_name, end)
         return None
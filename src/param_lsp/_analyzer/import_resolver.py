@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import importlib.util
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -52,6 +53,7 @@ class ImportResolver:
         module_cache: dict[str, AnalysisResult] | None = None,
         file_cache: dict[str, AnalysisResult] | None = None,
         analyze_file_func=None,
+        class_path_cache: dict[Node, str | None] | None = None,
     ):
         self.workspace_root = Path(workspace_root) if workspace_root else None
         self.imports: ImportDict = imports if imports is not None else {}
@@ -60,6 +62,40 @@ class ImportResolver:
         )
         self.file_cache: dict[str, AnalysisResult] = file_cache if file_cache is not None else {}
         self.analyze_file_func = analyze_file_func
+        # Resolved full class paths by node, shared with and cleared by the owner of the
+        # imports whenever they change. Without one, paths are resolved on every call.
+        self.class_path_cache = class_path_cache
+        # (module_name, directory for relative imports) -> resolved path. Failed
+        # lookups are not cached, so modules created later still resolve.
+        self.module_path_cache: dict[tuple[str, str | None], str] = {}
+        # Modification time (ns) of each module file when it was read for the file cache,
+        # and the file each cached module was read from, to detect edited modules
+        self.file_mtimes: dict[str, int] = {}
+        self.module_files: dict[str, str] = {}
+        # Module files whose results were used, cleared by the owner for each analysis
+        self.used_module_files: set[str] = set()
+
+    def _is_file_cache_current(self, module_path: str) -> bool:
+        """Check if the cached result of a module file is still current.
+
+        Results whose modification time is unknown, e.g. added to the cache directly, are
+        assumed current. Otherwise the file is stat'ed, which is far cheaper than
+        reading it again, and the result is stale if the file changed or was removed.
+        """
+        mtime_ns = self.file_mtimes.get(module_path)
+        if mtime_ns is None:
+            return True
+        try:
+            return os.stat(module_path).st_mtime_ns == mtime_ns
+        except OSError:
+            return False
+
+    def imported_modules_current(self) -> bool:
+        """Check if the cached results of all imported module files are still current."""
+        return all(
+            self._is_file_cache_current(module_path)
+            for module_path in set(self.module_files.values())
+        )
 
     def handle_import(self, node: Node) -> None:
         """Handle 'import' statements (tree-sitter node)."""
@@ -91,8 +127,10 @@ class ImportResolver:
         if not module_name:
             return
 
-        # Find imported names - look for aliased_import, dotted_name, or identifier children
-        for child in get_children(node):
+        # The imported names are the "name" field children, so keywords, punctuation
+        # and the module name are never visited. Wildcard imports have none.
+        imported: dict[str, str] = {}
+        for child in node.children_by_field_name("name"):
             if child.type == "aliased_import":
                 # Handle "from module import name as alias"
                 name_node = child.child_by_field_name("name")
@@ -101,30 +139,29 @@ class ImportResolver:
                     import_name = self._reconstruct_dotted_name(name_node)
                     alias_name = get_value(alias_node) if alias_node else None
                     if import_name:
-                        full_name = f"{module_name}.{import_name}"
-                        self.imports[alias_name or import_name] = full_name
-            elif child.type in ("dotted_name", "identifier") and child != module_node:
+                        imported[alias_name or import_name] = f"{module_name}.{import_name}"
+            else:
                 # Handle "from module import name" or "from module import dotted.name"
                 import_name = self._reconstruct_dotted_name(child)
-                if import_name and import_name not in ("from", "import"):
-                    full_name = f"{module_name}.{import_name}"
+                if import_name:
                     # For dotted imports like "from pkg import sub.module", use the last part as the key
-                    key = import_name.split(".")[-1] if "." in import_name else import_name
-                    self.imports[key] = full_name
+                    imported[import_name.rpartition(".")[2]] = f"{module_name}.{import_name}"
+        self.imports.update(imported)
 
     def _reconstruct_dotted_name(self, node: Node) -> str | None:
         """Reconstruct a dotted name from a tree-sitter node."""
-        if node.type == "identifier":
+        node_type = node.type
+        if node_type == "identifier":
             return get_value(node)
 
-        if node.type == "dotted_name":
+        if node_type == "dotted_name":
             parts = [
                 get_value(child) for child in get_children(node) if child.type == "identifier"
             ]
             valid_parts = [part for part in parts if part is not None]
             return ".".join(valid_parts) if valid_parts else None
 
-        if node.type == "attribute":
+        if node_type == "attribute":
             # Recursively build dotted name from attribute chain
             obj_node = node.child_by_field_name("object")
             attr_node = node.child_by_field_name("attribute")
@@ -139,15 +176,45 @@ class ImportResolver:
     def resolve_module_path(
         self, module_name: str | None, current_file_path: str | None = None
     ) -> str | None:
-        """Resolve a module name to a file path."""
+        """Resolve a module name to a file path.
+
+        Resolved paths are cached, as resolving involves filesystem checks and
+        possibly ``importlib.util.find_spec``. Failed lookups are retried.
+        """
         if not self.workspace_root or module_name is None:
             return None
 
-        # Handle relative imports
+        # Relative imports depend on the importing file's directory
+        current_dir = None
         if module_name.startswith("."):
             if not current_file_path:
                 return None
             current_dir = Path(current_file_path).parent
+
+        key = (module_name, str(current_dir) if current_dir is not None else None)
+        module_path = self.module_path_cache.get(key)
+        if module_path is not None:
+            return module_path
+
+        module_path = self._resolve_module_path_uncached(
+            module_name, self.workspace_root, current_dir
+        )
+        if module_path is not None:
+            self.module_path_cache[key] = module_path
+        return module_path
+
+    def _forget_module_path(self, module_path: str) -> None:
+        """Drop cached resolutions to a module file that changed or disappeared."""
+        stale_keys = [key for key, path in self.module_path_cache.items() if path == module_path]
+        for key in stale_keys:
+            del self.module_path_cache[key]
+
+    def _resolve_module_path_uncached(
+        self, module_name: str, workspace_root: Path, current_dir: Path | None
+    ) -> str | None:
+        """Resolve a module name to a file path without consulting the cache."""
+        # Handle relative imports
+        if current_dir is not None:
             # Convert relative module name to absolute path
             parts = module_name.lstrip(".").split(".")
             target_path = current_dir
@@ -171,7 +238,7 @@ class ImportResolver:
         parts = module_name.split(".")
 
         # Try in workspace root
-        target_path = self.workspace_root
+        target_path = workspace_root
         for part in parts:
             target_path = target_path / part
 
@@ -196,43 +263,57 @@ class ImportResolver:
         return None
 
     def resolve_full_class_path(self, base) -> str | None:
-        """Resolve the full class path from a tree-sitter node like pn.widgets.IntSlider."""
+        """Resolve the full class path from a tree-sitter node like pn.widgets.IntSlider.
+
+        Memoized per node in the class path cache when one was given.
+        """
+        cache = self.class_path_cache
+        if cache is None:
+            return self._resolve_full_class_path(base)
+        try:
+            return cache[base]
+        except KeyError:
+            full_class_path = cache[base] = self._resolve_full_class_path(base)
+            return full_class_path
+
+    def _resolve_full_class_path(self, base) -> str | None:
+        """Resolve the full class path of a node without memoization."""
         parts = []
 
         # Extract parts based on node type
-        if base.type == "identifier":
+        base_type = base.type
+        if base_type == "identifier":
             parts.append(get_value(base))
-        elif base.type == "attribute":
-            # Recursively extract parts from attribute chain
+        elif base_type == "attribute":
+            # Walk down the attribute chain, collecting names from right to left
             current = base
             while current:
-                if current.type == "attribute":
+                current_type = current.type
+                if current_type == "attribute":
                     attr_node = current.child_by_field_name("attribute")
                     if attr_node:
-                        parts.insert(0, get_value(attr_node))
+                        parts.append(get_value(attr_node))
                     current = current.child_by_field_name("object")
-                elif current.type == "identifier":
-                    parts.insert(0, get_value(current))
+                elif current_type == "identifier":
+                    parts.append(get_value(current))
                     current = None
                 else:
                     break
-        elif base.type == "call":
+            parts.reverse()
+        elif base_type == "call":
             # For call nodes, extract the function being called
             func_node = base.child_by_field_name("function")
             if func_node:
                 return self.resolve_full_class_path(func_node)
 
         if parts:
-            # Resolve the root module through imports
-            root_alias = parts[0]
-            if root_alias in self.imports:
-                full_module_name = self.imports[root_alias]
-                # Replace the alias with the full module name
+            # Resolve the root module through imports with a single lookup, replacing
+            # the alias with the full module name, or use the alias directly if no
+            # import mapping is found
+            full_module_name = self.imports.get(parts[0])
+            if full_module_name is not None:
                 parts[0] = full_module_name
-                return ".".join(parts)
-            else:
-                # Use the alias directly if no import mapping found
-                return ".".join(parts)
+            return ".".join(parts)
 
         return None
 
@@ -243,9 +324,15 @@ class ImportResolver:
         if module_name is None:
             return AnalysisResult(param_classes={}, imports={}, type_errors=[])
 
-        # Check cache first
+        # Check cache first, unless the module file changed since it was read
         if module_name in self.module_cache:
-            return self.module_cache[module_name]
+            cached_path = self.module_files.get(module_name)
+            if cached_path is None or self._is_file_cache_current(cached_path):
+                if cached_path is not None:
+                    self.used_module_files.add(cached_path)
+                return self.module_cache[module_name]
+            del self.module_cache[module_name]
+            self._forget_module_path(cached_path)
 
         # Resolve module path
         module_path = self.resolve_module_path(module_name, current_file_path)
@@ -254,15 +341,22 @@ class ImportResolver:
 
         # Check file cache
         if module_path in self.file_cache:
-            result = self.file_cache[module_path]
-            self.module_cache[module_name] = result
-            return result
+            if self._is_file_cache_current(module_path):
+                result = self.file_cache[module_path]
+                self.module_cache[module_name] = result
+                self.module_files[module_name] = module_path
+                self.used_module_files.add(module_path)
+                return result
+            del self.file_cache[module_path]
+            self._forget_module_path(module_path)
 
         # Read and analyze the module if analyze_file_func is provided
         if not self.analyze_file_func:
             return AnalysisResult(param_classes={}, imports={}, type_errors=[])
 
         try:
+            # Stat before reading, so an edit during the read is detected next time
+            mtime_ns = os.stat(module_path).st_mtime_ns
             with open(module_path, encoding="utf-8") as f:
                 content = f.read()
 
@@ -271,10 +365,16 @@ class ImportResolver:
 
             # Cache the result
             self.file_cache[module_path] = result
+            self.file_mtimes[module_path] = mtime_ns
             self.module_cache[module_name] = result
+            self.module_files[module_name] = module_path
+            self.used_module_files.add(module_path)
 
             return result
-        except (OSError, UnicodeDecodeError):
+        except OSError:
+            self._forget_module_path(module_path)
+            return AnalysisResult(param_classes={}, imports={}, type_errors=[])
+        except UnicodeDecodeError:
             return AnalysisResult(param_classes={}, imports={}, type_errors=[])
 
     def get_imported_param_class_info(
@@ -127,12 +127,22 @@ class InheritanceResolver:
         return False
 
     def collect_inherited_parameters(
-        self, node: Node, current_file_path: str | None = None
+        self,
+        node: Node,
+        current_file_path: str | None = None,
+        bases: list[Node] | None = None,
     ) -> dict[str, ParameterInfo]:
-        """Collect parameters from parent classes in inheritance hierarchy (tree-sitter node)."""
+        """Collect parameters from parent classes in inheritance hierarchy (tree-sitter node).
+
+        Args:
+            node: The class definition node
+            current_file_path: Path to the current file being analyzed (for cross-file resolution)
+            bases: The base class nodes of ``node``, if already computed by the caller
+        """
         inherited_parameters = {}  # Last wins
 
-        bases = get_class_bases(node)
+        if bases is None:
+            bases = get_class_bases(node)
         for base in bases:
             if base.type == "identifier":
                 parent_class_name = get_value(base)
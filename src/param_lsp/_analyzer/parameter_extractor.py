@@ -6,6 +6,8 @@ Handles extracting parameter information from tree-sitter AST nodes.
 from __future__ import annotations
 
 import logging
+import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
@@ -17,12 +19,12 @@ from param_lsp._treesitter import (
     get_value,
 )
 
-from .ast_navigator import SourceAnalyzer
-
 if TYPE_CHECKING:
     from tree_sitter import Node
 
     from param_lsp.models import ParameterInfo
+
+    from .ast_navigator import SourceText
 else:
     from param_lsp.models import ParameterInfo
 
@@ -30,6 +32,18 @@ else:
 NumericValue = int | float | None  # Numeric values from nodes
 BoolValue = bool | None  # Boolean values from nodes
 
+# Node types of the elements of bounds and inclusive_bounds tuples and lists
+_BOUNDS_ELEMENT_TYPES = frozenset(
+    {"integer", "float", "identifier", "unary_operator", "true", "false", "none"}
+)
+_INCLUSIVE_BOUNDS_ELEMENT_TYPES = frozenset({"identifier", "true", "false"})
+_SEQUENCE_NODE_TYPES = frozenset({"tuple", "list"})
+
+# String literal prefixes (r, b, u, f in any case and combination) and quotes
+_STRING_PREFIX_CHARS = "rRbBuUfF"
+_TRIPLE_QUOTES = frozenset({'"""', "'''"})
+_SINGLE_QUOTES = frozenset({'"', "'"})
+
 
 def is_parameter_assignment(node: Node) -> bool:
     """Check if a tree-sitter assignment statement represents a parameter definition.
@@ -51,7 +65,7 @@ def is_parameter_assignment(node: Node) -> bool:
     # Fallback: scan children for '=' and check right side
     found_equals = False
     for child in get_children(node):
-        if child.text == b"=" or get_value(child) == "=":
+        if child.text == b"=":
             found_equals = True
         elif found_equals and child.type == "call":
             # Check if it's a parameter type call
@@ -136,9 +150,26 @@ def extract_parameters(
     return parameters
 
 
-def get_keyword_arguments(call_node: Node) -> dict[str, Node]:
-    """Extract keyword arguments from a tree-sitter function call node."""
+def get_keyword_arguments(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> dict[str, Node]:
+    """Extract keyword arguments from a tree-sitter function call node.
 
+    When given, the arguments are memoized in ``cache`` by call node, as every extractor
+    of a parameter call and the validator look up the same call's arguments. A copy is
+    returned, so callers cannot change the cached arguments.
+    """
+    if cache is None:
+        return _get_keyword_arguments(call_node)
+    try:
+        kwargs = cache[call_node]
+    except KeyError:
+        kwargs = cache[call_node] = _get_keyword_arguments(call_node)
+    return dict(kwargs)
+
+
+def _get_keyword_arguments(call_node: Node) -> dict[str, Node]:
+    """Extract keyword arguments from a tree-sitter function call node without memoization."""
     kwargs = {}
 
     for trailer_node in find_function_call_trailers(call_node):
@@ -161,37 +192,31 @@ def extract_single_argument(arg_node: Node, kwargs: dict[str, Node]) -> None:
         return
 
     # Fallback: parse children manually
-    if len(get_children(arg_node)) >= 3:
-        name_node = get_children(arg_node)[0]
-        equals_node = get_children(arg_node)[1]
-        value_node = get_children(arg_node)[2]
-
-        if name_node.type == "identifier" and (
-            equals_node.text == b"=" or get_value(equals_node) == "="
-        ):
+    children = get_children(arg_node)
+    if len(children) >= 3:
+        name_node, equals_node, value_node = children[0], children[1], children[2]
+
+        if name_node.type == "identifier" and equals_node.text == b"=":
             name_value = get_value(name_node)
             if name_value:
                 kwargs[name_value] = value_node
 
 
-def extract_bounds_from_call(call_node: Node) -> tuple | None:
+def extract_bounds_from_call(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> tuple | None:
     """Extract bounds from a parameter call (tree-sitter version)."""
     bounds_info = None
     inclusive_bounds = (True, True)  # Default to inclusive
 
-    kwargs = get_keyword_arguments(call_node)
+    kwargs = get_keyword_arguments(call_node, cache)
 
     if "bounds" in kwargs:
         bounds_node = kwargs["bounds"]
         # Check if it's a tuple with 2 elements
-        if bounds_node.type in ("tuple", "list"):
+        if bounds_node.type in _SEQUENCE_NODE_TYPES:
             # Extract elements from tuple/list
-            elements = [
-                c
-                for c in get_children(bounds_node)
-                if c.type
-                in ("integer", "float", "identifier", "unary_operator", "true", "false", "none")
-            ]
+            elements = [c for c in get_children(bounds_node) if c.type in _BOUNDS_ELEMENT_TYPES]
             if len(elements) >= 2:
                 min_val = extract_numeric_value(elements[0])
                 max_val = extract_numeric_value(elements[1])
@@ -202,11 +227,11 @@ def extract_bounds_from_call(call_node: Node) -> tuple | None:
     if "inclusive_bounds" in kwargs:
         inclusive_bounds_node = kwargs["inclusive_bounds"]
         # Similar logic for inclusive bounds tuple
-        if inclusive_bounds_node.type in ("tuple", "list"):
+        if inclusive_bounds_node.type in _SEQUENCE_NODE_TYPES:
             elements = [
                 c
                 for c in get_children(inclusive_bounds_node)
-                if c.type in ("identifier", "true", "false")
+                if c.type in _INCLUSIVE_BOUNDS_ELEMENT_TYPES
             ]
             if len(elements) >= 2:
                 left_inclusive = extract_boolean_value(elements[0])
@@ -220,54 +245,66 @@ def extract_bounds_from_call(call_node: Node) -> tuple | None:
     return None
 
 
-def extract_doc_from_call(call_node: Node) -> str | None:
+def extract_doc_from_call(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> str | None:
     """Extract doc string from a parameter call (tree-sitter version)."""
-    kwargs = get_keyword_arguments(call_node)
+    kwargs = get_keyword_arguments(call_node, cache)
     if "doc" in kwargs:
         return extract_string_value(kwargs["doc"])
     return None
 
 
-def extract_allow_None_from_call(call_node: Node) -> BoolValue:
+def extract_allow_None_from_call(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> BoolValue:
     """Extract allow_None from a parameter call (tree-sitter version)."""
-    kwargs = get_keyword_arguments(call_node)
+    kwargs = get_keyword_arguments(call_node, cache)
     if "allow_None" in kwargs:
         return extract_boolean_value(kwargs["allow_None"])
     return None
 
 
-def extract_default_from_call(call_node: Node) -> Node | None:
+def extract_default_from_call(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> Node | None:
     """Extract default value from a parameter call (tree-sitter version)."""
-    kwargs = get_keyword_arguments(call_node)
+    kwargs = get_keyword_arguments(call_node, cache)
     if "default" in kwargs:
         return kwargs["default"]
     return None
 
 
-def extract_objects_from_call(call_node: Node) -> list[Any] | None:
+def extract_objects_from_call(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> list[Any] | None:
     """Extract objects list from Selector parameter call."""
-    kwargs = get_keyword_arguments(call_node)
+    kwargs = get_keyword_arguments(call_node, cache)
     if "objects" in kwargs:
         # Extract list values from the objects argument
         return _extract_list_values(kwargs["objects"])
     return None
 
 
-def extract_item_type_from_call(call_node: Node) -> str | None:
+def extract_item_type_from_call(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> str | None:
     """Extract item_type from List parameter call as a qualified string.
 
     Returns qualified type names like "builtins.str", "builtins.int", etc.
     """
-    kwargs = get_keyword_arguments(call_node)
+    kwargs = get_keyword_arguments(call_node, cache)
     if "item_type" in kwargs:
         # Extract the type from the item_type argument
         return _extract_type_value(kwargs["item_type"])
     return None
 
 
-def extract_length_from_call(call_node: Node) -> int | None:
+def extract_length_from_call(
+    call_node: Node, cache: dict[Node, dict[str, Node]] | None = None
+) -> int | None:
     """Extract length from Tuple parameter call."""
-    kwargs = get_keyword_arguments(call_node)
+    kwargs = get_keyword_arguments(call_node, cache)
     if "length" in kwargs:
         # Extract the numeric value from the length argument
         numeric_value = extract_numeric_value(kwargs["length"])
@@ -332,16 +369,16 @@ def extract_string_value(node: Node) -> str | None:
         value = get_value(node)
         if value is None:
             return None
+        # Skip a string prefix like r or b, then look up the quotes by slicing
+        body = value.lstrip(_STRING_PREFIX_CHARS)
         # Handle triple quotes first
-        if (value.startswith('"""') and value.endswith('"""')) or (
-            value.startswith("'''") and value.endswith("'''")
-        ):
-            return value[3:-3]
+        quote = body[:3]
+        if quote in _TRIPLE_QUOTES and body.endswith(quote):
+            return body[3:-3]
         # Handle single/double quotes
-        elif (value.startswith('"') and value.endswith('"')) or (
-            value.startswith("'") and value.endswith("'")
-        ):
-            return value[1:-1]
+        quote = body[:1]
+        if quote in _SINGLE_QUOTES and body.endswith(quote):
+            return body[1:-1]
         return value
     return None
 
@@ -349,16 +386,17 @@ def extract_string_value(node: Node) -> str | None:
 def extract_boolean_value(node: Node) -> BoolValue:
     """Extract boolean value from tree-sitter node."""
     if node:
-        if node.type == "true":
+        node_type = node.type
+        if node_type == "true":
             return True
-        elif node.type == "false":
+        elif node_type == "false":
             return False
         # Fallback for identifier nodes with True/False values
-        elif node.type == "identifier":
-            value = get_value(node)
-            if value == "True":
+        elif node_type == "identifier":
+            value = node.text
+            if value == b"True":
                 return True
-            elif value == "False":
+            elif value == b"False":
                 return False
     return None
 
@@ -373,43 +411,84 @@ def format_default_value(node: Node) -> str:
         return "<complex>"
 
 
+# Node types of numeric literals, and the suffixes of imaginary ones
+_NUMBER_NODE_TYPES = frozenset(("integer", "float"))
+_IMAGINARY_SUFFIXES = (b"j", b"J")
+
+
 def extract_numeric_value(node: Node) -> NumericValue:
     """Extract numeric value from tree-sitter node."""
     if not node:
         return None
 
-    if node.type == "integer":
-        try:
-            value = get_value(node)
-            return int(value) if value else None
-        except ValueError:
+    node_type = node.type
+    if node_type in _NUMBER_NODE_TYPES:
+        # int() and float() parse the raw bytes, so the text is never decoded
+        text = node.text
+        if not text:
+            return None
+        # Plain decimal integers, by far the most common literal, are parsed directly
+        if text.isdigit():
+            return int(text)
+        # Imaginary literals like 1j are not real numbers
+        if text[-1:] in _IMAGINARY_SUFFIXES:
             return None
-    elif node.type == "float":
         try:
-            value = get_value(node)
-            return float(value) if value else None
+            if node_type == "float":
+                return float(text)
+            # Prefixed integers like 0x1F need base 0, while base 10 keeps accepting
+            # underscores and leading zeros in decimal ones
+            return int(text, 0 if text[1:2].isalpha() else 10)
         except ValueError:
+            # Malformed text from error recovery
             return None
-    elif node.type == "none":
+    elif node_type == "none":
         return None  # Explicitly handle None
-    elif node.type == "unary_operator":
+    elif node_type == "unary_operator":
         # Handle unary operators like negative numbers: unary_operator with operand
         children = get_children(node)
         if len(children) >= 2:
             operator_node = children[0]
             operand_node = children[1]
-            if get_value(operator_node) == "-":
+            if operator_node.text == b"-":
                 operand_value = extract_numeric_value(operand_node)
                 if operand_value is not None:
                     return -operand_value
     # Fallback for identifier "None"
-    elif node.type == "identifier" and get_value(node) == "None":
+    elif node_type == "identifier" and node.text == b"None":
         return None
     return None
 
 
-def resolve_parameter_class(param_call: Node, imports: dict[str, str]) -> dict[str, str] | None:
-    """Resolve parameter class from a tree-sitter call node like param.Integer()."""
+@lru_cache(maxsize=512)
+def _param_import_type(imported_full_name: str) -> str | None:
+    """Get the interned param type of an imported full name like 'param.Integer', or None."""
+    if imported_full_name.startswith("param."):
+        return sys.intern(imported_full_name.rpartition(".")[2])
+    return None
+
+
+def resolve_parameter_class(
+    param_call: Node,
+    imports: dict[str, str],
+    cache: dict[Node, dict[str, str] | None] | None = None,
+) -> dict[str, str] | None:
+    """Resolve parameter class from a tree-sitter call node like param.Integer().
+
+    When given, results are memoized in ``cache`` by call node. A cache must only be
+    shared while ``imports`` is unchanged, such as during the analysis of one file.
+    """
+    if cache is None:
+        return _resolve_parameter_class(param_call, imports)
+    try:
+        return cache[param_call]
+    except KeyError:
+        result = cache[param_call] = _resolve_parameter_class(param_call, imports)
+        return result
+
+
+def _resolve_parameter_class(param_call: Node, imports: dict[str, str]) -> dict[str, str] | None:
+    """Resolve parameter class from a tree-sitter call node without memoization."""
     if param_call.type != "call":
         return None
 
@@ -420,11 +499,12 @@ def resolve_parameter_class(param_call: Node, imports: dict[str, str]) -> dict[s
 
     func_name = None
     module_name = None
+    func_type = func_node.type
 
-    if func_node.type == "identifier":
+    if func_type == "identifier":
         # Simple call: Integer()
         func_name = get_value(func_node)
-    elif func_node.type == "attribute":
+    elif func_type == "attribute":
         # Dotted call: param.Integer()
         obj_node = func_node.child_by_field_name("object")
         attr_node = func_node.child_by_field_name("attribute")
@@ -435,17 +515,19 @@ def resolve_parameter_class(param_call: Node, imports: dict[str, str]) -> dict[s
     if not func_name:
         return None
 
+    # Intern type names so downstream comparisons and dict lookups on ``cls``
+    # (e.g. ``cls in PARAM_TYPE_MAP``) can short-circuit on identity
+    func_name = sys.intern(func_name)
+
     # Check if module is "param" or an alias to "param" (e.g., "import param as p")
-    if module_name and (
-        module_name == "param" or (module_name in imports and imports[module_name] == "param")
-    ):
+    if module_name and (module_name == "param" or imports.get(module_name) == "param"):
         return {"type": func_name, "module": "param"}
 
     # Check if func_name itself is an imported param type (e.g., from param import String)
-    if func_name in imports:
-        imported_full_name = imports[func_name]
-        if imported_full_name.startswith("param."):
-            param_type = imported_full_name.split(".")[-1]
+    imported_full_name = imports.get(func_name)
+    if imported_full_name:
+        param_type = _param_import_type(imported_full_name)
+        if param_type:
             return {"type": param_type, "module": "param"}
 
     # If no module specified, assume it's a param type if we got here
@@ -456,13 +538,38 @@ def resolve_parameter_class(param_call: Node, imports: dict[str, str]) -> dict[s
     return None
 
 
+def _extract_source_definition(buf: SourceText, start_index: int, end_index: int) -> str | None:
+    """Extract the source definition spanning lines start_index to end_index of the source.
+
+    The span comes from the tree-sitter node, so no bracket scanning is needed.
+    Returns None if start_index is outside the source.
+    """
+    if not 0 <= start_index < buf.line_count:
+        return None
+
+    # Slice the span through the line offsets rather than splitting the whole content
+    span = buf.line_span(start_index, end_index).split("\n")
+    definition_lines = [line.rstrip() for line in span]
+    # Preserve the original indentation of the first line unless it had trailing whitespace
+    first_line = span[0]
+    definition_lines[0] = first_line if first_line == definition_lines[0] else first_line.strip()
+    return "\n".join(definition_lines)
+
+
 def extract_parameter_info_from_assignment(
     assignment_node: Node,
     param_name: str,
     imports: dict[str, str],
-    current_file_content: str | None = None,
+    source: SourceText | None = None,
+    parameter_class_cache: dict[Node, dict[str, str] | None] | None = None,
+    keyword_argument_cache: dict[Node, dict[str, Node]] | None = None,
 ) -> ParameterInfo | None:
-    """Extract parameter info from a tree-sitter assignment statement."""
+    """Extract parameter info from a tree-sitter assignment statement.
+
+    ``parameter_class_cache`` is passed on to ``resolve_parameter_class`` and
+    ``keyword_argument_cache`` to ``get_keyword_arguments``. Without the latter, the
+    arguments of the parameter call are only shared by its extractors.
+    """
     if assignment_node is None or param_name is None:
         logger.debug("Invalid input: assignment_node or param_name is None")
         return None
@@ -487,24 +594,27 @@ def extract_parameter_info_from_assignment(
     if not param_call:
         found_equals = False
         for child in get_children(assignment_node):
-            if child.text == b"=" or get_value(child) == "=":
+            if child.text == b"=":
                 found_equals = True
             elif found_equals and child.type == "call":
                 param_call = child
                 break
 
+    if keyword_argument_cache is None:
+        keyword_argument_cache = {}
+
     if param_call:
         # Get parameter type from the function call
-        param_class_info = resolve_parameter_class(param_call, imports)
+        param_class_info = resolve_parameter_class(param_call, imports, parameter_class_cache)
         if param_class_info:
             cls = param_class_info["type"]
 
         # Extract parameter arguments (bounds, doc, default, objects, etc.) from the whole param_call
-        bounds = extract_bounds_from_call(param_call)
-        doc = extract_doc_from_call(param_call)
-        allow_None_value = extract_allow_None_from_call(param_call)
-        default_value = extract_default_from_call(param_call)
-        objects = extract_objects_from_call(param_call)
+        bounds = extract_bounds_from_call(param_call, keyword_argument_cache)
+        doc = extract_doc_from_call(param_call, keyword_argument_cache)
+        allow_None_value = extract_allow_None_from_call(param_call, keyword_argument_cache)
+        default_value = extract_default_from_call(param_call, keyword_argument_cache)
+        objects = extract_objects_from_call(param_call, keyword_argument_cache)
 
         # Store default value as a string representation
         if default_value is not None:
@@ -520,25 +630,14 @@ def extract_parameter_info_from_assignment(
     if assignment_node:
         try:
             # Get line number from the tree-sitter node (0-indexed in tree-sitter)
-            line_number = assignment_node.start_point[0] + 1  # Convert to 1-indexed
-            # Get the multiline source definition from the current file content
-            if current_file_content:
-                lines = current_file_content.split("\n")
-                if 0 <= line_number - 1 < len(lines):
-                    # Use multiline extraction to get complete parameter definition
-                    source_definition = SourceAnalyzer.extract_multiline_definition(
-                        lines, line_number - 1
-                    )
-                    # Preserve the original indentation of the first line
-                    if source_definition and line_number - 1 < len(lines):
-                        original_first_line = lines[line_number - 1]
-                        # If original line has indentation that was stripped, restore it
-                        if original_first_line.lstrip() == source_definition.split("\n")[0]:
-                            # Replace first line with the original indented version
-                            source_lines = source_definition.split("\n")
-                            source_lines[0] = original_first_line
-                            source_definition = "\n".join(source_lines)
-
+            start_row = assignment_node.start_point[0]
+            line_number = start_row + 1  # Convert to 1-indexed
+            # Get the multiline source definition from the source of the current file
+            if source:
+                source_definition = _extract_source_definition(
+                    source, start_row, assignment_node.end_point[0]
+                )
+                if source_definition is not None:
                     location = {"line": line_number, "source": source_definition}
         except (AttributeError, IndexError):
             # If we can't get location info, continue without it
@@ -548,9 +647,9 @@ def extract_parameter_info_from_assignment(
     item_type = None
     length = None
     if cls == "List" and param_call is not None:
-        item_type = extract_item_type_from_call(param_call)
+        item_type = extract_item_type_from_call(param_call, keyword_argument_cache)
     elif cls == "Tuple" and param_call is not None:
-        length = extract_length_from_call(param_call)
+        length = extract_length_from_call(param_call, keyword_argument_cache)
 
     # Create ParameterInfo object
     return ParameterInfo(
@@ -13,25 +13,39 @@ from typing import TYPE_CHECKING, Any, TypedDict
 
 from param_lsp import _treesitter
 from param_lsp._logging import get_logger
-from param_lsp._treesitter.queries import find_classes, find_imports
+from param_lsp._treesitter.queries import find_classes, find_imports, find_imports_and_classes
 from param_lsp.cache import external_library_cache
 from param_lsp.constants import ALLOWED_EXTERNAL_LIBRARIES
 from param_lsp.models import ParameterInfo, ParameterizedInfo
 
-from .ast_navigator import ImportHandler, ParameterDetector
+from .ast_navigator import ImportHandler, ParameterDetector, source_text_from_lines
 from .parameter_extractor import extract_parameter_info_from_assignment
 from .python_environment import PythonEnvironment
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
     from tree_sitter import Node
 
+    from .ast_navigator import SourceText
+
 
 logger = get_logger(__name__, "cache")
 
 _STDLIB_MODULES = tuple(f"{c}." for c in ("__future__", *sys.stdlib_module_names))
 
+# Class body statements that cannot contain class-level parameter assignments.
+# Decorated definitions are skipped whole, as decorators cannot contain assignments.
+_CLASS_BODY_SKIPPED_TYPES = frozenset(
+    {"function_definition", "class_definition", "decorated_definition"}
+)
+
+
+def _class_names_of(class_paths: Iterable[str]) -> set[str]:
+    """Get the class names of dotted class paths, e.g. 'ListPanel' for 'panel.layout.ListPanel'."""
+    return {path.rpartition(".")[2] for path in class_paths if "." in path}
+
 
 class LibraryInfo(TypedDict):
     """Type for library information returned by _get_library_info."""
@@ -65,6 +79,8 @@ class ExternalClassInspector:
         self.analyzed_files: dict[Path, dict[str, Any]] = {}
         # Store source lines for parameter extraction
         self.file_source_cache: dict[Path, list[str]] = {}
+        # Source text of the source lines last used for parameter extraction
+        self._joined_source: tuple[list[str], SourceText] | None = None
         # Cache all class AST nodes for inheritance resolution
         self.class_ast_cache: dict[str, tuple[Node, dict[str, str]]] = {}
         # Multi-file analysis queue
@@ -78,6 +94,12 @@ class ExternalClassInspector:
         # Session-wide registry of detected parameter types across all libraries
         # This allows types to accumulate as we process libraries in dependency order
         self.session_parameter_types: set[str] = set()
+        # Parameter types detected for the library being populated, None until detected
+        self.detected_parameter_types: set[str] | None = None
+        # Wildcard imports (current_module, source_module) found while populating a library
+        self._wildcard_imports: list[tuple[str, str]] = []
+        # Base classes on the current inheritance check path, to avoid infinite recursion
+        self._inheritance_check_visited: set[str] = set()
 
         # Python environment for analysis
         if python_env is None:
@@ -91,6 +113,10 @@ class ExternalClassInspector:
         # Eagerly populate library info cache for all allowed external libraries
         self._populate_all_library_info_cache()
 
+    def library_versions(self) -> dict[str, str]:
+        """Get the installed versions of the allowed external libraries."""
+        return {name: info["version"] for name, info in self.library_info_cache.items()}
+
     def _populate_all_library_info_cache(self) -> None:
         """Pre-populate library info cache for all allowed external libraries.
 
@@ -244,23 +270,24 @@ class ExternalClassInspector:
         imported_names = []
         is_wildcard_import = False
         for child in _treesitter.get_children(import_node):
-            if child.type == "import":
+            child_type = child.type
+            if child_type == "import":
                 seen_import_keyword = True
                 continue
 
             # After the 'import' keyword, these are imported names
             if seen_import_keyword:
-                if child.type == "identifier":
+                if child_type == "identifier":
                     # Single import: from .input import TextInput
                     name = _treesitter.get_value(child)
                     if name and name not in ("from", "import"):
                         imported_names.append(name)
-                elif child.type == "dotted_name":
+                elif child_type == "dotted_name":
                     # Multi-line import names: from .parameterized import (Parameterized, ParameterizedFunction, ...)
                     name = _treesitter.get_value(child)
                     if name:
                         imported_names.append(name)
-                elif child.type == "aliased_import":
+                elif child_type == "aliased_import":
                     # Import with alias: from .input import TextInput as TI
                     # Get the original name (before "as")
                     name_node = child.child_by_field_name("name")
@@ -268,7 +295,7 @@ class ExternalClassInspector:
                         name = _treesitter.get_value(name_node)
                         if name:
                             imported_names.append(name)
-                elif child.type == "wildcard_import":
+                elif child_type == "wildcard_import":
                     # Wildcard import: from .element import *
                     is_wildcard_import = True
 
@@ -282,8 +309,6 @@ class ExternalClassInspector:
             if full_source_module:
                 # Store wildcard import info for later processing
                 # Format: current_module -> source_module
-                if not hasattr(self, "_wildcard_imports"):
-                    self._wildcard_imports = []
                 self._wildcard_imports.append((current_module, full_source_module))
                 logger.debug(
                     f"Wildcard import: {current_module} imports * from {full_source_module}"
@@ -708,15 +733,12 @@ class ExternalClassInspector:
 
                 # Extract imports using optimized query
                 for import_node, _captures in find_imports(tree.root_node):
-                    if import_node.type == "import_statement":
-                        import_handler.handle_import(import_node)
-                    elif import_node.type == "import_from_statement":
-                        import_handler.handle_import_from(import_node)
-                        # Also process re-exports if this is an __init__.py
-                        if is_init_file and module_path:
-                            self._process_import_from_for_reexport(
-                                import_node, module_path, library_name, reexport_map
-                            )
+                    import_handler.handle(import_node)
+                    # Also process re-exports if this is an __init__.py
+                    if module_path and import_node.type == "import_from_statement":
+                        self._process_import_from_for_reexport(
+                            import_node, module_path, library_name, reexport_map
+                        )
 
                 # First pass: collect all class names in this file
                 file_classes: set[str] = set()
@@ -782,6 +804,9 @@ class ExternalClassInspector:
         )
 
         # Round 2+: Propagate iteratively
+        # The class names of the found classes are kept in a set, so a simple base name
+        # is matched in O(1) instead of by scanning every found class path
+        parameterized_names = _class_names_of(parameterized_classes)
         round_num = 2
         changed = True
         while changed:
@@ -790,8 +815,11 @@ class ExternalClassInspector:
                 if class_path not in parameterized_classes:
                     # Check if any base class is already marked as Parameterized
                     for base in bases:
-                        if self._base_matches_parameterized_class(base, parameterized_classes):
+                        if self._base_matches_parameterized_class(
+                            base, parameterized_classes, parameterized_names
+                        ):
                             parameterized_classes.add(class_path)
+                            parameterized_names |= _class_names_of((class_path,))
                             changed = True
                             break
 
@@ -827,6 +855,7 @@ class ExternalClassInspector:
         logger.debug(f"Round 1: Found {len(parameter_types)} direct Parameter subclasses")
 
         # Round 2+: Propagate iteratively through inheritance hierarchy
+        parameter_type_names = _class_names_of(parameter_types)
         round_num = 2
         changed = True
         while changed:
@@ -835,8 +864,11 @@ class ExternalClassInspector:
                 if class_path not in parameter_types:
                     # Check if any base class is already marked as Parameter type
                     for base in bases:
-                        if self._base_matches_parameter_type(base, parameter_types):
+                        if self._base_matches_parameter_type(
+                            base, parameter_types, parameter_type_names
+                        ):
                             parameter_types.add(class_path)
+                            parameter_type_names |= _class_names_of((class_path,))
                             changed = True
                             break
 
@@ -887,7 +919,7 @@ class ExternalClassInspector:
         # Process wildcard imports to build alias map BEFORE topological sort
         # This is needed so we can resolve aliases in the inheritance map for correct ordering
         alias_map = {}  # short_path -> full_path
-        if hasattr(self, "_wildcard_imports"):
+        if self._wildcard_imports:
             logger.debug(f"Building alias map from {len(self._wildcard_imports)} wildcard imports")
             # First pass: build alias map from classes
             for current_module, source_module in self._wildcard_imports:
@@ -926,7 +958,7 @@ class ExternalClassInspector:
         logger.debug(f"Sorted {len(sorted_classes)} classes in topological order")
 
         # Register wildcard aliases in cache AFTER topological sort but BEFORE Phase 2
-        if hasattr(self, "_wildcard_imports"):
+        if self._wildcard_imports:
             logger.debug(f"Registering {len(alias_map)} wildcard aliases in cache")
             for short_path, full_path in alias_map.items():
                 try:
@@ -935,7 +967,7 @@ class ExternalClassInspector:
                 except Exception as e:
                     logger.debug(f"Failed to register alias {short_path}: {e}")
             # Clear for next library
-            del self._wildcard_imports
+            self._wildcard_imports.clear()
 
         # Phase 2: Extract parameters for Parameterized classes
         logger.debug("Phase 2: Extracting parameters")
@@ -1114,7 +1146,7 @@ class ExternalClassInspector:
                     if self._inherits_from_parameterized(class_definition, class_imports):
                         # Convert AST node to ParameterizedInfo
                         # For local files, parameter_types may not be available (None is fine)
-                        parameter_types = getattr(self, "detected_parameter_types", None)
+                        parameter_types = self.detected_parameter_types
                         result = self._convert_ast_to_class_info(
                             class_definition,
                             class_imports,
@@ -1318,13 +1350,14 @@ class ExternalClassInspector:
         return python_files
 
     def _analyze_file_ast(
-        self, tree: Node, source_code: str
+        self, tree: Node, source_code: str, source_lines: list[str] | None = None
     ) -> dict[str, ParameterizedInfo | None]:
         """Analyze a parsed AST to find Parameterized classes.
 
         Args:
             tree: Parsed AST tree
             source_code: Original source code
+            source_lines: The source code split into lines, if already split by the caller
 
         Returns:
             Dictionary mapping class names to ParameterizedInfo
@@ -1332,75 +1365,40 @@ class ExternalClassInspector:
         imports: dict[str, str] = {}
         classes: dict[str, ParameterizedInfo | None] = {}
 
+        # Collect imports and class definitions in one query pass, which walks the
+        # tree in C instead of recursing through every node in Python
+        import_nodes, class_nodes = find_imports_and_classes(tree)
+
         # Parse imports first
         import_handler = ImportHandler(imports)
-        self._walk_ast_for_imports(tree, import_handler)
+        for import_node in import_nodes:
+            import_handler.handle(import_node)
 
         # Cache all class AST nodes for inheritance resolution
-        self._cache_all_class_nodes(tree, imports)
+        self._cache_all_class_nodes(class_nodes, imports)
 
         # Find and analyze classes
-        self._walk_ast_for_classes(tree, imports, classes, source_code.split("\n"))
+        if source_lines is None:
+            source_lines = source_code.split("\n")
+        for class_node in class_nodes:
+            class_info = self._analyze_class_definition(class_node, imports, source_lines)
+            if class_info:
+                classes[class_info.name] = class_info
 
         return classes
 
-    def _cache_all_class_nodes(self, node: Node, imports: dict[str, str]) -> None:
+    def _cache_all_class_nodes(self, class_nodes: list[Node], imports: dict[str, str]) -> None:
         """Cache all class AST nodes for later inheritance resolution.
 
         Args:
-            node: AST node to search
+            class_nodes: Class definition nodes of a file
             imports: Import mappings for this file
         """
-        if hasattr(node, "type") and node.type == "class_definition":
-            class_name = self._get_class_name(node)
+        for class_node in class_nodes:
+            class_name = self._get_class_name(class_node)
             if class_name:
                 # Store the class node and its imports context
-                self.class_ast_cache[class_name] = (node, imports.copy())
-
-        # Recursively cache children
-        for child in _treesitter.get_children(node):
-            self._cache_all_class_nodes(child, imports)
-
-    def _walk_ast_for_imports(self, node: Node, import_handler: ImportHandler) -> None:
-        """Walk AST to find and parse import statements.
-
-        Args:
-            node: Current AST node
-            import_handler: Handler for processing imports
-        """
-        if hasattr(node, "type"):
-            if node.type == "import_statement":
-                import_handler.handle_import(node)
-            elif node.type == "import_from_statement":
-                import_handler.handle_import_from(node)
-
-        # Recursively walk children
-        for child in _treesitter.get_children(node):
-            self._walk_ast_for_imports(child, import_handler)
-
-    def _walk_ast_for_classes(
-        self,
-        node: Node,
-        imports: dict[str, str],
-        classes: dict[str, ParameterizedInfo | None],
-        source_lines: list[str],
-    ) -> None:
-        """Walk AST to find and analyze class definitions.
-
-        Args:
-            node: Current AST node
-            imports: Import mappings
-            classes: Dictionary to store found classes
-            source_lines: Source code lines for parameter extraction
-        """
-        if hasattr(node, "type") and node.type == "class_definition":
-            class_info = self._analyze_class_definition(node, imports, source_lines)
-            if class_info:
-                classes[class_info.name] = class_info
-
-        # Recursively walk children
-        for child in _treesitter.get_children(node):
-            self._walk_ast_for_classes(child, imports, classes, source_lines)
+                self.class_ast_cache[class_name] = (class_node, imports.copy())
 
     def _analyze_class_definition(
         self, class_node: Node, imports: dict[str, str], source_lines: list[str]
@@ -1429,7 +1427,7 @@ class ExternalClassInspector:
 
         # Find parameter assignments in class body
         # For local analysis, parameter_types may not be available
-        parameter_types = getattr(self, "detected_parameter_types", None)
+        parameter_types = self.detected_parameter_types
         parameter_detector = ParameterDetector(imports, parameter_types)
         self._extract_class_parameters(
             class_node, parameter_detector, class_info, source_lines, imports
@@ -1508,9 +1506,6 @@ class ExternalClassInspector:
             True if base class is known to inherit from Parameterized
         """
         # Avoid infinite recursion
-        if not hasattr(self, "_inheritance_check_visited"):
-            self._inheritance_check_visited = set()
-
         if base_class in self._inheritance_check_visited:
             return False
 
@@ -1526,10 +1521,9 @@ class ExternalClassInspector:
                 return result
 
             # If not found in current file, try to resolve through imports
-            if base_class in imports:
-                import_path = imports[base_class]
-                result = self._resolve_imported_class_inheritance(base_class, import_path, imports)
-                return result
+            import_path = imports.get(base_class)
+            if import_path is not None:
+                return self._resolve_imported_class_inheritance(base_class, import_path, imports)
 
             return False
         finally:
@@ -1706,7 +1700,7 @@ class ExternalClassInspector:
                 self.file_source_cache[file_path] = source_lines
 
                 # Analyze the file (this may queue additional files)
-                file_analysis = self._analyze_file_ast(tree.root_node, source_code)
+                file_analysis = self._analyze_file_ast(tree.root_node, source_code, source_lines)
                 self.analyzed_files[file_path] = file_analysis
 
                 logger.debug(
@@ -2081,7 +2075,7 @@ class ExternalClassInspector:
         Returns:
             AST node of the class definition if found, None otherwise
         """
-        if hasattr(node, "type") and node.type == "class_definition":
+        if node.type == "class_definition":
             class_name = self._get_class_name(node)
             if class_name == target_class_name:
                 return node
@@ -2111,12 +2105,7 @@ class ExternalClassInspector:
             return True
 
         # Check imports
-        if base_class_name in imports:
-            full_name = imports[base_class_name]
-            if full_name == "param.Parameterized":
-                return True
-
-        return False
+        return imports.get(base_class_name) == "param.Parameterized"
 
     def _resolve_base_class_name(self, node: Node) -> str | None:
         """Resolve base class name from AST node.
@@ -2180,7 +2169,8 @@ class ExternalClassInspector:
             # In tree-sitter, assignments can be:
             # - "expression_statement" containing an "assignment"
             # - Direct "assignment" nodes
-            if child.type == "expression_statement":
+            child_type = child.type
+            if child_type == "expression_statement":
                 # Check for assignment statements inside expression_statement
                 for stmt_child in _treesitter.get_children(child):
                     if (
@@ -2192,18 +2182,15 @@ class ExternalClassInspector:
                         )
                         if param_info:
                             class_info.add_parameter(param_info)
-            elif child.type == "assignment" and parameter_detector.is_parameter_assignment(child):
+            elif child_type == "assignment" and parameter_detector.is_parameter_assignment(child):
                 # Direct assignment node
                 param_info = self._extract_parameter_info(child, source_lines, imports)
                 if param_info:
                     class_info.add_parameter(param_info)
-            elif hasattr(child, "type") and child.type not in (
-                "function_definition",
-                "async_function_definition",
-                "class_definition",
-            ):
-                # Recursively search in nested structures, but skip function/method definitions
-                # and nested class definitions to avoid treating method-local variables as parameters
+            elif child.child_count and child_type not in _CLASS_BODY_SKIPPED_TYPES:
+                # Recursively search in nested structures, such as if blocks, but skip
+                # method and nested class definitions, including decorated ones, to avoid
+                # treating method-local variables as parameters and walking method bodies
                 self._walk_class_body(child, parameter_detector, class_info, source_lines, imports)
 
     def _extract_parameter_info(
@@ -2223,14 +2210,15 @@ class ExternalClassInspector:
         if not param_name:
             return None
 
-        # Use existing parameter extractor with source content
-        source_content = "\n".join(source_lines)
+        # Use existing parameter extractor with source content, joining the lines
+        # once per source rather than once per parameter
+        if self._joined_source is None or self._joined_source[0] is not source_lines:
+            self._joined_source = (source_lines, source_text_from_lines(source_lines))
+        source = self._joined_source[1]
 
         # Use the imports from the file analysis
 
-        return extract_parameter_info_from_assignment(
-            assignment_node, param_name, imports, source_content
-        )
+        return extract_parameter_info_from_assignment(assignment_node, param_name, imports, source)
 
     def _get_parameter_name(self, assignment_node: Node) -> str | None:
         """Extract parameter name from assignment node.
@@ -2349,7 +2337,10 @@ class ExternalClassInspector:
         return False
 
     def _base_matches_parameterized_class(
-        self, base_name: str, parameterized_classes: set[str]
+        self,
+        base_name: str,
+        parameterized_classes: set[str],
+        class_names: set[str] | None = None,
     ) -> bool:
         """Check if a base class name matches any known Parameterized class.
 
@@ -2360,6 +2351,8 @@ class ExternalClassInspector:
         Args:
             base_name: Base class name to check (may be simple or fully qualified)
             parameterized_classes: Set of full paths to known Parameterized classes
+            class_names: Class names of the dotted paths in parameterized_classes, if
+                already collected by the caller
 
         Returns:
             True if base_name matches a known Parameterized class
@@ -2372,6 +2365,8 @@ class ExternalClassInspector:
         # This handles cases where a class is defined in the same file or imported without qualification
         # Match: 'ListPanel' matches 'panel.layout.base.ListPanel'
         if "." not in base_name:
+            if class_names is not None:
+                return base_name in class_names
             return any(full_path.endswith(f".{base_name}") for full_path in parameterized_classes)
 
         # Handle relative imports (starting with dots)
@@ -2433,7 +2428,9 @@ class ExternalClassInspector:
 
         return False
 
-    def _base_matches_parameter_type(self, base_name: str, parameter_types: set[str]) -> bool:
+    def _base_matches_parameter_type(
+        self, base_name: str, parameter_types: set[str], class_names: set[str] | None = None
+    ) -> bool:
         """Check if a base class name matches any known Parameter type.
 
         Handles matching both simple names (e.g., 'Children') and full paths
@@ -2443,6 +2440,8 @@ class ExternalClassInspector:
         Args:
             base_name: Base class name to check (may be simple or fully qualified)
             parameter_types: Set of full paths to known Parameter types
+            class_names: Class names of the dotted paths in parameter_types, if already
+                collected by the caller
 
         Returns:
             True if base_name matches a known Parameter type
@@ -2455,6 +2454,8 @@ class ExternalClassInspector:
         # This handles cases where a class is defined in the same file or imported without qualification
         # Match: 'Children' matches 'panel.viewable.Children'
         if "." not in base_name:
+            if class_names is not None:
+                return base_name in class_names
             return any(full_path.endswith(f".{base_name}") for full_path in parameter_types)
 
         # Handle relative imports (starting with dots)
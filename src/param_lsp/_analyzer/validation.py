@@ -7,30 +7,32 @@ class parameter defaults and runtime assignments.
 from __future__ import annotations
 
 import logging
+import math
+from functools import cache, lru_cache
 from typing import TYPE_CHECKING, ClassVar
 
+import msgspec
+
 logger = logging.getLogger(__name__)
 
 from param_lsp._treesitter import (
     find_all_parameter_assignments,
-    get_children,
     get_class_name,
     get_value,
     is_function_call,
 )
-from param_lsp._treesitter.queries import (
-    find_attribute_assignments,
-    find_calls,
-    find_classes,
-    find_param_depends_decorators,
+from param_lsp._treesitter.queries import find_classes, find_validation_targets
+from param_lsp.constants import (
+    BOUNDED_PARAMETER_TYPES,
+    CONTAINER_PARAMETER_TYPES,
+    DEPRECATED_PARAMETER_TYPES,
+    PARAM_TYPE_MAP,
 )
-from param_lsp.constants import DEPRECATED_PARAMETER_TYPES, PARAM_TYPE_MAP
 
 from .parameter_extractor import (
     extract_boolean_value,
     extract_numeric_value,
     get_keyword_arguments,
-    is_none_value,
     resolve_parameter_class,
 )
 
@@ -44,6 +46,79 @@ if TYPE_CHECKING:
         ParamClassDict,
         TypeErrorDict,
     )
+    from param_lsp.models import ParameterInfo
+
+    from .parameter_extractor import NumericValue
+
+    # (expected_types, accepted_types) for a parameter type
+    TypeCheck = tuple[tuple[str, ...], frozenset[str]]
+    # (lower, upper, left_inclusive, right_inclusive, description) for a bounds tuple,
+    # see _compile_bounds
+    CompiledBounds = tuple[float, float, bool, bool, str]
+    # (type_check, allow_None, compiled_bounds, cls) for a single parameter
+    CheckEntry = tuple[TypeCheck | None, bool, CompiledBounds | None, str]
+
+
+class _AnalysisState(msgspec.Struct):
+    """Caches that are only valid for a single check_parameter_types pass.
+
+    Starting a new pass replaces the whole object instead of clearing each cache.
+    """
+
+    # Per-class constructor and runtime assignment check tables, built lazily
+    check_tables: dict[str, dict[str, CheckEntry]] = msgspec.field(default_factory=dict)
+    # Memoized class_name -> param_name -> ParameterInfo lookups
+    param_info: dict[str, dict[str, ParameterInfo | None]] = msgspec.field(default_factory=dict)
+    # Memoized numeric literal values keyed by tree-sitter node
+    numeric: dict[Node, NumericValue] = msgspec.field(default_factory=dict)
+    # Resolved parameter classes keyed by call node, unless shared by the owner
+    parameter_classes: dict[Node, dict[str, str] | None] = msgspec.field(default_factory=dict)
+    # Resolved full class paths keyed by attribute node, unless shared by the owner
+    class_paths: dict[Node, str | None] = msgspec.field(default_factory=dict)
+    # Keyword arguments keyed by call node, unless shared by the owner
+    keyword_arguments: dict[Node, dict[str, Node]] = msgspec.field(default_factory=dict)
+    # Per function or module scope node, the index param_name -> unique key of the first
+    # Parameterized class defined in the scope with that parameter
+    scope_param_owners: dict[Node, dict[str, str]] = msgspec.field(default_factory=dict)
+    # Class definitions of the checked tree in document order, from the validation query
+    class_nodes: list[Node] | None = None
+    # Reverse index param_name -> first external class defining it, built lazily
+    external_param_index: dict[str, str] | None = None
+    # Index base class name -> first unique key "ClassName:line" of a local class, built lazily
+    local_class_keys: dict[str, str] | None = None
+
+
+@cache
+def _format_type_names(expected_types: tuple[str, ...]) -> str:
+    """Format qualified type names like ("builtins.int", "builtins.float") as "int or float"."""
+    return " or ".join(t.split(".")[-1] for t in expected_types)
+
+
+# typed so that equal int and float bounds (0 and 0.0) keep their own description
+@lru_cache(maxsize=256, typed=True)
+def _format_bounds(
+    min_val: float | None,
+    max_val: float | None,
+    left_inclusive: bool,
+    right_inclusive: bool,
+) -> str:
+    """Format bounds into a human-readable string with proper bracket notation."""
+    min_str = str(min_val) if min_val is not None else "-∞"
+    max_str = str(max_val) if max_val is not None else "∞"
+    left_bracket = "[" if left_inclusive else "("
+    right_bracket = "]" if right_inclusive else ")"
+    return f"{left_bracket}{min_str}, {max_str}{right_bracket}"
+
+
+def _outside_bounds(value: float, compiled_bounds: CompiledBounds) -> bool:
+    """Check if a number is outside compiled bounds.
+
+    The comparisons are exact, so int bounds beyond float precision or range work.
+    """
+    lower, upper, left_inclusive, right_inclusive, _description = compiled_bounds
+    return (value < lower if left_inclusive else value <= lower) or (
+        value > upper if right_inclusive else value >= upper
+    )
 
 
 class ParameterValidator:
@@ -79,6 +154,14 @@ class ParameterValidator:
         "tuple": "builtins.tuple",
     }
 
+    # Mapping from literal identifier texts to Python qualified type names, keyed by
+    # the raw node text so identifiers are looked up without decoding
+    IDENTIFIER_TYPE_MAP: ClassVar[dict[bytes | None, str]] = {
+        b"True": "builtins.bool",
+        b"False": "builtins.bool",
+        b"None": "builtins.NoneType",
+    }
+
     def __init__(
         self,
         param_classes: ParamClassDict,
@@ -87,6 +170,9 @@ class ParameterValidator:
         is_parameter_assignment_func,
         external_inspector: ExternalClassInspector,
         workspace_root: str | None = None,
+        parameter_class_cache: dict[Node, dict[str, str] | None] | None = None,
+        class_path_cache: dict[Node, str | None] | None = None,
+        keyword_argument_cache: dict[Node, dict[str, Node]] | None = None,
     ):
         self.param_classes = param_classes
         self.external_param_classes = external_param_classes
@@ -95,6 +181,24 @@ class ParameterValidator:
         self.workspace_root = workspace_root
         self.external_inspector = external_inspector
         self.type_errors: list[TypeErrorDict] = []
+        # Accepted inferred types keyed by expected types, see _compatible_types
+        self._accepted_types: dict[tuple[str, ...], frozenset[str]] = {}
+        # Precomputed type checks per parameter type, see _build_type_checks
+        self._type_checks = self._build_type_checks()
+        # Caches scoped to a single analysis pass
+        self._state = _AnalysisState()
+        # Resolved parameter classes by call node, shared with and cleared by the analyzer
+        # of the same tree. Without one, they are kept per pass in _state.
+        self._parameter_class_cache = parameter_class_cache
+        # Resolved full class paths by attribute node, shared with and cleared by the
+        # analyzer, whose import resolver resolves the same called functions. Without
+        # one, they are kept per pass in _state.
+        self._class_path_cache = class_path_cache
+        # Keyword arguments by call node, shared with and cleared by the analyzer, which
+        # extracts the same parameter calls. Without one, they are kept per pass in _state.
+        self._keyword_argument_cache = keyword_argument_cache
+        # Compiled bounds keyed by the raw bounds tuple and its value types, see _compile_bounds
+        self._compiled_bounds: dict[tuple[tuple, tuple[type, ...]], CompiledBounds | None] = {}
 
     def check_parameter_types(self, tree: Node, lines: list[str]) -> list[TypeErrorDict]:
         """Perform comprehensive parameter type validation on a parsed AST.
@@ -115,26 +219,32 @@ class ParameterValidator:
         and parameter-specific constraints.
         """
         self.type_errors.clear()
+        self._state = _AnalysisState()
 
         # Use optimized tree-sitter queries instead of walking entire tree
         # This is significantly faster, especially for large files
 
+        # Collect all nodes to check in a single query pass over the tree
+        class_nodes, assignments, call_nodes, decorator_nodes = find_validation_targets(tree)
+        self._state.class_nodes = class_nodes
+
         # Check class parameter defaults
-        for class_node, _captures in find_classes(tree):
+        for class_node in class_nodes:
             self._check_class_parameter_defaults(class_node, lines)
 
         # Check runtime parameter assignments like obj.param = value
-        # Use optimized find_attribute_assignments query instead of finding all assignments
-        for assignment_node, _captures in find_attribute_assignments(tree):
-            self._check_runtime_parameter_assignment(assignment_node, lines)
+        for assignment_node, obj_node, attr_node, assigned_value in assignments:
+            self._check_runtime_parameter_assignment(
+                assignment_node, obj_node, attr_node, assigned_value, lines
+            )
 
         # Check constructor calls like MyClass(x="A")
-        for call_node, _captures in find_calls(tree):
+        for call_node in call_nodes:
             if is_function_call(call_node):
                 self._check_constructor_parameter_types(call_node, lines)
 
         # Check @param.depends decorators for invalid parameter references
-        self._check_param_depends_decorators(tree)
+        self._check_param_depends_decorators(decorator_nodes)
 
         return self.type_errors.copy()
 
@@ -158,7 +268,20 @@ class ParameterValidator:
 
     def _has_class_with_base_name(self, base_name: str) -> bool:
         """Check if any class with the given base name exists (ignoring line numbers)."""
-        return any(key.startswith(f"{base_name}:") for key in self.param_classes)
+        return base_name in self._get_local_class_keys()
+
+    def _get_local_class_keys(self) -> dict[str, str]:
+        """Get the index mapping base class names to their first unique key.
+
+        Every call in a file is checked as a possible constructor, so resolving a
+        class name must not scan all local classes each time.
+        """
+        if self._state.local_class_keys is None:
+            index: dict[str, str] = {}
+            for unique_key in self.param_classes:
+                index.setdefault(unique_key.rpartition(":")[0], unique_key)
+            self._state.local_class_keys = index
+        return self._state.local_class_keys
 
     def _check_constructor_parameter_types(self, node: Node, lines: list[str]) -> None:
         """Check for type errors in constructor parameter calls like MyClass(x="A") (tree-sitter version)."""
@@ -178,62 +301,133 @@ class ParameterValidator:
             return
 
         # Get keyword arguments from the tree-sitter node
-        kwargs = get_keyword_arguments(node)
+        kwargs = get_keyword_arguments(
+            node,
+            self._keyword_argument_cache
+            if self._keyword_argument_cache is not None
+            else self._state.keyword_arguments,
+        )
+        check_table = self._get_check_table(class_name)
 
         # Check each keyword argument passed to the constructor
         for param_name, param_value in kwargs.items():
+            entry = check_table.get(param_name)
+            if entry is None:
+                continue  # Skip if parameter not found (could be inherited or not a param)
+            type_check, allow_None, bounds, cls = entry
+
             # Get the keyword argument node (e.g., x="1") instead of just the value node (e.g., "1")
             # The param_value is the value node, its parent should be the keyword_argument node
+            parent = param_value.parent
             keyword_arg_node = (
-                param_value.parent
-                if hasattr(param_value, "parent")
-                and param_value.parent
-                and param_value.parent.type == "keyword_argument"
-                else param_value
+                parent if parent is not None and parent.type == "keyword_argument" else param_value
             )
 
-            # Get the expected parameter type
-            cls = self._get_parameter_type_from_class(class_name, param_name)
-            if not cls:
-                continue  # Skip if parameter not found (could be inherited or not a param)
-
             # Check if None is allowed for this parameter
             inferred_type = self._infer_value_type(param_value)
-            if inferred_type == "builtins.NoneType":  # None value
-                allow_None = self._get_parameter_allow_None(class_name, param_name)
-                if allow_None:
-                    continue  # None is allowed, skip further validation
-                # If allow_None is False or not specified, continue with normal type checking
+            if inferred_type == "builtins.NoneType" and allow_None:
+                continue  # None is allowed, skip further validation
 
             # Check if assigned value matches expected type
-            if cls in PARAM_TYPE_MAP:
-                expected_types = PARAM_TYPE_MAP[cls]
-                if not isinstance(expected_types, tuple):
-                    expected_types = (expected_types,)
-
-                if inferred_type and not any(
-                    self._is_type_compatible(inferred_type, exp_type)
-                    for exp_type in expected_types
-                ):
-                    # Extract simple type name from qualified string for error message
-                    inferred_type_name = inferred_type.split(".")[-1]
-                    # Extract base class name for error message (remove line number if present)
-                    display_class_name = (
-                        class_name.split(":")[0] if ":" in class_name else class_name
-                    )
-                    message = f"Cannot assign {inferred_type_name} to parameter '{param_name}' of type {cls} in {display_class_name}() constructor (expects {self._format_expected_types(expected_types)})"
-                    self._create_type_error(keyword_arg_node, message, "constructor-type-mismatch")
+            if type_check and inferred_type and inferred_type not in type_check[1]:
+                expected_types = type_check[0]
+                # Extract simple type name from qualified string for error message
+                inferred_type_name = inferred_type.split(".")[-1]
+                # Extract base class name for error message (remove line number if present)
+                display_class_name = class_name.split(":")[0] if ":" in class_name else class_name
+                message = f"Cannot assign {inferred_type_name} to parameter '{param_name}' of type {cls} in {display_class_name}() constructor (expects {self._format_expected_types(expected_types)})"
+                self._create_type_error(keyword_arg_node, message, "constructor-type-mismatch")
 
             # Check bounds for numeric parameters in constructor calls
-            self._check_constructor_bounds(
-                keyword_arg_node, class_name, param_name, cls, param_value
-            )
+            if bounds:
+                self._check_constructor_bounds(
+                    keyword_arg_node, class_name, param_name, param_value, bounds
+                )
 
             # Check container constraints (List item_type, Tuple length)
             self._check_constructor_container_constraints(
                 keyword_arg_node, class_name, param_name, cls, param_value
             )
 
+    def _build_type_checks(self) -> dict[str, TypeCheck]:
+        """Precompute the type check for every parameter type in PARAM_TYPE_MAP.
+
+        Values are only ever inferred as one of the types in NODE_TYPE_MAP, so the
+        compatible inferred types for each parameter type can be resolved up front
+        and a check becomes a single set membership test.
+        """
+        type_checks = {}
+        for cls, expected_types in PARAM_TYPE_MAP.items():
+            type_checks[cls] = (expected_types, self._compatible_types(expected_types))
+        return type_checks
+
+    def _compatible_types(self, expected_types: tuple[str, ...]) -> frozenset[str]:
+        """Resolve which inferable value types are compatible with any expected type.
+
+        Memoized per expected types, as List item_type checks resolve the accepted
+        types of their item type for every checked constructor call.
+        """
+        accepted = self._accepted_types.get(expected_types)
+        if accepted is None:
+            accepted = self._accepted_types[expected_types] = frozenset(
+                inferred_type
+                for inferred_type in set(self.NODE_TYPE_MAP.values())
+                if any(
+                    self._is_type_compatible(inferred_type, exp_type)
+                    for exp_type in expected_types
+                )
+            )
+        return accepted
+
+    def _get_check_table(self, class_name: str) -> dict[str, CheckEntry]:
+        """Get the check table for a class, building it on first use.
+
+        The table folds the type, allow_None and bounds lookups for every parameter
+        of the class into a single dict, so each constructor keyword argument or
+        runtime assignment costs one lookup. Bounds of bounded parameter types are
+        stored compiled, ready for the two comparisons of a bounds check.
+
+        Args:
+            class_name: Either a unique key like "TestClass:2", a base name like
+                "TestClass", or a full external path like "panel.widgets.IntSlider"
+        """
+        table = self._state.check_tables.get(class_name)
+        if table is not None:
+            return table
+
+        # Candidate classes in the same precedence order as the per-parameter lookups
+        if ":" in class_name and class_name in self.param_classes:
+            candidates = [self.param_classes[class_name]]
+        else:
+            candidates = [
+                class_info
+                for key, class_info in self.param_classes.items()
+                if key.startswith(f"{class_name}:")
+            ]
+        external_info = self.external_param_classes.get(class_name)
+        if external_info:
+            candidates.append(external_info)
+
+        table = {}
+        for class_info in candidates:
+            for param_name, param_info in class_info.parameters.items():
+                if param_name in table:
+                    continue
+                cls = param_info.cls
+                # Bounds are only checked for bounded types, so only those are compiled
+                bounds = param_info.bounds
+                table[param_name] = (
+                    self._type_checks.get(cls),
+                    param_info.allow_None,
+                    self._compile_bounds(bounds)
+                    if bounds and cls in BOUNDED_PARAMETER_TYPES
+                    else None,
+                    cls,
+                )
+
+        self._state.check_tables[class_name] = table
+        return table
+
     def _infer_value_type(self, node: Node) -> str | None:
         """Infer Python type from tree-sitter node as a qualified string.
 
@@ -243,60 +437,63 @@ class ParameterValidator:
             return None
 
         # Check simple type mappings first
-        if node.type in self.NODE_TYPE_MAP:
-            return self.NODE_TYPE_MAP[node.type]
+        node_type = node.type
+        inferred_type = self.NODE_TYPE_MAP.get(node_type)
+        if inferred_type is not None:
+            return inferred_type
 
         # Handle identifier case (True, False, None as identifiers)
-        if node.type == "identifier":
-            value = get_value(node)
-            if value in {"True", "False"}:
-                return "builtins.bool"
-            if value == "None":
-                return "builtins.NoneType"
+        if node_type == "identifier":
+            return self.IDENTIFIER_TYPE_MAP.get(node.text)
 
         return None
 
+    def _numeric_value(self, node: Node) -> NumericValue:
+        """Extract the numeric value of a node, memoized per analysis.
+
+        Tree-sitter nodes compare and hash by the underlying syntax node, so fresh
+        wrappers for the same node share one cache entry.
+        """
+        numeric_cache = self._state.numeric
+        if node in numeric_cache:
+            return numeric_cache[node]
+
+        value = extract_numeric_value(node)
+        numeric_cache[node] = value
+        return value
+
     def _is_boolean_literal(self, node: Node) -> bool:
         """Check if a tree-sitter node represents a boolean literal (True/False)."""
-        return node.type in ("true", "false") or (
-            node.type == "identifier" and get_value(node) in ("True", "False")
-        )
+        # Only true/false nodes and identifiers can be boolean literals, so any other
+        # node type is rejected without reading or decoding its text
+        node_type = node.type
+        if node_type in ("true", "false"):
+            return True
+        return node_type == "identifier" and node.text in (b"True", b"False")
 
-    def _format_expected_types(self, expected_types: tuple | str) -> str:
+    def _format_expected_types(self, expected_types: tuple[str, ...]) -> str:
         """Format expected types for error messages.
 
         Args:
-            expected_types: Either a tuple of qualified type strings or a single string
+            expected_types: A tuple of qualified type strings
 
         Returns:
             Formatted string like "str" or "int or float"
         """
-        if isinstance(expected_types, str):
-            # Single type string like "builtins.str"
-            return expected_types.split(".")[-1]
-
-        if len(expected_types) == 1:
-            return expected_types[0].split(".")[-1]
-        else:
-            type_names = [t.split(".")[-1] for t in expected_types]
-            return " or ".join(type_names)
+        return _format_type_names(expected_types)
 
     def _create_type_error(
         self, node: Node | None, message: str, code: str, severity: str = "error"
     ) -> None:
         """Helper function to create and append a type error (tree-sitter version)."""
         # Get position information from tree-sitter node
+        # Each point access builds a new tuple, so read start/end once and unpack
         if node is not None:
-            line = node.start_point[0]  # tree-sitter is 0-indexed
-            col = node.start_point[1]
-            end_line = node.end_point[0]
-            end_col = node.end_point[1]
+            line, col = node.start_point  # tree-sitter is 0-indexed
+            end_line, end_col = node.end_point
         else:
             # Fallback if position info is not available
-            line = 0
-            col = 0
-            end_line = 0
-            end_col = 0
+            line = col = end_line = end_col = 0
 
         self.type_errors.append(
             {
@@ -313,85 +510,92 @@ class ParameterValidator:
     def _parse_bounds_format(
         self, bounds: tuple
     ) -> tuple[float | None, float | None, bool, bool] | None:
-        """Parse bounds tuple into (min_val, max_val, left_inclusive, right_inclusive)."""
-        if len(bounds) == 2:
-            min_val, max_val = bounds
-            left_inclusive, right_inclusive = True, True  # Default to inclusive
-            return min_val, max_val, left_inclusive, right_inclusive
-        elif len(bounds) == 4:
-            min_val, max_val, left_inclusive, right_inclusive = bounds
-            return min_val, max_val, left_inclusive, right_inclusive
-        else:
-            return None
+        """Parse bounds tuple into (min_val, max_val, left_inclusive, right_inclusive).
+
+        Four element bounds are already in this form and are returned as they are, and
+        two element bounds default to inclusive. Results are memoized per bounds tuple
+        through _compile_bounds, which keys on the value types as well.
+        """
+        size = len(bounds)
+        if size == 4:
+            return bounds
+        if size == 2:
+            return bounds[0], bounds[1], True, True
+        return None
 
-    def _format_bounds_description(
+    def _effective_bounds(
         self,
         min_val: float | None,
         max_val: float | None,
         left_inclusive: bool,
         right_inclusive: bool,
-    ) -> str:
-        """Format bounds into a human-readable string with proper bracket notation."""
-        min_str = str(min_val) if min_val is not None else "-∞"
-        max_str = str(max_val) if max_val is not None else "∞"
-        left_bracket = "[" if left_inclusive else "("
-        right_bracket = "]" if right_inclusive else ")"
-        return f"{left_bracket}{min_str}, {max_str}{right_bracket}"
+    ) -> tuple[float, float]:
+        """Convert bounds into (lower, upper) limits, with missing bounds as infinities.
+
+        Bounds are kept as given, as moving exclusive int bounds to the next float
+        loses precision beyond 2**53 and overflows for ints beyond the float range.
+        """
+        lower = -math.inf if min_val is None else min_val
+        upper = math.inf if max_val is None else max_val
+        return lower, upper
+
+    def _compile_bounds(self, bounds: tuple) -> CompiledBounds | None:
+        """Compile a bounds tuple into limits, inclusivity and description, memoized.
+
+        The result is computed once per distinct bounds tuple, so a check only needs
+        two comparisons, see _outside_bounds, and the description for the message.
+        """
+        # Key on the value types too, as 0 == 0.0 but their descriptions differ
+        key = (bounds, tuple(map(type, bounds)))
+        if key in self._compiled_bounds:
+            return self._compiled_bounds[key]
+
+        compiled = None
+        parsed_bounds = self._parse_bounds_format(bounds)
+        if parsed_bounds:
+            lower, upper = self._effective_bounds(*parsed_bounds)
+            compiled = (lower, upper, *parsed_bounds[2:], _format_bounds(*parsed_bounds))
+
+        self._compiled_bounds[key] = compiled
+        return compiled
 
     def _check_constructor_bounds(
         self,
         node: Node,
         class_name: str,
         param_name: str,
-        cls: str,
         param_value: Node,
+        compiled_bounds: CompiledBounds,
     ) -> None:
-        """Check if constructor parameter value is within parameter bounds."""
-        # Only check bounds for numeric types
-        if cls not in ["Number", "Integer"]:
-            return
-
-        # Get bounds for this parameter
-        bounds = self._get_parameter_bounds(class_name, param_name)
-        if not bounds:
-            return
+        """Check if constructor parameter value is within the compiled parameter bounds.
 
-        # Extract numeric value from parameter value
-        assigned_numeric = extract_numeric_value(param_value)
-        if assigned_numeric is None:
-            return
-
-        # Parse bounds format
-        parsed_bounds = self._parse_bounds_format(bounds)
-        if not parsed_bounds:
-            return
-        min_val, max_val, left_inclusive, right_inclusive = parsed_bounds
-
-        # Check if value is within bounds based on inclusivity
-        violates_lower = False
-        violates_upper = False
-
-        if min_val is not None:
-            if left_inclusive:
-                violates_lower = assigned_numeric < min_val
-            else:
-                violates_lower = assigned_numeric <= min_val
-
-        if max_val is not None:
-            if right_inclusive:
-                violates_upper = assigned_numeric > max_val
-            else:
-                violates_upper = assigned_numeric >= max_val
-
-        if violates_lower or violates_upper:
-            bound_description = self._format_bounds_description(
-                min_val, max_val, left_inclusive, right_inclusive
-            )
+        Only called for parameter types in BOUNDED_PARAMETER_TYPES.
+        """
+        violation = self._bounds_violation(param_value, compiled_bounds)
+        if violation:
+            assigned_numeric, bound_description = violation
             # Extract base class name for error message (remove line number if present)
             display_class_name = class_name.split(":")[0] if ":" in class_name else class_name
             message = f"Value {assigned_numeric} for parameter '{param_name}' in {display_class_name}() constructor is outside bounds {bound_description}"
             self._create_type_error(node, message, "constructor-bounds-violation")
 
+    def _bounds_violation(
+        self, value_node: Node, compiled_bounds: CompiledBounds
+    ) -> tuple[float, str] | None:
+        """Check a value node against compiled bounds, shared by constructor and runtime checks.
+
+        Returns:
+            The numeric value and the bounds description if the value is outside the
+            bounds, otherwise None (also for values that are not numeric literals)
+        """
+        assigned_numeric = self._numeric_value(value_node)
+        if assigned_numeric is None:
+            return None
+
+        if _outside_bounds(assigned_numeric, compiled_bounds):
+            return assigned_numeric, compiled_bounds[4]
+        return None
+
     def _check_constructor_container_constraints(
         self,
         node: Node,
@@ -424,15 +628,18 @@ class ParameterValidator:
         if not list_items:
             return
 
-        # Check each item against the expected type
+        # Check each item against the expected type with one membership test per item
+        accepted_types = self._compatible_types((item_type,))
+        infer_value_type = self._infer_value_type
+        create_type_error = self._create_type_error
         for i, item in enumerate(list_items):
-            item_type_inferred = self._infer_value_type(item)
-            if item_type_inferred and not self._is_type_compatible(item_type_inferred, item_type):
+            item_type_inferred = infer_value_type(item)
+            if item_type_inferred and item_type_inferred not in accepted_types:
                 # Extract simple type names from qualified strings
                 inferred_type_name = item_type_inferred.split(".")[-1]
                 expected_type_name = item_type.split(".")[-1]
                 message = f"Item {i} in List parameter '{param_name}' has type {inferred_type_name}, expected {expected_type_name}"
-                self._create_type_error(item, message, "list-item-type-mismatch")
+                create_type_error(item, message, "list-item-type-mismatch")
 
     def _check_tuple_length_constructor(
         self,
@@ -460,141 +667,119 @@ class ParameterValidator:
     def _check_parameter_default_type(self, node: Node, param_name: str, lines: list[str]) -> None:
         """Check if parameter default value matches declared type (tree-sitter version)."""
         # Find the parameter call on the right side of the assignment
-        param_call = None
-        if node.type == "assignment":
-            right_node = node.child_by_field_name("right")
-            if right_node and right_node.type == "call":
-                param_call = right_node
-        else:
-            # Fallback: scan children for call node
-            for child in get_children(node):
-                if child.type == "call":
-                    param_call = child
-                    break
-
+        param_call = self._find_parameter_call(node)
         if not param_call:
             return
 
         # Resolve the actual parameter class type
-        param_class_info = resolve_parameter_class(param_call, self.imports)
+        param_class_info = resolve_parameter_class(
+            param_call,
+            self.imports,
+            self._parameter_class_cache
+            if self._parameter_class_cache is not None
+            else self._state.parameter_classes,
+        )
         if not param_class_info:
             return
 
         cls = param_class_info["type"]
 
-        # Get default value and allow_None from keyword arguments
-        kwargs = get_keyword_arguments(param_call)
-        default_value = kwargs.get("default")
-        allow_None_node = kwargs.get("allow_None")
-        allow_None = (
-            extract_boolean_value(allow_None_node)
-            if "allow_None" in kwargs and allow_None_node is not None
-            else None
+        # Get the default value from the keyword arguments
+        kwargs = get_keyword_arguments(
+            param_call,
+            self._keyword_argument_cache
+            if self._keyword_argument_cache is not None
+            else self._state.keyword_arguments,
         )
+        default_value = kwargs.get("default")
 
-        # Param automatically sets allow_None=True when default=None
-        if default_value is not None and is_none_value(default_value):
-            allow_None = True
-
-        if cls and default_value and cls in PARAM_TYPE_MAP:
-            expected_types = PARAM_TYPE_MAP[cls]
-            if not isinstance(expected_types, tuple):
-                expected_types = (expected_types,)
+        # Infer the default type once; literal defaults resolve with a single lookup
+        inferred_type = self._infer_value_type(default_value) if default_value else None
 
-            inferred_type = self._infer_value_type(default_value)
+        type_check = self._type_checks.get(cls)
+        if type_check and inferred_type is not None:
+            # Param automatically sets allow_None=True when default=None, so a None
+            # default never needs further validation
+            if inferred_type == "builtins.NoneType":
+                return
 
-            # Check if None is allowed for this parameter
-            if allow_None and inferred_type == "builtins.NoneType":
-                return  # None is allowed, skip further validation
+            expected_types, accepted_types = type_check
 
-            # Special handling for Boolean parameters - they should only accept actual bool values
-            if cls == "Boolean" and inferred_type and inferred_type != "builtins.bool":
-                # For Boolean parameters, only accept actual boolean values
-                if not (
-                    default_value.type == "name" and get_value(default_value) in ("True", "False")
-                ):
-                    inferred_type_name = inferred_type.split(".")[-1]
+            if inferred_type not in accepted_types:
+                inferred_type_name = inferred_type.split(".")[-1]
+                # Boolean parameters only accept actual bool values and get a dedicated code
+                if cls == "Boolean":
                     message = f"Parameter '{param_name}' of type Boolean expects bool but got {inferred_type_name}"
                     self._create_type_error(node, message, "boolean-type-mismatch")
-            elif inferred_type and not any(
-                self._is_type_compatible(inferred_type, exp_type) for exp_type in expected_types
-            ):
-                inferred_type_name = inferred_type.split(".")[-1]
-                message = f"Parameter '{param_name}' of type {cls} expects {self._format_expected_types(expected_types)} but got {inferred_type_name}"
-                self._create_type_error(node, message, "type-mismatch")
+                else:
+                    message = f"Parameter '{param_name}' of type {cls} expects {self._format_expected_types(expected_types)} but got {inferred_type_name}"
+                    self._create_type_error(node, message, "type-mismatch")
 
         # Check for deprecated parameter types
         self._check_deprecated_parameter_type(node, cls)
 
         # Check for additional parameter constraints
-        self._check_parameter_constraints(node, param_name, lines)
+        self._check_parameter_constraints(node, param_name, cls, kwargs)
 
-    def _check_runtime_parameter_assignment(self, node: Node, lines: list[str]) -> None:
-        """Check runtime parameter assignments like obj.param = value."""
-        # Extract target and assigned value from attribute assignment
-        # Since we use find_attribute_assignments, we know node is an attribute assignment
-        left_node = node.child_by_field_name("left")
-        right_node = node.child_by_field_name("right")
-
-        if not left_node or not right_node or left_node.type != "attribute":
-            return
+    def _find_parameter_call(self, node: Node) -> Node | None:
+        """Find the parameter call on the right side of an assignment node."""
+        if node.type == "assignment":
+            right_node = node.child_by_field_name("right")
+            if right_node and right_node.type == "call":
+                return right_node
+            return None
 
-        target = left_node
-        assigned_value = right_node
+        # Fallback: scan children for call node
+        for child in node.children:
+            if child.type == "call":
+                return child
+        return None
 
-        # Extract parameter name from the attribute access
-        # In tree-sitter, attribute has 'attribute' field
-        param_name = None
-        if target.type == "attribute":
-            attr_node = target.child_by_field_name("attribute")
-            if attr_node:
-                param_name = get_value(attr_node)
+    def _check_runtime_parameter_assignment(
+        self,
+        node: Node,
+        obj_node: Node,
+        attr_node: Node,
+        assigned_value: Node,
+        lines: list[str],
+    ) -> None:
+        """Check runtime parameter assignments like obj.param = value.
 
+        Args:
+            node: The attribute assignment node
+            obj_node: The object the attribute is assigned on, e.g. ``obj``
+            attr_node: The attribute name identifier, e.g. ``param``
+            assigned_value: The assigned value node
+            lines: Source code lines
+        """
+        # The nodes come from the query captures of find_validation_targets, which only
+        # matches assignments whose target is an attribute
+        param_name = get_value(attr_node)
         if not param_name:
             return
 
-        # Determine the instance class
-        instance_class = None
-
-        # Check if this is a direct instantiation (has call before the dot)
-        # In tree-sitter, attribute nodes have 'object' and 'attribute' fields
-        # For S().value, object is the call node S()
-        has_call = False
-        call_node = None
+        # Determine the instance class from the object the attribute is accessed on
 
-        if target.type == "attribute":
-            obj_node = target.child_by_field_name("object")
-            if obj_node and obj_node.type == "call":
-                has_call = True
-                call_node = obj_node
-        if has_call:
+        instance_class = None
+        obj_type = obj_node.type
+        if obj_type == "call":
             # Case: MyClass().param = value (direct instantiation)
-            if call_node:
-                # Extract class name from the call node
-                instance_class = self._get_instance_class(call_node)
-        else:
+            # For S().value, object is the call node S()
+            instance_class = self._get_instance_class(obj_node)
+        elif obj_type == "identifier":
             # Case: instance_var.param = value
             # Only try to resolve the class if this is a simple identifier (e.g., widget.name)
             # not a nested attribute (e.g., df.index.name), to avoid false positives
-            obj_node = target.child_by_field_name("object")
-            if obj_node and obj_node.type == "identifier":
-                # Simple case: variable.param = value
-                # First, try to find the class in the same scope (for local Parameterized classes)
-                class_in_scope = self._find_class_in_scope(node, param_name)
-                if class_in_scope:
-                    instance_class = class_in_scope
-                else:
-                    # Fallback: check external param classes only for simple identifiers
-                    # This allows checking external libraries (e.g., panel.widgets.IntSlider)
-                    # while avoiding false positives from nested attributes (e.g., df.index.name)
-                    for class_name, class_info in self.external_param_classes.items():
-                        if class_info and param_name in class_info.parameters:
-                            instance_class = class_name
-                            break
-            # Note: We intentionally do NOT check nested attributes (e.g., obj.attr.param)
-            # against external param classes, as this causes false positives for non-Param
-            # objects (e.g., pandas DataFrames, Jupyter config) that happen to have attributes
-            # with the same names as Param parameters (e.g., 'name', 'port', 'value')
+            # First, try to find the class in the same scope (for local Parameterized classes)
+            class_in_scope = self._find_class_in_scope(node, param_name)
+            # Fallback: check external param classes only for simple identifiers
+            # This allows checking external libraries (e.g., panel.widgets.IntSlider)
+            # while avoiding false positives from nested attributes (e.g., df.index.name)
+            instance_class = class_in_scope or self._get_external_param_index().get(param_name)
+        # Note: We intentionally do NOT check nested attributes (e.g., obj.attr.param)
+        # against external param classes, as this causes false positives for non-Param
+        # objects (e.g., pandas DataFrames, Jupyter config) that happen to have attributes
+        # with the same names as Param parameters (e.g., 'name', 'port', 'value')
 
         if not instance_class:
             return
@@ -611,114 +796,101 @@ class ParameterValidator:
         if not is_valid_param_class:
             return
 
-        # Get the parameter type from the class definition
-        cls = self._get_parameter_type_from_class(instance_class, param_name)
+        # Get the type, allow_None and bounds of the parameter with a single lookup
+        entry = self._get_check_table(instance_class).get(param_name)
+        if entry is None:
+            return
+        type_check, allow_None, bounds, cls = entry
         if not cls:
             return
 
         # Check if assigned value matches expected type
-        if cls in PARAM_TYPE_MAP:
-            expected_types = PARAM_TYPE_MAP[cls]
-            if not isinstance(expected_types, tuple):
-                expected_types = (expected_types,)
-
+        if type_check:
+            expected_types, accepted_types = type_check
             inferred_type = self._infer_value_type(assigned_value)
 
             # Check if None is allowed for this parameter
-            if inferred_type == "builtins.NoneType":  # None value
-                allow_None = self._get_parameter_allow_None(instance_class, param_name)
-                if allow_None:
-                    return  # None is allowed, skip further validation
-
-            if inferred_type and not any(
-                self._is_type_compatible(inferred_type, exp_type) for exp_type in expected_types
-            ):
+            if inferred_type == "builtins.NoneType" and allow_None:
+                return  # None is allowed, skip further validation
+
+            if inferred_type and inferred_type not in accepted_types:
                 inferred_type_name = inferred_type.split(".")[-1]
                 message = f"Cannot assign {inferred_type_name} to parameter '{param_name}' of type {cls} (expects {self._format_expected_types(expected_types)})"
                 self._create_type_error(node, message, "runtime-type-mismatch")
 
         # Check bounds for numeric parameters
-        self._check_runtime_bounds(node, instance_class, param_name, cls, assigned_value)
+        if bounds:
+            self._check_runtime_bounds(node, param_name, assigned_value, bounds)
+
+    def _get_external_param_index(self) -> dict[str, str]:
+        """Get the reverse index mapping parameter names to external classes.
+
+        Each parameter name maps to the first external class (in discovery order)
+        that defines it, replacing a linear scan over all external classes for every
+        runtime assignment.
+        """
+        if self._state.external_param_index is None:
+            index: dict[str, str] = {}
+            for class_name, class_info in self.external_param_classes.items():
+                if not class_info:
+                    continue
+                for param_name in class_info.parameters:
+                    index.setdefault(param_name, class_name)
+            self._state.external_param_index = index
+        return self._state.external_param_index
 
     def _check_runtime_bounds(
         self,
         node: Node,
-        instance_class: str,
         param_name: str,
-        cls: str,
         assigned_value: Node,
+        compiled_bounds: CompiledBounds,
     ) -> None:
-        """Check if assigned value is within parameter bounds."""
-        # Only check bounds for numeric types
-        if cls not in ["Number", "Integer"]:
-            return
+        """Check if assigned value is within the compiled bounds of the parameter.
 
-        # Get bounds for this parameter
-        bounds = self._get_parameter_bounds(instance_class, param_name)
-        if not bounds:
-            return
-
-        # Extract numeric value from assigned value
-        assigned_numeric = extract_numeric_value(assigned_value)
-        if assigned_numeric is None:
-            return
-
-        # Parse bounds format
-        parsed_bounds = self._parse_bounds_format(bounds)
-        if not parsed_bounds:
-            return
-        min_val, max_val, left_inclusive, right_inclusive = parsed_bounds
-
-        # Check if value is within bounds based on inclusivity
-        violates_lower = False
-        violates_upper = False
-
-        if min_val is not None:
-            if left_inclusive:
-                violates_lower = assigned_numeric < min_val
-            else:
-                violates_lower = assigned_numeric <= min_val
-
-        if max_val is not None:
-            if right_inclusive:
-                violates_upper = assigned_numeric > max_val
-            else:
-                violates_upper = assigned_numeric >= max_val
-
-        if violates_lower or violates_upper:
-            bound_description = self._format_bounds_description(
-                min_val, max_val, left_inclusive, right_inclusive
-            )
+        Only called for parameter types in BOUNDED_PARAMETER_TYPES.
+        """
+        violation = self._bounds_violation(assigned_value, compiled_bounds)
+        if violation:
+            assigned_numeric, bound_description = violation
             message = f"Value {assigned_numeric} for parameter '{param_name}' is outside bounds {bound_description}"
             self._create_type_error(node, message, "bounds-violation")
 
-    def _get_parameter_bounds(self, class_name: str, param_name: str) -> tuple | None:
-        """Get parameter bounds from a class definition.
+    def _lookup_param_info(self, class_name: str, param_name: str) -> ParameterInfo | None:
+        """Look up a parameter of a local or external class, memoized per analysis.
 
         Args:
-            class_name: Either a base name like "TestClass" or a unique key like "TestClass:2"
+            class_name: Either a base name like "TestClass", a unique key like "TestClass:2",
+                or a full external path like "panel.widgets.IntSlider"
             param_name: The parameter name to look up
         """
+        # Nested by class name, so a lookup does not build and hash a tuple key
+        class_cache = self._state.param_info.get(class_name)
+        if class_cache is None:
+            class_cache = self._state.param_info[class_name] = {}
+        elif param_name in class_cache:
+            return class_cache[param_name]
+
+        param_info = None
         # Check if class_name is already a unique key (contains ":")
         if ":" in class_name and class_name in self.param_classes:
             param_info = self.param_classes[class_name].get_parameter(param_name)
-            if param_info:
-                return param_info.bounds
         else:
             # Try to find by base name (searches all unique keys)
-            for key in self.param_classes:
-                if key.startswith(f"{class_name}:"):
-                    param_info = self.param_classes[key].get_parameter(param_name)
+            for unique_key, class_info in self.param_classes.items():
+                if unique_key.startswith(f"{class_name}:"):
+                    param_info = class_info.get_parameter(param_name)
                     if param_info:
-                        return param_info.bounds
+                        break
 
         # Check external classes
-        class_info = self.external_param_classes.get(class_name)
-        if class_info:
-            param_info = class_info.get_parameter(param_name)
-            return param_info.bounds if param_info else None
+        if param_info is None:
+            class_info = self.external_param_classes.get(class_name)
+            if class_info:
+                param_info = class_info.get_parameter(param_name)
 
-        return None
+        class_cache[param_name] = param_info
+        return param_info
 
     def _get_instance_class(self, call_node) -> str | None:
         """Get the class name from an instance creation call.
@@ -729,33 +901,31 @@ class ParameterValidator:
         """
         # For tree-sitter call nodes like TestClass(...) or pn.widgets.IntSlider(...)
         if call_node.type == "call":
-            # Get the function/class being called (first child, before argument_list)
-            children = get_children(call_node)
-            if not children:
+            # Get the function/class being called without building the list of children
+            function_node = call_node.child_by_field_name("function")
+            if function_node is None:
                 return None
-
-            function_node = children[0]
+            function_type = function_node.type
 
             # Simple case: TestClass(...)
-            if function_node.type == "identifier":
+            if function_type == "identifier":
                 class_name = get_value(function_node)
-                # Try to find this class in param_classes with unique key
-                for key in self.param_classes:
-                    if key.startswith(f"{class_name}:"):
-                        return key
-                # If not found locally, return the base name (might be external)
-                return class_name
+                if class_name is None:
+                    return None
+                # Try to find this class in param_classes with unique key, and if not
+                # found locally, return the base name (might be external)
+                return self._get_local_class_keys().get(class_name, class_name)
 
             # Attribute case: module.Class(...) or pn.widgets.IntSlider(...) or Outer.Inner(...)
-            elif function_node.type == "attribute":
+            elif function_type == "attribute":
                 # Get the final class name from the attribute
                 attr_node = function_node.child_by_field_name("attribute")
                 if attr_node:
                     class_name = get_value(attr_node)
                     # Try to find this class in param_classes with unique key (e.g., Outer.Inner)
-                    for key in self.param_classes:
-                        if key.startswith(f"{class_name}:"):
-                            return key
+                    unique_key = class_name and self._get_local_class_keys().get(class_name)
+                    if unique_key:
+                        return unique_key
 
                 # Try to resolve the full path for external classes
                 full_class_path = self._resolve_full_class_path_from_attribute(function_node)
@@ -776,65 +946,50 @@ class ParameterValidator:
         For an attribute node representing pn.widgets.IntSlider:
         - object field: pn.widgets (could be nested attribute)
         - attribute field: IntSlider
+
+        Memoized per node, sharing the paths the analyzer already resolved for the same
+        called functions when it passed its class path cache.
         """
-        parts = []
+        class_paths = (
+            self._class_path_cache
+            if self._class_path_cache is not None
+            else self._state.class_paths
+        )
+        try:
+            return class_paths[attribute_node]
+        except KeyError:
+            full_class_path = class_paths[attribute_node] = self._build_full_class_path(
+                attribute_node
+            )
+            return full_class_path
 
-        # Recursively collect all parts from nested attributes
-        def collect_parts(node: Node) -> None:
-            if node.type == "identifier":
-                parts.append(get_value(node))
-            elif node.type == "attribute":
-                # First get the object part (left side)
-                obj_node = node.child_by_field_name("object")
-                if obj_node:
-                    collect_parts(obj_node)
-                # Then get the attribute part (right side)
-                attr_node = node.child_by_field_name("attribute")
+    def _build_full_class_path(self, attribute_node: Node) -> str | None:
+        """Build the full class path of an attribute node without memoization."""
+        # Walk down the object chain, collecting names from right to left
+        parts = []
+        parts_append = parts.append
+        current: Node | None = attribute_node
+        while current is not None:
+            current_type = current.type
+            if current_type == "attribute":
+                attr_node = current.child_by_field_name("attribute")
                 if attr_node:
-                    parts.append(get_value(attr_node))
-
-        collect_parts(attribute_node)
-
-        if parts:
-            # Resolve the root module through imports
-            root_alias = parts[0]
-            if root_alias in self.imports:
-                full_module_name = self.imports[root_alias]
-                # Replace the alias with the full module name
-                parts[0] = full_module_name
-                return ".".join(parts)
+                    parts_append(get_value(attr_node))
+                current = current.child_by_field_name("object")
             else:
-                # Use the alias directly if no import mapping found
-                return ".".join(parts)
-
-        return None
-
-    def _resolve_full_class_path(self, base) -> str | None:
-        """Resolve the full class path from a tree-sitter power/atom_expr node like pn.widgets.IntSlider."""
-        parts = []
-        for child in get_children(base):
-            if child.type == "name":
-                parts.append(get_value(child))
-            elif child.type == "trailer":
-                parts.extend(
-                    [
-                        get_value(trailer_child)
-                        for trailer_child in get_children(child)
-                        if trailer_child.type == "name"
-                    ]
-                )
+                if current_type == "identifier":
+                    parts_append(get_value(current))
+                break
+        parts.reverse()
 
         if parts:
-            # Resolve the root module through imports
-            root_alias = parts[0]
-            if root_alias in self.imports:
-                full_module_name = self.imports[root_alias]
-                # Replace the alias with the full module name
+            # Resolve the root module through imports with a single lookup, replacing
+            # the alias with the full module name, or use the alias directly if no
+            # import mapping is found
+            full_module_name = self.imports.get(parts[0])
+            if full_module_name is not None:
                 parts[0] = full_module_name
-                return ".".join(parts)
-            else:
-                # Use the alias directly if no import mapping found
-                return ".".join(parts)
+            return ".".join(parts)
 
         return None
 
@@ -845,86 +1000,24 @@ class ParameterValidator:
             class_name: Either a base name like "TestClass" or a unique key like "TestClass:2"
             param_name: The parameter name to look up
         """
-        # Check if class_name is already a unique key (contains ":")
-        if ":" in class_name and class_name in self.param_classes:
-            param_info = self.param_classes[class_name].get_parameter(param_name)
-            if param_info:
-                return param_info.cls
-        else:
-            # Try to find by base name (searches all unique keys)
-            for key in self.param_classes:
-                if key.startswith(f"{class_name}:"):
-                    param_info = self.param_classes[key].get_parameter(param_name)
-                    if param_info:
-                        return param_info.cls
-
-        # Check external classes
-        class_info = self.external_param_classes.get(class_name)
-        if class_info:
-            param_info = class_info.get_parameter(param_name)
-            return param_info.cls if param_info else None
+        param_info = self._lookup_param_info(class_name, param_name)
+        return param_info.cls if param_info else None
 
-        return None
-
-    def _get_parameter_allow_None(self, class_name: str, param_name: str) -> bool:
-        """Get the allow_None setting for a parameter from a class definition.
+    def _check_parameter_constraints(
+        self, node: Node, param_name: str, resolved_cls: str, kwargs: dict[str, Node]
+    ) -> None:
+        """Check for parameter-specific constraints.
 
         Args:
-            class_name: Either a base name like "TestClass" or a unique key like "TestClass:2"
-            param_name: The parameter name to look up
+            node: The parameter assignment node
+            param_name: Name of the parameter being checked
+            resolved_cls: Resolved parameter type (e.g. "Number")
+            kwargs: Keyword arguments of the parameter call
         """
-        # Check if class_name is already a unique key (contains ":")
-        if ":" in class_name and class_name in self.param_classes:
-            param_info = self.param_classes[class_name].get_parameter(param_name)
-            if param_info:
-                return param_info.allow_None
-        else:
-            # Try to find by base name (searches all unique keys)
-            for key in self.param_classes:
-                if key.startswith(f"{class_name}:"):
-                    param_info = self.param_classes[key].get_parameter(param_name)
-                    if param_info:
-                        return param_info.allow_None
-
-        # Check external classes
-        class_info = self.external_param_classes.get(class_name)
-        if class_info:
-            param_info = class_info.get_parameter(param_name)
-            return param_info.allow_None if param_info else False
-
-        return False
-
-    def _check_parameter_constraints(self, node: Node, param_name: str, lines: list[str]) -> None:
-        """Check for parameter-specific constraints."""
-        # Find the parameter call on the right side of the assignment
-        param_call = None
-        # For tree-sitter, check if this is an assignment node
-        if node.type == "assignment":
-            right_node = node.child_by_field_name("right")
-            if right_node and right_node.type == "call":
-                param_call = right_node
-        else:
-            # Fallback: scan children for call node
-            for child in get_children(node):
-                if child.type == "call":
-                    param_call = child
-                    break
-
-        if not param_call:
-            return
-
-        # Resolve the actual parameter class type for constraint checking
-        param_class_info = resolve_parameter_class(param_call, self.imports)
-        if not param_class_info:
-            return
-
-        resolved_cls = param_class_info["type"]
-
-        # Get keyword arguments
-        kwargs = get_keyword_arguments(param_call)
+        create_type_error = self._create_type_error
 
         # Check bounds for Number/Integer parameters
-        if resolved_cls in ["Number", "Integer"]:
+        if resolved_cls in BOUNDED_PARAMETER_TYPES:
             bounds_node = kwargs.get("bounds")
             inclusive_bounds_node = kwargs.get("inclusive_bounds")
             default_value = kwargs.get("default")
@@ -934,12 +1027,9 @@ class ParameterValidator:
             # Parse inclusive_bounds if present
             if inclusive_bounds_node and inclusive_bounds_node.type == "tuple":
                 # Parse (True, False) pattern
-                # In tree-sitter, tuple children are directly the elements
-                elements = [
-                    c
-                    for c in get_children(inclusive_bounds_node)
-                    if c.type in ("identifier", "true", "false")
-                ]
+                elements = self._extract_tuple_elements(
+                    inclusive_bounds_node, ("identifier", "true", "false")
+                )
                 if len(elements) >= 2:
                     left_inclusive = extract_boolean_value(elements[0])
                     right_inclusive = extract_boolean_value(elements[1])
@@ -949,20 +1039,17 @@ class ParameterValidator:
             # Parse bounds if present
             if bounds_node and bounds_node.type == "tuple":
                 # Parse (min, max) pattern
-                # In tree-sitter, tuple children are directly the numeric elements
-                elements = [
-                    c
-                    for c in get_children(bounds_node)
-                    if c.type in ("integer", "float", "unary_operator", "identifier")
-                ]
+                elements = self._extract_tuple_elements(
+                    bounds_node, ("integer", "float", "unary_operator", "identifier")
+                )
                 if len(elements) >= 2:
                     try:
-                        min_val = extract_numeric_value(elements[0])
-                        max_val = extract_numeric_value(elements[1])
+                        min_val = self._numeric_value(elements[0])
+                        max_val = self._numeric_value(elements[1])
 
                         if min_val is not None and max_val is not None and min_val >= max_val:
                             message = f"Parameter '{param_name}' has invalid bounds: min ({min_val}) >= max ({max_val})"
-                            self._create_type_error(node, message, "invalid-bounds")
+                            create_type_error(node, message, "invalid-bounds")
 
                         # Check if default value violates bounds
                         if (
@@ -970,51 +1057,49 @@ class ParameterValidator:
                             and min_val is not None
                             and max_val is not None
                         ):
-                            default_numeric = extract_numeric_value(default_value)
-                            if default_numeric is not None:
-                                left_inclusive, right_inclusive = inclusive_bounds
-
-                                # Check bounds violation
-                                violates_lower = (
-                                    (default_numeric < min_val)
-                                    if left_inclusive
-                                    else (default_numeric <= min_val)
-                                )
-                                violates_upper = (
-                                    (default_numeric > max_val)
-                                    if right_inclusive
-                                    else (default_numeric >= max_val)
-                                )
-
-                                if violates_lower or violates_upper:
-                                    bound_description = self._format_bounds_description(
-                                        min_val, max_val, left_inclusive, right_inclusive
-                                    )
-                                    message = f"Default value {default_numeric} for parameter '{param_name}' is outside bounds {bound_description}"
-                                    self._create_type_error(
-                                        node, message, "default-bounds-violation"
-                                    )
+                            default_numeric = self._numeric_value(default_value)
+                            compiled_bounds = self._compile_bounds(
+                                (min_val, max_val, *inclusive_bounds)
+                            )
+                            if (
+                                default_numeric is not None
+                                and compiled_bounds
+                                and _outside_bounds(default_numeric, compiled_bounds)
+                            ):
+                                message = f"Default value {default_numeric} for parameter '{param_name}' is outside bounds {compiled_bounds[4]}"
+                                create_type_error(node, message, "default-bounds-violation")
 
                     except (ValueError, TypeError):
                         pass
 
         # Check for empty lists/tuples with List/Tuple parameters
-        elif resolved_cls in ["List", "Tuple"]:
+        elif resolved_cls in CONTAINER_PARAMETER_TYPES:
             default_value = kwargs.get("default")
             if default_value and default_value.type in ("list", "tuple"):
-                # Check if it's an empty list or tuple
-                # In tree-sitter, empty containers have only parentheses/brackets as children
-                child_values = [
-                    get_value(child)
-                    for child in get_children(default_value)
-                    if get_value(child) not in (",",)  # Ignore commas
-                ]
-                is_empty_list = child_values == ["[", "]"]
-                is_empty_tuple = child_values == ["(", ")"]
-
-                if (is_empty_list or is_empty_tuple) and "bounds" in kwargs:
+                # Check if it's an empty list or tuple. In tree-sitter, brackets,
+                # parentheses and commas are anonymous, so an empty container has no
+                # named children and its children need not be read
+                is_empty = default_value.named_child_count == 0
+
+                if is_empty and "bounds" in kwargs:
                     message = f"Parameter '{param_name}' has empty default but bounds specified"
-                    self._create_type_error(node, message, "empty-default-with-bounds", "warning")
+                    create_type_error(node, message, "empty-default-with-bounds", "warning")
+
+    def _extract_tuple_elements(
+        self, tuple_node: Node, allowed_types: tuple[str, ...], limit: int = 2
+    ) -> list[Node]:
+        """Collect up to ``limit`` elements of the allowed types from a tuple node.
+
+        In tree-sitter, tuple children are directly the elements plus punctuation,
+        so a single pass over the children is enough.
+        """
+        elements = []
+        for child in tuple_node.children:
+            if child.type in allowed_types:
+                elements.append(child)
+                if len(elements) == limit:
+                    break
+        return elements
 
     def _check_deprecated_parameter_type(self, node: Node, param_type: str) -> None:
         """Check if a parameter type is deprecated and emit a warning."""
@@ -1039,26 +1124,8 @@ class ParameterValidator:
         Returns:
             Qualified type name string (e.g., "builtins.str") or None
         """
-        # Check if class_name is already a unique key (contains ":")
-        if ":" in class_name and class_name in self.param_classes:
-            param_info = self.param_classes[class_name].get_parameter(param_name)
-            if param_info:
-                return param_info.item_type
-        else:
-            # Try to find by base name (searches all unique keys)
-            for key in self.param_classes:
-                if key.startswith(f"{class_name}:"):
-                    param_info = self.param_classes[key].get_parameter(param_name)
-                    if param_info:
-                        return param_info.item_type
-
-        # Check external classes
-        class_info = self.external_param_classes.get(class_name)
-        if class_info:
-            param_info = class_info.get_parameter(param_name)
-            return param_info.item_type if param_info else None
-
-        return None
+        param_info = self._lookup_param_info(class_name, param_name)
+        return param_info.item_type if param_info else None
 
     def _get_parameter_length(self, class_name: str, param_name: str) -> int | None:
         """Get the length constraint for a Tuple parameter.
@@ -1067,46 +1134,29 @@ class ParameterValidator:
             class_name: Either a base name like "TestClass" or a unique key like "TestClass:2"
             param_name: The parameter name to look up
         """
-        # Check if class_name is already a unique key (contains ":")
-        if ":" in class_name and class_name in self.param_classes:
-            param_info = self.param_classes[class_name].get_parameter(param_name)
-            if param_info:
-                return param_info.length
-        else:
-            # Try to find by base name (searches all unique keys)
-            for key in self.param_classes:
-                if key.startswith(f"{class_name}:"):
-                    param_info = self.param_classes[key].get_parameter(param_name)
-                    if param_info:
-                        return param_info.length
-
-        # Check external classes
-        class_info = self.external_param_classes.get(class_name)
-        if class_info:
-            param_info = class_info.get_parameter(param_name)
-            return param_info.length if param_info else None
-
-        return None
+        param_info = self._lookup_param_info(class_name, param_name)
+        return param_info.length if param_info else None
 
     def _extract_list_items(self, node: Node) -> list[Node] | None:
         """Extract items from a list literal like [1, 2, 3]."""
-        if not hasattr(node, "type") or node.type != "list":
+        if node is None or node.type != "list":
             return None
 
-        # In tree-sitter, list children are directly the items plus brackets and commas
-        # Filter out punctuation to get just the items
-        items = [child for child in get_children(node) if child.type not in ("[", "]", ",")]
+        # In tree-sitter, list children are directly the items plus brackets and commas.
+        # The punctuation nodes are anonymous, so the named children are just the items
+        # and no child type has to be read and compared
+        items = node.named_children
 
         return items if items else None
 
     def _extract_tuple_items(self, node: Node) -> list[Node] | None:
         """Extract items from a tuple literal like (1, 2, 3)."""
-        if not hasattr(node, "type") or node.type != "tuple":
+        if node is None or node.type != "tuple":
             return None
 
-        # In tree-sitter, tuple children are directly the items plus parentheses and commas
-        # Filter out punctuation to get just the items
-        items = [child for child in get_children(node) if child.type not in ("(", ")", ",")]
+        # In tree-sitter, tuple children are directly the items plus parentheses and commas.
+        # The punctuation nodes are anonymous, so the named children are just the items
+        items = node.named_children
 
         return items if items else None
 
@@ -1138,25 +1188,51 @@ class ParameterValidator:
         if not scope_node:
             return None
 
-        # Find all class definitions in this scope
-        from param_lsp._treesitter.queries import find_classes
+        # Check if a Parameterized class in this scope has the parameter
+        return self._get_scope_param_owners(scope_node).get(param_name)
 
-        for class_node, _ in find_classes(scope_node):
+    def _get_scope_param_owners(self, scope_node: Node) -> dict[str, str]:
+        """Get the index of parameter names to the classes of a scope that define them.
+
+        Every runtime assignment in a scope searches the same classes, so the index is
+        only built once per scope and pass, and each assignment then costs a single
+        lookup. Each parameter name maps to the first class in document order that
+        defines it. The classes of the scope are taken from the class definitions already
+        collected for the pass by their byte range, so the scope's subtree is not queried
+        again.
+        """
+        scope_param_owners = self._state.scope_param_owners
+        try:
+            return scope_param_owners[scope_node]
+        except KeyError:
+            pass
+
+        class_nodes = self._state.class_nodes
+        if class_nodes is None:
+            scope_classes = [class_node for class_node, _ in find_classes(scope_node)]
+        else:
+            start_byte, end_byte = scope_node.start_byte, scope_node.end_byte
+            scope_classes = [
+                class_node
+                for class_node in class_nodes
+                if start_byte <= class_node.start_byte < end_byte
+            ]
+
+        owners: dict[str, str] = {}
+        for class_node in scope_classes:
             class_name = get_class_name(class_node)
             if not class_name:
                 continue
 
             # Create unique key with line number
-            line_number = class_node.start_point[0]
-            unique_key = f"{class_name}:{line_number}"
-
-            # Check if this class has the parameter
-            if unique_key in self.param_classes:
-                class_info = self.param_classes[unique_key]
-                if param_name in class_info.parameters:
-                    return unique_key
+            unique_key = f"{class_name}:{class_node.start_point[0]}"
+            class_info = self.param_classes.get(unique_key)
+            if class_info is not None:
+                for name in class_info.parameters:
+                    owners.setdefault(name, unique_key)
 
-        return None
+        scope_param_owners[scope_node] = owners
+        return owners
 
     def _is_type_compatible(self, inferred_type: str, expected_type: str) -> bool:
         """Check if inferred type is compatible with expected type.
@@ -1181,7 +1257,7 @@ class ParameterValidator:
         # Handle numeric compatibility: int is compatible with float
         return expected_type == "builtins.float" and inferred_type == "builtins.int"
 
-    def _check_param_depends_decorators(self, tree: Node) -> None:
+    def _check_param_depends_decorators(self, decorator_nodes: list[Node]) -> None:
         """Check @param.depends decorators for invalid parameter references.
 
         This method validates that all parameter names referenced in @param.depends
@@ -1194,12 +1270,11 @@ class ParameterValidator:
         - Parameter metadata: "param:metadata_name"
 
         Args:
-            tree: The root tree-sitter AST node to validate
+            decorator_nodes: The param.depends decorator nodes of the tree to validate,
+                as found by find_validation_targets
         """
-        # Find all param.depends decorators in the tree
-        decorators = find_param_depends_decorators(tree)
-
-        for decorator_node, _captures in decorators:
+        create_type_error = self._create_type_error
+        for decorator_node in decorator_nodes:
             # Find the containing class for this decorator
             class_info = self._find_containing_class_for_decorator(decorator_node)
             if not class_info:
@@ -1224,9 +1299,7 @@ class ParameterValidator:
                     depend_string, valid_params, valid_methods, class_name
                 ):
                     message = f"Parameter '{depend_string}' does not exist in class '{class_name}'"
-                    self._create_type_error(
-                        param_node, message, "invalid-depends-parameter", "error"
-                    )
+                    create_type_error(param_node, message, "invalid-depends-parameter", "error")
 
     def _find_containing_class_for_decorator(
         self, decorator_node: Node
@@ -1326,26 +1399,29 @@ class ParameterValidator:
         methods = set()
 
         # Find all function definitions within the class body
-        for child in get_children(class_node):
-            if child.type == "block":  # The class body
-                for item in get_children(child):
-                    func_node = None
-                    if item.type == "function_definition":
-                        func_node = item
-                    elif item.type == "decorated_definition":
-                        # For decorated functions, find the function_definition child
-                        for subitem in get_children(item):
-                            if subitem.type == "function_definition":
-                                func_node = subitem
-                                break
-
-                    if func_node:
-                        # Get the function name
-                        name_node = func_node.child_by_field_name("name")
-                        if name_node:
-                            method_name = get_value(name_node)
-                            if method_name:
-                                methods.add(method_name)
+        body_node = class_node.child_by_field_name("body")
+        if body_node is None:
+            return methods
+
+        for item in body_node.children:
+            # Read each node type once; decorated functions are reached through
+            # their definition field instead of scanning the decorated node
+            func_node = item
+            node_type = func_node.type
+            if node_type == "decorated_definition":
+                func_node = item.child_by_field_name("definition")
+                if func_node is None:
+                    continue
+                node_type = func_node.type
+            if node_type != "function_definition":
+                continue
+
+            # Get the function name
+            name_node = func_node.child_by_field_name("name")
+            if name_node:
+                method_name = get_value(name_node)
+                if method_name:
+                    methods.add(method_name)
 
         return methods
 
@@ -1405,7 +1481,7 @@ class ParameterValidator:
 
         # Find the call node within the decorator
         call_node = None
-        for child in get_children(decorator_node):
+        for child in decorator_node.children:
             if child.type == "call":
                 call_node = child
                 break
@@ -1419,7 +1495,7 @@ class ParameterValidator:
             return params
 
         # Extract string arguments
-        for arg in get_children(args_node):
+        for arg in args_node.children:
             if arg.type == "string":
                 # Extract the parameter name from the string (remove quotes)
                 param_text = get_value(arg)
@@ -64,14 +64,10 @@ class LSPServerBase(LanguageServer):
 
     def _get_python_type_name(self, cls: str, allow_None: bool = False) -> str:
         """Map param type to Python type name for display using existing param_type_map."""
-        if cls in PARAM_TYPE_MAP:
-            python_types = PARAM_TYPE_MAP[cls]
-            if isinstance(python_types, tuple):
-                # Multiple types like ("builtins.int", "builtins.float") -> "int or float"
-                type_names = [t.split(".")[-1] for t in python_types]
-            else:
-                # Single type like "builtins.int" -> "int"
-                type_names = [python_types.split(".")[-1]]
+        python_types = PARAM_TYPE_MAP.get(cls)
+        if python_types is not None:
+            # Types like ("builtins.int", "builtins.float") -> "int | float"
+            type_names = [t.split(".")[-1] for t in python_types]
 
             # Add None if allow_None is True
             if allow_None:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 import textwrap
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from lsprotocol.types import (
@@ -39,24 +40,42 @@ if TYPE_CHECKING:
     from param_lsp.models import ParameterInfo
 
 # Compiled regex patterns for performance
+# The \b before a dotted name stops the lazy prefix from retrying the name at every
+# character of a word, which made failed searches quadratic in the word length
 _re_param_depends = re.compile(r"^([^#]*?)@param\.depends\s*\(", re.MULTILINE)
-_re_constructor_call = re.compile(r"^([^#]*?)(\w+(?:\.\w+)*)\s*\([^)]*$", re.MULTILINE)
-_re_constructor_call_inside = re.compile(r"^([^#]*?)(\w+(?:\.\w+)*)\s*\([^)]*\w*$", re.MULTILINE)
+_re_constructor_call = re.compile(r"^([^#]*?)\b(\w+(?:\.\w+)*)\s*\([^)]*$", re.MULTILINE)
 _re_constructor_param_assignment = re.compile(r"\b(\w+)\s*=")
 _re_quoted_string = re.compile(r'["\']([^"\']+)["\']')
 _re_param_attr_access = re.compile(
-    r"^([^#]*?)(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.?.*$", re.MULTILINE
+    r"^([^#]*?)\b(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.?.*$", re.MULTILINE
 )
 _re_param_object_attr_access = re.compile(
-    r"^([^#]*?)(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.(\w+)\..*$", re.MULTILINE
+    r"^([^#]*?)\b(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.(\w+)\..*$", re.MULTILINE
 )
 _re_reactive_expression = re.compile(
-    r"^([^#]*?)(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.(\w+)\.rx\..*$", re.MULTILINE
+    r"^([^#]*?)\b(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.(\w+)\.rx\..*$", re.MULTILINE
 )
 _re_param_update = re.compile(
-    r"^([^#]*?)(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.update\s*\([^)]*$", re.MULTILINE
+    r"^([^#]*?)\b(\w+(?:\.\w+)*)\s*(?:\([^)]*\))?\s*\.param\.update\s*\([^)]*$", re.MULTILINE
 )
 _re_param_dot = re.compile(r"\.param\.(\w*)$")
+_re_param_definition = re.compile(r"param\.([A-Z]\w*)\s*\([^)]*$")
+_re_partial_assignment = re.compile(r"\b(\w+)\s*=\s*$")
+_re_trailing_word = re.compile(r"\b\w+$")
+
+
+@lru_cache(maxsize=256)
+def _re_parameter_assignment(param_name: str) -> re.Pattern[str]:
+    """Compile the pattern for an exact assignment to ``param_name`` like 'width='."""
+    return re.compile(rf"^([^#]*?){re.escape(param_name)}\s*=\s*$", re.MULTILINE)
+
+
+def _partial_attribute(before_cursor: str, prefix: str) -> str:
+    """Get the word being typed after ``prefix``, or an empty string if it does not precede it."""
+    match = _re_trailing_word.search(before_cursor)
+    if match and before_cursor.endswith(prefix, 0, match.start()):
+        return match.group()
+    return ""
 
 
 class CompletionMixin(LSPServerBase):
@@ -67,8 +86,7 @@ class CompletionMixin(LSPServerBase):
         before_cursor = line[:character]
 
         # Check for patterns like param.ParameterType(
-        param_def_pattern = re.compile(r"param\.([A-Z]\w*)\s*\([^)]*$")
-        match = param_def_pattern.search(before_cursor)
+        match = _re_param_definition.search(before_cursor)
 
         if match:
             cls = match.group(1)
@@ -122,11 +140,7 @@ class CompletionMixin(LSPServerBase):
 
         # Find which param class constructor is being called
         before_cursor = line[:character]
-
-        # Check both patterns for constructor detection
         match = _re_constructor_call.search(before_cursor)
-        if not match:
-            match = _re_constructor_call_inside.search(before_cursor)
 
         if match:
             class_name = match.group(2)
@@ -139,21 +153,7 @@ class CompletionMixin(LSPServerBase):
             analyzer = self.document_cache[uri]["analyzer"]
 
             # Resolve the full class path using import aliases
-            full_class_path = None
-            if "." in class_name:
-                # Handle dotted names like hv.Curve
-                parts = class_name.split(".")
-                if len(parts) >= 2:
-                    alias = parts[0]
-                    class_part = ".".join(parts[1:])
-                    if alias in analyzer.imports:
-                        full_module = analyzer.imports[alias]
-                        full_class_path = f"{full_module}.{class_part}"
-                    else:
-                        full_class_path = class_name
-            else:
-                # Simple class name - check if it's in external classes directly
-                full_class_path = class_name
+            full_class_path = self._resolve_external_class_path(class_name, analyzer)
 
             # Check if this resolved class is in external_param_classes
             class_info = analyzer._analyze_external_class_ast(full_class_path)
@@ -185,8 +185,6 @@ class CompletionMixin(LSPServerBase):
 
             # Check if this line has a constructor call
             match = _re_constructor_call.search(line)
-            if not match:
-                match = _re_constructor_call_inside.search(line)
 
             if match:
                 class_name = match.group(2)
@@ -259,11 +257,6 @@ class CompletionMixin(LSPServerBase):
 
         # Pattern: find word followed by opening parenthesis
         match = _re_constructor_call.search(before_cursor)
-
-        # Also check if we're inside parentheses after a class name
-        if not match:
-            match = _re_constructor_call_inside.search(before_cursor)
-
         return match.group(2) if match else None
 
     def _get_completions_by_context(
@@ -290,10 +283,7 @@ class CompletionMixin(LSPServerBase):
     def _find_exact_parameter_match(self, before_cursor: str, parameters: list[str]) -> str | None:
         """Check if user has typed an exact parameter assignment like 'width='."""
         for param_name in parameters:
-            param_assignment_match = re.search(
-                rf"^([^#]*?){re.escape(param_name)}\s*=\s*$", before_cursor, re.MULTILINE
-            )
-            if param_assignment_match:
+            if _re_parameter_assignment(param_name).search(before_cursor):
                 return param_name
         return None
 
@@ -301,7 +291,7 @@ class CompletionMixin(LSPServerBase):
         self, before_cursor: str, parameters: list[str]
     ) -> tuple[str | None, dict | None]:
         """Check if user has typed a partial parameter assignment like 'w='."""
-        partial_assignment_match = re.search(r"\b(\w+)\s*=\s*$", before_cursor)
+        partial_assignment_match = _re_partial_assignment.search(before_cursor)
         if not partial_assignment_match:
             return None, None
 
@@ -406,15 +396,11 @@ class CompletionMixin(LSPServerBase):
         used_params = set(_re_constructor_param_assignment.findall(before_cursor))
 
         completions = []
-        for param_name in class_info.get_parameter_names():
+        for param_name, param_info in class_info.parameters.items():
             # Skip parameters that are already used or should be filtered
             if param_name in used_params or param_name == "name":
                 continue
 
-            param_info = class_info.parameters.get(param_name)
-            if not param_info:
-                continue
-
             # Build documentation and completion item
             documentation = self._build_parameter_documentation(param_info, class_name)
 
@@ -493,8 +479,6 @@ class CompletionMixin(LSPServerBase):
 
             # Check if this line has a constructor call for our class
             match = _re_constructor_call.search(line)
-            if not match:
-                match = _re_constructor_call_inside.search(line)
 
             if match and match.group(2) == class_name:
                 constructor_line_idx = line_idx
@@ -523,7 +507,7 @@ class CompletionMixin(LSPServerBase):
         """Generate completion items for unused parameters."""
         completions = []
 
-        for param_name in class_info.get_parameter_names():
+        for param_name, param_info in class_info.parameters.items():
             # Skip parameters that are already used
             if param_name in used_params:
                 continue
@@ -531,10 +515,6 @@ class CompletionMixin(LSPServerBase):
             if param_name == "name":
                 continue
 
-            param_info = class_info.parameters.get(param_name)
-            if not param_info:
-                continue
-
             # Build documentation and completion item
             documentation = self._build_parameter_documentation(param_info, class_name)
 
@@ -563,22 +543,12 @@ class CompletionMixin(LSPServerBase):
 
         return completions
 
-    def _resolve_external_class_path(self, class_name: str, analyzer) -> str | None:
+    def _resolve_external_class_path(self, class_name: str, analyzer) -> str:
         """Resolve external class path using import aliases."""
-        if "." in class_name:
-            # Handle dotted names like hv.Curve
-            parts = class_name.split(".")
-            if len(parts) >= 2:
-                alias = parts[0]
-                class_part = ".".join(parts[1:])
-                if alias in analyzer.imports:
-                    full_module = analyzer.imports[alias]
-                    return f"{full_module}.{class_part}"
-                else:
-                    return class_name
-        else:
-            # Simple class name
-            return class_name
+        # Handle dotted names like hv.Curve; simple class names are returned as is
+        alias, _, class_part = class_name.partition(".")
+        full_module = analyzer.imports.get(alias) if class_part else None
+        return f"{full_module}.{class_part}" if full_module else class_name
 
     def _get_param_depends_completions(
         self, uri: str, lines: list[str], position: Position
@@ -719,14 +689,8 @@ class CompletionMixin(LSPServerBase):
         line = lines[position.line]
         text_before_cursor = line[: position.character]
 
-        # Find all quote positions
-        double_quotes = [m.start() for m in re.finditer(r'"', text_before_cursor)]
-        single_quotes = [m.start() for m in re.finditer(r"'", text_before_cursor)]
-
         # Check for unclosed quote (odd number means unclosed)
-        has_unclosed_double = bool(double_quotes) and len(double_quotes) % 2 == 1
-        has_unclosed_single = bool(single_quotes) and len(single_quotes) % 2 == 1
-        return has_unclosed_double or has_unclosed_single
+        return text_before_cursor.count('"') % 2 == 1 or text_before_cursor.count("'") % 2 == 1
 
     def _extract_partial_parameter_text(self, lines: list[str], position: Position) -> str:
         """Extract the partial parameter text being typed."""
@@ -736,19 +700,13 @@ class CompletionMixin(LSPServerBase):
         line = lines[position.line]
         text_before_cursor = line[: position.character]
 
-        # Find all quote positions
-        double_quotes = [m.start() for m in re.finditer(r'"', text_before_cursor)]
-        single_quotes = [m.start() for m in re.finditer(r"'", text_before_cursor)]
-
         # Check for unclosed double quote
-        if double_quotes and len(double_quotes) % 2 == 1:
-            last_quote_pos = double_quotes[-1]
-            return text_before_cursor[last_quote_pos + 1 :]
+        if text_before_cursor.count('"') % 2 == 1:
+            return text_before_cursor[text_before_cursor.rfind('"') + 1 :]
 
         # Check for unclosed single quote
-        if single_quotes and len(single_quotes) % 2 == 1:
-            last_quote_pos = single_quotes[-1]
-            return text_before_cursor[last_quote_pos + 1 :]
+        if text_before_cursor.count("'") % 2 == 1:
+            return text_before_cursor[text_before_cursor.rfind("'") + 1 :]
 
         return ""
 
@@ -852,22 +810,7 @@ class CompletionMixin(LSPServerBase):
             # Check if it's an external param class or if resolved_class_name is external
             # Use resolved_class_name if available, otherwise fall back to class_name
             check_class_name = resolved_class_name if resolved_class_name else class_name
-            full_class_path = None
-
-            if "." in check_class_name:
-                # Handle dotted names like hv.Curve
-                parts = check_class_name.split(".")
-                if len(parts) >= 2:
-                    alias = parts[0]
-                    class_part = ".".join(parts[1:])
-                    if alias in analyzer.imports:
-                        full_module = analyzer.imports[alias]
-                        full_class_path = f"{full_module}.{class_part}"
-                    else:
-                        full_class_path = check_class_name
-            else:
-                # Simple class name - check if it's in external classes directly
-                full_class_path = check_class_name
+            full_class_path = self._resolve_external_class_path(check_class_name, analyzer)
 
             # Check if this resolved class is in external_param_classes
             class_info = analyzer._analyze_external_class_ast(full_class_path)
@@ -914,15 +857,11 @@ class CompletionMixin(LSPServerBase):
             )
 
         # Create completion items for each parameter
-        for param_name in class_info.get_parameter_names():
+        for param_name, param_info in class_info.parameters.items():
             # Filter based on partial text being typed
             if partial_text and not param_name.startswith(partial_text):
                 continue
 
-            param_info = class_info.parameters.get(param_name)
-            if not param_info:
-                continue
-
             # Build documentation for the parameter
             documentation = self._build_parameter_documentation(param_info, class_info.name)
 
@@ -985,22 +924,7 @@ class CompletionMixin(LSPServerBase):
         if not class_info:
             # Check if it's an external param class
             check_class_name = resolved_class_name if resolved_class_name else class_name
-            full_class_path = None
-
-            if "." in check_class_name:
-                # Handle dotted names like hv.Curve
-                parts = check_class_name.split(".")
-                if len(parts) >= 2:
-                    alias = parts[0]
-                    class_part = ".".join(parts[1:])
-                    if alias in analyzer.imports:
-                        full_module = analyzer.imports[alias]
-                        full_class_path = f"{full_module}.{class_part}"
-                    else:
-                        full_class_path = check_class_name
-            else:
-                # Simple class name
-                full_class_path = check_class_name
+            full_class_path = self._resolve_external_class_path(check_class_name, analyzer)
 
             class_info = analyzer._analyze_external_class_ast(full_class_path)
 
@@ -1013,10 +937,7 @@ class CompletionMixin(LSPServerBase):
         cls = param_info.cls or "Parameter"
 
         # Extract partial text being typed after the parameter name
-        partial_text = ""
-        param_attr_match = re.search(rf"\.{re.escape(param_name)}\.(\w*)$", before_cursor)
-        if param_attr_match:
-            partial_text = param_attr_match.group(1)
+        partial_text = _partial_attribute(before_cursor, f".{param_name}.")
 
         # Type-specific attributes
         type_specific_attributes = {}
@@ -1122,22 +1043,7 @@ class CompletionMixin(LSPServerBase):
         if not class_info:
             # Check if it's an external param class
             check_class_name = resolved_class_name if resolved_class_name else class_name
-            full_class_path = None
-
-            if "." in check_class_name:
-                # Handle dotted names like hv.Curve
-                parts = check_class_name.split(".")
-                if len(parts) >= 2:
-                    alias = parts[0]
-                    class_part = ".".join(parts[1:])
-                    if alias in analyzer.imports:
-                        full_module = analyzer.imports[alias]
-                        full_class_path = f"{full_module}.{class_part}"
-                    else:
-                        full_class_path = check_class_name
-            else:
-                # Simple class name
-                full_class_path = check_class_name
+            full_class_path = self._resolve_external_class_path(check_class_name, analyzer)
 
             class_info = analyzer._analyze_external_class_ast(full_class_path)
 
@@ -1146,10 +1052,7 @@ class CompletionMixin(LSPServerBase):
             return completions
 
         # Extract partial text being typed after .rx.
-        partial_text = ""
-        rx_method_match = re.search(rf"\.{re.escape(param_name)}\.rx\.(\w*)$", before_cursor)
-        if rx_method_match:
-            partial_text = rx_method_match.group(1)
+        partial_text = _partial_attribute(before_cursor, f".{param_name}.rx.")
 
         # Add method completions
         for method_name, method_doc in RX_METHODS.items():
@@ -1240,22 +1143,7 @@ class CompletionMixin(LSPServerBase):
         if not class_info:
             # Check if it's an external param class
             check_class_name = resolved_class_name if resolved_class_name else class_name
-            full_class_path = None
-
-            if "." in check_class_name:
-                # Handle dotted names like hv.Curve
-                parts = check_class_name.split(".")
-                if len(parts) >= 2:
-                    alias = parts[0]
-                    class_part = ".".join(parts[1:])
-                    if alias in analyzer.imports:
-                        full_module = analyzer.imports[alias]
-                        full_class_path = f"{full_module}.{class_part}"
-                    else:
-                        full_class_path = check_class_name
-            else:
-                # Simple class name - check if it's in external classes directly
-                full_class_path = check_class_name
+            full_class_path = self._resolve_external_class_path(check_class_name, analyzer)
 
             # Check if this resolved class is in external_param_classes
             class_info = analyzer._analyze_external_class_ast(full_class_path)
@@ -1270,7 +1158,7 @@ class CompletionMixin(LSPServerBase):
         used_params.update(used_matches)
 
         # Create completion items for each parameter as keyword arguments
-        for param_name in class_info.get_parameter_names():
+        for param_name, param_info in class_info.parameters.items():
             # Skip the 'name' parameter as it's rarely set in updates
             if param_name == "name":
                 continue
@@ -1279,10 +1167,6 @@ class CompletionMixin(LSPServerBase):
             if param_name in used_params:
                 continue
 
-            param_info = class_info.parameters.get(param_name)
-            if not param_info:
-                continue
-
             # Build documentation for the parameter
             documentation = self._build_parameter_documentation(param_info, class_info.name)
 
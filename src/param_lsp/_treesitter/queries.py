@@ -21,6 +21,9 @@ _QUERY_CACHE: dict[str, Query] = {}
 # Language singleton
 _LANGUAGE: Language | None = None
 
+# Root node and matches of the last analysis_targets query, shared by the analysis passes
+_ANALYSIS_MATCHES: tuple[Node, list[tuple[int, dict[str, list[Node]]]]] | None = None
+
 
 def _get_language() -> Language:
     """Get or create the Language object."""
@@ -59,6 +62,25 @@ def _execute_query(query: Query, node: Node) -> list[tuple[int, dict[str, list[N
     return cursor.matches(node)
 
 
+def _get_analysis_matches(root_node: Node) -> list[tuple[int, dict[str, list[Node]]]]:
+    """Get the analysis_targets matches for a root node, running the query once per tree.
+
+    The analyzer and the validator both read their nodes from these matches, so only
+    the matches of the most recent root node are kept.
+
+    Args:
+        root_node: Node to search
+
+    Returns:
+        List of (pattern_index, captures_dict) tuples
+    """
+    global _ANALYSIS_MATCHES  # noqa: PLW0603
+    if _ANALYSIS_MATCHES is None or _ANALYSIS_MATCHES[0] != root_node:
+        query = _get_query(_QUERIES["analysis_targets"])
+        _ANALYSIS_MATCHES = (root_node, _execute_query(query, root_node))
+    return _ANALYSIS_MATCHES[1]
+
+
 # Pre-defined queries for common patterns
 _QUERIES = {
     # Find all class definitions
@@ -87,12 +109,49 @@ _QUERIES = {
             left: (_) @target
             right: (_) @value) @assignment
     """,
+    # Find assignments of a call to a simple name (e.g. widget = Widget(...))
+    "call_assignments": """
+        (assignment
+            left: (identifier) @target
+            right: (call
+                function: (_) @function)) @assignment
+    """,
     # Find all function calls
     "calls": """
         (call
             function: (_) @function
             arguments: (argument_list) @arguments) @call
     """,
+    # Find imports and class definitions (including incomplete ones) in a single pass
+    "imports_and_classes": """
+        (import_statement) @import
+        (import_from_statement) @import_from
+        (class_definition) @class
+    """,
+    # Find everything the analysis needs in a single pass over the tree: imports,
+    # class definitions, attribute assignments, calls and param.depends decorators.
+    # Shared by find_imports_classes_and_calls and find_validation_targets.
+    "analysis_targets": """
+        (import_statement) @import
+        (import_from_statement) @import_from
+        (class_definition
+            name: (identifier) @class_name
+            body: (block) @class_body) @class
+        (assignment
+            left: (attribute
+                object: (_) @object
+                attribute: (identifier) @attr_name) @attr
+            right: (_) @value) @attr_assignment
+        (call
+            function: (_) @function
+            arguments: (argument_list) @arguments) @call
+        (decorator
+            (call
+                function: (attribute
+                    object: (identifier) @module
+                    attribute: (identifier) @depends_name)
+                arguments: (argument_list) @depends_args) @depends_call) @decorator
+    """,
     # Find parameter assignments (class-level assignments)
     "parameter_assignments": """
         (class_definition
@@ -205,6 +264,145 @@ def find_imports(tree: Tree | Node) -> list[tuple[Node, dict[str, Node]]]:
     return results
 
 
+def find_imports_classes_and_calls(
+    tree: Tree | Node,
+) -> tuple[
+    list[tuple[Node, dict[str, Node]]],
+    list[tuple[Node, dict[str, Node]]],
+    list[tuple[Node, dict[str, Node]]],
+]:
+    """Find import statements, class definitions and calls in one query pass.
+
+    Equivalent to calling find_imports, find_classes and find_calls, but walks the
+    tree once instead of three times. The walk is shared with find_validation_targets
+    on the same tree.
+
+    Args:
+        tree: Tree or Node to search
+
+    Returns:
+        Tuple of (imports, classes, calls) lists, each with the same
+        (node, captures_dict) entries as the corresponding find_* function
+    """
+    root_node: Node = tree.root_node if isinstance(tree, Tree) else tree
+    matches = _get_analysis_matches(root_node)
+
+    imports = []
+    classes = []
+    calls = []
+    for _, captures_dict in matches:
+        if captures_dict.get("call"):
+            call_node = captures_dict["call"][0]
+            calls.append(
+                (
+                    call_node,
+                    {
+                        "call": call_node,
+                        "function": captures_dict.get("function", [None])[0],
+                        "arguments": captures_dict.get("arguments", [None])[0],
+                    },
+                )
+            )
+        elif captures_dict.get("class"):
+            class_node = captures_dict["class"][0]
+            classes.append(
+                (
+                    class_node,
+                    {
+                        "class": class_node,
+                        "class_name": captures_dict.get("class_name", [None])[0],
+                        "class_body": captures_dict.get("class_body", [None])[0],
+                    },
+                )
+            )
+        elif captures_dict.get("import"):
+            import_node = captures_dict["import"][0]
+            imports.append((import_node, {"import": import_node}))
+        elif captures_dict.get("import_from"):
+            import_node = captures_dict["import_from"][0]
+            imports.append((import_node, {"import_from": import_node}))
+
+    return imports, classes, calls
+
+
+def find_imports_and_classes(tree: Tree | Node) -> tuple[list[Node], list[Node]]:
+    """Find import statements and class definitions in one query pass.
+
+    Unlike find_classes, class definitions match even without a name or body,
+    so this also covers classes that are incomplete due to syntax errors.
+
+    Args:
+        tree: Tree or Node to search
+
+    Returns:
+        Tuple of (import_nodes, class_nodes), each in document order
+    """
+    root_node: Node = tree.root_node if isinstance(tree, Tree) else tree
+    query = _get_query(_QUERIES["imports_and_classes"])
+    matches = _execute_query(query, root_node)
+
+    import_nodes: list[Node] = []
+    class_nodes: list[Node] = []
+    # Each pattern has a single capture, which selects the bucket for its node
+    buckets = {"class": class_nodes, "import": import_nodes, "import_from": import_nodes}
+    for _, captures_dict in matches:
+        for capture_name, nodes in captures_dict.items():
+            buckets[capture_name].append(nodes[0])
+
+    return import_nodes, class_nodes
+
+
+def find_validation_targets(
+    tree: Tree | Node,
+) -> tuple[list[Node], list[tuple[Node, Node, Node, Node]], list[Node], list[Node]]:
+    """Find the nodes checked by parameter validation in one query pass.
+
+    Equivalent to the nodes of find_classes, find_attribute_assignments, find_calls
+    and find_param_depends_decorators, but walks the tree once instead of four times.
+    The walk is shared with find_imports_classes_and_calls on the same tree.
+
+    Args:
+        tree: Tree or Node to search
+
+    Returns:
+        Tuple of (class_nodes, attribute_assignments, call_nodes, decorator_nodes), each
+        in document order. Attribute assignments are (assignment, object, attr_name, value)
+        node tuples taken from the captures, so callers need not look up the fields again.
+    """
+    root_node: Node = tree.root_node if isinstance(tree, Tree) else tree
+    matches = _get_analysis_matches(root_node)
+
+    class_nodes: list[Node] = []
+    assignments: list[tuple[Node, Node, Node, Node]] = []
+    call_nodes: list[Node] = []
+    decorator_nodes: list[Node] = []
+    # The outermost capture of each pattern selects the bucket for its node
+    buckets = (
+        ("class", class_nodes),
+        ("call", call_nodes),
+        ("decorator", decorator_nodes),
+    )
+    for _, captures_dict in matches:
+        assignment = captures_dict.get("attr_assignment")
+        if assignment:
+            assignments.append(
+                (
+                    assignment[0],
+                    captures_dict["object"][0],
+                    captures_dict["attr_name"][0],
+                    captures_dict["value"][0],
+                )
+            )
+            continue
+        for capture_name, nodes in buckets:
+            captured = captures_dict.get(capture_name)
+            if captured:
+                nodes.append(captured[0])
+                break
+
+    return class_nodes, assignments, call_nodes, decorator_nodes
+
+
 def find_assignments(tree: Tree | Node) -> list[tuple[Node, dict[str, Node]]]:
     """Find all assignment statements using query.
 
@@ -235,6 +433,36 @@ def find_assignments(tree: Tree | Node) -> list[tuple[Node, dict[str, Node]]]:
     return results
 
 
+def find_call_assignments(tree: Tree | Node) -> list[tuple[Node, dict[str, Node]]]:
+    """Find assignments of a call to a simple name (e.g. widget = Widget()) using query.
+
+    Args:
+        tree: Tree or Node to search
+
+    Returns:
+        List of (assignment_node, captures_dict) tuples where captures_dict contains:
+            - "assignment": the full assignment node
+            - "target": the identifier being assigned to
+            - "function": the function (or class) being called
+    """
+    root_node: Node = tree.root_node if isinstance(tree, Tree) else tree
+    query = _get_query(_QUERIES["call_assignments"])
+    matches = _execute_query(query, root_node)
+
+    results = []
+    for _, captures_dict in matches:
+        if captures_dict.get("assignment"):
+            assignment_node = captures_dict["assignment"][0]
+            result_captures = {
+                "assignment": assignment_node,
+                "target": captures_dict.get("target", [None])[0],
+                "function": captures_dict.get("function", [None])[0],
+            }
+            results.append((assignment_node, result_captures))
+
+    return results
+
+
 def find_calls(tree: Tree | Node) -> list[tuple[Node, dict[str, Node]]]:
     """Find all function/method calls using query.
 
@@ -488,4 +716,6 @@ def clear_query_cache() -> None:
 
     Useful for testing or memory management.
     """
+    global _ANALYSIS_MATCHES  # noqa: PLW0603
     _QUERY_CACHE.clear()
+    _ANALYSIS_MATCHES = None
@@ -24,9 +24,9 @@ def get_value(node: Node | None) -> str | None:
     """
     if node is None:
         return None
-    if hasattr(node, "text") and node.text is not None:
-        return node.text.decode("utf-8")
-    return None
+    # Tree-sitter nodes always have a text attribute, which is None without source
+    text = node.text
+    return text.decode("utf-8") if text is not None else None
 
 
 def get_children(node: Node | None) -> list[Node]:
@@ -40,9 +40,8 @@ def get_children(node: Node | None) -> list[Node]:
     """
     if node is None:
         return []
-    if hasattr(node, "children"):
-        return list(node.children)
-    return []
+    # Tree-sitter builds a new list on every access, so it is safe to hand out
+    return node.children
 
 
 def walk_tree(node: Node | None) -> Generator[Node, None, None]:
@@ -56,10 +55,12 @@ def walk_tree(node: Node | None) -> Generator[Node, None, None]:
     """
     if node is None:
         return
-    yield node
-    for child in get_children(node):
-        if child is not None:
-            yield from walk_tree(child)
+    # Explicit stack instead of recursion, children pushed in reverse to keep the order
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(current.children))
 
 
 def get_class_name(class_node: Node) -> str | None:
@@ -75,21 +76,18 @@ def get_class_name(class_node: Node) -> str | None:
         return None
 
     # Try to get name via field accessor first (more reliable for tree-sitter)
-    if hasattr(class_node, "child_by_field_name"):
-        name_node = class_node.child_by_field_name("name")
-        if name_node:
-            return get_value(name_node)
+    name_node = class_node.child_by_field_name("name")
+    if name_node:
+        return get_value(name_node)
 
     # Fallback: search children for identifier after "class" keyword
     found_class_keyword = False
-    for child in get_children(class_node):
-        if hasattr(child, "type"):
-            if child.type == "class" or (
-                child.type == "identifier" and get_value(child) == "class"
-            ):
-                found_class_keyword = True
-            elif found_class_keyword and child.type == "identifier":
-                return get_value(child)
+    for child in class_node.children:
+        child_type = child.type
+        if child_type == "class" or (child_type == "identifier" and child.text == b"class"):
+            found_class_keyword = True
+        elif found_class_keyword and child_type == "identifier":
+            return get_value(child)
 
     return None
 
@@ -106,37 +104,37 @@ def get_class_bases(class_node: Node) -> list[Node]:
     bases = []
 
     # Try to get superclasses via field accessor
-    if hasattr(class_node, "child_by_field_name"):
-        superclasses_node = class_node.child_by_field_name("superclasses")
-        if superclasses_node:
-            # Superclasses node is an argument_list containing the base classes
-            bases.extend(
-                child
-                for child in get_children(superclasses_node)
-                if child.type in ("identifier", "attribute", "call")
-            )
-            return bases
+    superclasses_node = class_node.child_by_field_name("superclasses")
+    if superclasses_node:
+        # Superclasses node is an argument_list containing the base classes
+        bases.extend(
+            child
+            for child in superclasses_node.children
+            if child.type in ("identifier", "attribute", "call")
+        )
+        return bases
 
     # Fallback: look for bases between parentheses in class definition
     in_parentheses = False
-    for child in get_children(class_node):
-        if hasattr(child, "type"):
-            if child.type == "operator" and get_value(child) == "(":
-                in_parentheses = True
-            elif child.type == "operator" and get_value(child) == ")":
-                in_parentheses = False
-            elif in_parentheses:
-                if child.type in ("identifier", "attribute", "call"):
-                    bases.append(child)
-                elif child.type == "argument_list":
-                    # Multiple bases in argument list
-                    bases.extend(
-                        [
-                            arg_child
-                            for arg_child in get_children(child)
-                            if arg_child.type in ("identifier", "attribute", "call")
-                        ]
-                    )
+    for child in class_node.children:
+        child_type = child.type
+        value = child.text if child_type == "operator" else None
+        if value == b"(":
+            in_parentheses = True
+        elif value == b")":
+            in_parentheses = False
+        elif in_parentheses:
+            if child_type in ("identifier", "attribute", "call"):
+                bases.append(child)
+            elif child_type == "argument_list":
+                # Multiple bases in argument list
+                bases.extend(
+                    [
+                        arg_child
+                        for arg_child in child.children
+                        if arg_child.type in ("identifier", "attribute", "call")
+                    ]
+                )
 
     return bases
 
@@ -154,17 +152,19 @@ def is_assignment_stmt(node: Node) -> bool:
         return False
 
     # In tree-sitter, assignment nodes have type "assignment"
-    if hasattr(node, "type") and node.type == "assignment":
+    node_type = node.type
+    if node_type == "assignment":
         return True
 
+    children = node.children
     # Also check for expression_statement containing assignment
-    if hasattr(node, "type") and node.type == "expression_statement":
-        for child in get_children(node):
-            if child.type == "assignment":
-                return True
+    if node_type == "expression_statement" and any(
+        child.type == "assignment" for child in children
+    ):
+        return True
 
     # Fallback: Look for assignment operator '=' in the children
-    return any(get_value(child) == "=" for child in get_children(node) if hasattr(child, "type"))
+    return any(child.text == b"=" for child in children)
 
 
 def get_assignment_target_name(node: Node) -> str | None:
@@ -177,18 +177,17 @@ def get_assignment_target_name(node: Node) -> str | None:
         The name of the variable being assigned to, or None if not found
     """
     # Try to get left side via field accessor
-    if hasattr(node, "child_by_field_name") and node.type == "assignment":
+    if node.type == "assignment":
         left_node = node.child_by_field_name("left")
         if left_node and left_node.type == "identifier":
             return get_value(left_node)
 
     # Fallback: The target is typically the first child before the '=' operator
-    for child in get_children(node):
-        if hasattr(child, "type"):
-            if child.type == "identifier":
-                return get_value(child)
-            elif get_value(child) == "=":
-                break
+    for child in node.children:
+        if child.type == "identifier":
+            return get_value(child)
+        elif child.text == b"=":
+            break
 
     return None
 
@@ -202,9 +201,6 @@ def is_function_call(node: Node) -> bool:
     Returns:
         True if the node represents a function call, False otherwise
     """
-    if not hasattr(node, "type"):
-        return False
-
     # In tree-sitter, function calls have type "call"
     return node.type == "call"
 
@@ -217,24 +213,23 @@ def find_class_suites(class_node: Node) -> Generator[Node, None, None]:
     """
     yielded = False
 
-    if hasattr(class_node, "child_by_field_name"):
-        body_node = class_node.child_by_field_name("body")
-        if body_node:
-            yield body_node
-            yielded = True
+    body_node = class_node.child_by_field_name("body")
+    if body_node:
+        yield body_node
+        yielded = True
 
     # Check for ERROR nodes and block/suite nodes in children
     # This handles cases where syntax errors cause parameters to be in ERROR nodes
     # Only yield these if we haven't yielded a body node yet
-    for child in get_children(class_node):
-        if hasattr(child, "type"):
-            if child.type in ("block", "suite") and not yielded:
-                yield child
-                yielded = True
-            elif child.type == "ERROR":
-                # Always yield ERROR nodes as they might contain parameters
-                # even if there's also a body node
-                yield child
+    for child in class_node.children:
+        child_type = child.type
+        if child_type in ("block", "suite") and not yielded:
+            yield child
+            yielded = True
+        elif child_type == "ERROR":
+            # Always yield ERROR nodes as they might contain parameters
+            # even if there's also a body node
+            yield child
 
 
 def find_parameter_assignments(
@@ -242,18 +237,17 @@ def find_parameter_assignments(
     is_parameter_assignment_func,
 ) -> Generator[tuple[Node, str], None, None]:
     """Generator that yields parameter assignment nodes from a class suite/body."""
-    for item in get_children(suite_node):
-        if not hasattr(item, "type"):
-            continue
-
-        if item.type == "assignment" and is_assignment_stmt(item):
+    for item in suite_node.children:
+        item_type = item.type
+        if item_type == "assignment":
             target_name = get_assignment_target_name(item)
             if target_name and is_parameter_assignment_func(item):
                 yield item, target_name
-        elif item.type == "expression_statement":
-            # Check if expression statement contains assignment
-            for child in get_children(item):
-                if child.type == "assignment" and is_assignment_stmt(child):
+        elif item_type == "expression_statement":
+            # Check if expression statement contains assignment. Assignment nodes are
+            # always assignment statements, see is_assignment_stmt
+            for child in item.children:
+                if child.type == "assignment":
                     target_name = get_assignment_target_name(child)
                     if target_name and is_parameter_assignment_func(child):
                         yield child, target_name
@@ -264,30 +258,23 @@ def find_function_call_trailers(call_node: Node) -> Generator[Node, None, None]:
 
     In tree-sitter, a call node has an 'arguments' field containing the argument list.
     """
-    if hasattr(call_node, "child_by_field_name") and call_node.type == "call":
+    if call_node.type == "call":
         args_node = call_node.child_by_field_name("arguments")
         if args_node:
             yield args_node
             return
 
     # Fallback: search for argument_list nodes
-    for child in get_children(call_node):
-        if hasattr(child, "type") and child.type == "argument_list":
+    for child in call_node.children:
+        if child.type == "argument_list":
             yield child
 
 
 def find_arguments_in_trailer(trailer_node: Node) -> Generator[Node, None, None]:
     """Generator that yields argument nodes from a function call argument list."""
-    for child in get_children(trailer_node):
-        if not hasattr(child, "type"):
-            continue
-
-        # Tree-sitter has keyword_argument and regular arguments
-        if child.type == "keyword_argument":
-            yield child
-        elif child.type not in ("(", ")", ","):  # Skip punctuation
-            # Regular positional arguments
-            yield child
+    # Tree-sitter has keyword_argument and regular arguments as named children, while
+    # the parentheses and commas are anonymous, so no child type needs to be compared
+    yield from trailer_node.named_children
 
 
 def find_all_parameter_assignments(
@@ -28,23 +28,34 @@ like Panel, HoloViews, Bokeh, and others.
 from __future__ import annotations
 
 import inspect
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from . import _treesitter
-from ._analyzer.ast_navigator import ImportHandler, ParameterDetector, SourceAnalyzer
+from ._analyzer.ast_navigator import (
+    ImportHandler,
+    ParameterDetector,
+    SourceAnalyzer,
+    source_text,
+)
 from ._analyzer.import_resolver import ImportResolver
 from ._analyzer.inheritance_resolver import InheritanceResolver
-from ._analyzer.parameter_extractor import extract_parameter_info_from_assignment
+from ._analyzer.parameter_extractor import (
+    extract_parameter_info_from_assignment,
+)
 from ._analyzer.static_external_analyzer import ExternalClassInspector
 from ._analyzer.validation import ParameterValidator
-from ._treesitter.queries import find_assignments, find_calls, find_classes, find_imports
+from ._treesitter.queries import find_call_assignments, find_imports_classes_and_calls
 from ._types import AnalysisResult
+from .cache import environment_hash, workspace_file_cache
 from .models import ParameterInfo, ParameterizedInfo
 
 if TYPE_CHECKING:
     from tree_sitter import Node
 
+    from ._analyzer.ast_navigator import SourceText
     from ._types import (
         ImportDict,
         ParamClassDict,
@@ -61,10 +72,99 @@ from ._logging import get_logger
 
 logger = get_logger(__name__, "analyzer")
 
+# Maximum number of resolved class names kept per analyzer
+_RESOLVED_CLASS_NAMES_MAXSIZE = 512
+
+
+@lru_cache(maxsize=256)
+def _param_names_of(cls: type) -> frozenset[str]:
+    """Get the _param_names of a class as a frozenset, memoized per class.
+
+    Turns the per-class list scan of an MRO walk into a hash probe.
+    """
+    return frozenset(getattr(cls, "_param_names", ()))
+
+
+def _class_name_from_node(node: Node) -> str | None:
+    """Extract a class name from a function node (handles both simple and dotted names)."""
+    if node.type == "identifier":
+        # Simple class name like: MyClass
+        return _treesitter.get_value(node)
+    elif node.type == "attribute":
+        # Dotted name like: hv.Curve
+        # Build the full dotted name by walking the attribute chain, innermost name last
+        parts = []
+        current = node
+        while current and current.type == "attribute":
+            # Get the attribute name
+            attr_node = current.child_by_field_name("attribute")
+            if attr_node:
+                parts.append(_treesitter.get_value(attr_node))
+            # Move to the object part
+            current = current.child_by_field_name("object")
+
+        # Add the final identifier
+        if current and current.type == "identifier":
+            parts.append(_treesitter.get_value(current))
+
+        parts.reverse()
+        return ".".join(parts) if parts else None
+
+    return None
+
+
+def _call_assignment_index(document_content: str) -> dict[str, list[str]]:
+    """Index the call assignments of a document by target name.
+
+    Maps each name assigned like ``name = ClassName(...)`` to the called class names,
+    in document order.
+    """
+    tree = _treesitter.parser.parse(document_content, error_recovery=True)
+    index: dict[str, list[str]] = {}
+    for _assignment_node, captures in find_call_assignments(tree.root_node):
+        target_node = captures.get("target")
+        function_node = captures.get("function")
+        if not target_node or not function_node:
+            continue
+        target_name = _treesitter.get_value(target_node)
+        assigned_class = _class_name_from_node(function_node)
+        if target_name and assigned_class:
+            index.setdefault(target_name, []).append(assigned_class)
+    return index
+
 
 class ParamAnalyzer:
     """Analyzes Python code for Param usage patterns."""
 
+    __slots__ = (
+        "_call_assignments",
+        "_class_bases",
+        "_class_names",
+        "_class_paths",
+        "_current_file_path",
+        "_current_source",
+        "_keyword_arguments",
+        "_last_analysis",
+        "_parameter_classes",
+        "_resolved_class_names",
+        "external_inspector",
+        "external_param_classes",
+        "extra_libraries",
+        "file_cache",
+        "import_handler",
+        "import_resolver",
+        "imports",
+        "inheritance_resolver",
+        "module_cache",
+        "param_classes",
+        "parameter_detector",
+        "python_env",
+        "type_errors",
+        "validator",
+        "workspace_cache",
+        "workspace_root",
+    )
+
     def __init__(
         self,
         python_env: Any = None,
@@ -82,14 +182,36 @@ class ParamAnalyzer:
         """
         self.param_classes: ParamClassDict = {}
         self.imports: ImportDict = {}
-        # Store file content for source line lookup
-        self._current_file_content: str | None = None
+        # Source of the current file for source line lookup
+        self._current_source: SourceText | None = None
         self.type_errors: list[TypeErrorDict] = []
+        # (file_path, content, result) of the last completed analysis
+        self._last_analysis: tuple[str | None, str, AnalysisResult] | None = None
+        # LRU of resolved class names for the current analysis, by (name, document)
+        self._resolved_class_names: OrderedDict[tuple[str, str], str | None] = OrderedDict()
+        # Call assignments index for the current analysis, by document content
+        self._call_assignments: dict[str, dict[str, list[str]]] = {}
+        # Class names and base class nodes for the current analysis, by class node
+        self._class_names: dict[TSNode, str | None] = {}
+        self._class_bases: dict[TSNode, list[TSNode]] = {}
+        # Resolved parameter classes for the current analysis, by parameter call node.
+        # Shared with the validator, which checks the same class body parameters.
+        self._parameter_classes: dict[TSNode, dict[str, str] | None] = {}
+        # Keyword arguments for the current analysis, by call node. Shared with the
+        # validator, which checks the same parameter and constructor calls.
+        self._keyword_arguments: dict[TSNode, dict[str, TSNode]] = {}
+        # Resolved full class paths for the current analysis, by class or function node.
+        # Shared by the import resolver and the validator, which resolve the same calls.
+        self._class_paths: dict[TSNode, str | None] = {}
 
         # Workspace-wide analysis
         self.workspace_root = Path(workspace_root) if workspace_root else None
         self.module_cache: dict[str, AnalysisResult] = {}  # module_name -> analysis_result
         self.file_cache: dict[str, AnalysisResult] = {}  # file_path -> analysis_result
+        # Analysis results of workspace files persisted across sessions
+        self.workspace_cache = (
+            workspace_file_cache(str(self.workspace_root)) if self.workspace_root else None
+        )
 
         # Store python_env and extra_libraries for passing to child analyzers
         self.python_env = python_env
@@ -120,6 +242,9 @@ class ParamAnalyzer:
             is_parameter_assignment_func=self._is_parameter_assignment,
             external_inspector=self.external_inspector,
             workspace_root=str(self.workspace_root) if self.workspace_root else None,
+            parameter_class_cache=self._parameter_classes,
+            class_path_cache=self._class_paths,
+            keyword_argument_cache=self._keyword_arguments,
         )
 
         # Use modular import resolver
@@ -129,6 +254,7 @@ class ParamAnalyzer:
             module_cache=self.module_cache,
             file_cache=self.file_cache,
             analyze_file_func=self._analyze_file_for_import_resolver,
+            class_path_cache=self._class_paths,
         )
 
         # Use modular inheritance resolver
@@ -148,7 +274,19 @@ class ParamAnalyzer:
     def _analyze_file_for_import_resolver(
         self, content: str, file_path: str | None = None
     ) -> AnalysisResult:
-        """Analyze a file for the import resolver (avoiding circular dependencies)."""
+        """Analyze a file for the import resolver (avoiding circular dependencies).
+
+        Results of a previous session are reused while the file, the workspace files
+        it depends on, and the installed library versions are unchanged.
+        """
+        workspace_cache = self.workspace_cache
+        environment = ""
+        if workspace_cache and file_path:
+            environment = environment_hash(self.external_inspector.library_versions())
+            result = workspace_cache.get(file_path, content, environment)
+            if result is not None:
+                return result
+
         # Create a new analyzer instance for the imported module to avoid conflicts
         # Pass through the python_env and extra_libraries to ensure external library analysis uses the correct environment
         module_analyzer = ParamAnalyzer(
@@ -156,16 +294,37 @@ class ParamAnalyzer:
             workspace_root=str(self.workspace_root) if self.workspace_root else None,
             extra_libraries=self.extra_libraries,
         )
-        return module_analyzer.analyze_file(content, file_path)
+        result = module_analyzer.analyze_file(content, file_path)
+        if workspace_cache and file_path:
+            workspace_cache.set(
+                file_path,
+                content,
+                result,
+                environment,
+                module_analyzer.import_resolver.used_module_files,
+            )
+        return result
 
     def analyze_file(self, content: str, file_path: str | None = None) -> AnalysisResult:
         """Analyze a Python file for Param usage."""
+        # Unchanged content, e.g. a save right after the last edit, reuses the previous
+        # result: the analyzer state it refers to is still in place. Imported modules
+        # edited on disk since then require a new analysis.
+        last_analysis = self._last_analysis
+        if (
+            last_analysis
+            and last_analysis[0] == file_path
+            and last_analysis[1] == content
+            and self.import_resolver.imported_modules_current()
+        ):
+            return last_analysis[2]
+
         try:
             # Use tree-sitter with error recovery (always enabled)
             tree = _treesitter.parser.parse(content, error_recovery=True)
             self._reset_analysis()
             self._current_file_path = file_path
-            self._current_file_content = content
+            self._current_source = source_text(content)
 
             # Note: tree-sitter handles syntax errors internally with error recovery
 
@@ -174,81 +333,107 @@ class ParamAnalyzer:
             logger.error(f"Failed to parse file: {e}")
             return AnalysisResult(param_classes={}, imports={}, type_errors=[])
 
-        # First pass: collect imports using optimized queries
-        for import_node, _captures in find_imports(tree.root_node):
-            if import_node.type == "import_statement":
-                self.import_handler.handle_import(import_node)
-            elif import_node.type == "import_from_statement":
-                self.import_handler.handle_import_from(import_node)
+        # Collect imports, class definitions and calls in a single query pass
+        import_matches, class_matches, call_matches = find_imports_classes_and_calls(
+            tree.root_node
+        )
+
+        # First pass: handle imports
+        handle_import = self.import_handler.handle
+        for import_node, _captures in import_matches:
+            handle_import(import_node)
 
-        # Second pass: collect class definitions using optimized queries
-        class_matches = find_classes(tree.root_node)
+        # Second pass: handle class definitions
         class_nodes: list[TSNode] = [class_node for class_node, _captures in class_matches]
 
-        # Process classes in dependency order (parents before children)
-        # Track processed nodes (not names) to allow duplicate class names
-        processed_nodes = set()
-        processed_names = set()  # Track names separately for dependency checking
-        while len(processed_nodes) < len(class_nodes):
-            progress_made = False
-            for node in class_nodes:
-                class_name = _treesitter.get_class_name(node)
-                # Skip if this specific node was already processed or has no name
-                if not class_name or id(node) in processed_nodes:
-                    continue
-
-                # Check if all parent classes are processed or are external param classes
-                can_process = True
-                bases = _treesitter.get_class_bases(node)
-                for base in bases:
-                    if base.type == "identifier":
-                        parent_name = _treesitter.get_value(base)
-                        # If it's a class defined in this file and not processed yet, wait
-                        if (
-                            any(
-                                _treesitter.get_class_name(cn) == parent_name for cn in class_nodes
-                            )
-                            and parent_name not in processed_names
-                        ):
-                            can_process = False
-                            break
-
-                if can_process:
+        # Process classes in dependency order (parents before children), in passes over
+        # the classes in document order. Names and local base classes are computed once
+        # per class, so a pass only does set checks. Dependencies are tracked by name,
+        # which allows duplicate class names.
+        class_names = [self._get_class_name(node) for node in class_nodes]
+        local_names = {name for name in class_names if name}
+        pending: list[tuple[TSNode, str, set[str]]] = []
+        for node, class_name in zip(class_nodes, class_names, strict=True):
+            if not class_name:
+                continue
+            # Parent classes defined in this file must be processed first
+            local_bases = {
+                parent_name
+                for base in self._get_class_bases(node)
+                if base.type == "identifier"
+                and (parent_name := _treesitter.get_value(base)) in local_names
+            }
+            pending.append((node, class_name, local_bases))
+
+        processed_names: set[str] = set()
+        while pending:
+            remaining = []
+            for entry in pending:
+                node, class_name, local_bases = entry
+                if local_bases <= processed_names:
                     self._handle_class_def(node)
-                    processed_nodes.add(id(node))
-                    processed_names.add(class_name)  # Track name for dependency checking
-                    progress_made = True
+                    processed_names.add(class_name)
+                else:
+                    remaining.append(entry)
 
             # Prevent infinite loop if there are circular dependencies
-            if not progress_made:
+            if len(remaining) == len(pending):
                 # Process remaining classes anyway
-                for node in class_nodes:
-                    class_name = _treesitter.get_class_name(node)
-                    if class_name and id(node) not in processed_nodes:
-                        self._handle_class_def(node)
-                        processed_nodes.add(id(node))
-                        processed_names.add(class_name)
+                for node, _class_name, _local_bases in remaining:
+                    self._handle_class_def(node)
                 break
+            pending = remaining
 
-        # Pre-pass: discover all external Parameterized classes using optimized queries
-        self._discover_external_param_classes(tree.root_node)
+        # Pre-pass: discover all external Parameterized classes from the collected calls
+        self._discover_external_param_classes(call_matches)
 
         # Perform parameter validation after parsing using modular validator
         self.type_errors = self.validator.check_parameter_types(
             tree.root_node, content.split("\n")
         )
 
-        return {
+        result: AnalysisResult = {
             "param_classes": self.param_classes,
             "imports": self.imports,
             "type_errors": self.type_errors,
         }
+        self._last_analysis = (file_path, content, result)
+
+        # Persist the imported modules analyzed for this file
+        if self.workspace_cache:
+            self.workspace_cache.flush()
+        return result
 
     def _reset_analysis(self) -> None:
         """Reset analysis state."""
+        self._last_analysis = None
         self.param_classes.clear()
         self.imports.clear()
         self.type_errors.clear()
+        self._resolved_class_names.clear()
+        self._call_assignments.clear()
+        self._class_names.clear()
+        self._class_bases.clear()
+        self._parameter_classes.clear()
+        self._class_paths.clear()
+        self._keyword_arguments.clear()
+        self.import_resolver.used_module_files.clear()
+
+    def _get_class_name(self, node: TSNode) -> str | None:
+        """Get the name of a class definition node, memoized for the current analysis."""
+        try:
+            return self._class_names[node]
+        except KeyError:
+            class_name = self._class_names[node] = _treesitter.get_class_name(node)
+            return class_name
+
+    def _get_class_bases(self, node: TSNode) -> list[TSNode]:
+        """Get the base class nodes of a class definition, memoized for the current analysis."""
+        try:
+            return self._class_bases[node]
+        except KeyError:
+            bases = self._class_bases[node] = _treesitter.get_class_bases(node)
+            return bases
 
     def _is_parameter_assignment(self, node: TSNode) -> bool:
         """Check if a tree-sitter assignment statement looks like a parameter definition."""
@@ -258,7 +443,7 @@ class ParamAnalyzer:
         """Handle class definitions that might inherit from param.Parameterized (tree-sitter node)."""
         # Check if class inherits from param.Parameterized (directly or indirectly)
         is_param_class = False
-        bases = _treesitter.get_class_bases(node)
+        bases = self._get_class_bases(node)
         for base in bases:
             if self.inheritance_resolver.is_param_base(
                 base, getattr(self, "_current_file_path", None)
@@ -267,14 +452,14 @@ class ParamAnalyzer:
                 break
 
         if is_param_class:
-            class_name = _treesitter.get_class_name(node)
+            class_name = self._get_class_name(node)
             if class_name is None:
                 return  # Skip if we can't get the class name
             class_info = ParameterizedInfo(name=class_name)
 
             # Get inherited parameters from parent classes first
             inherited_parameters = self.inheritance_resolver.collect_inherited_parameters(
-                node, getattr(self, "_current_file_path", None)
+                node, getattr(self, "_current_file_path", None), bases
             )
             # Add inherited parameters first
             class_info.merge_parameters(inherited_parameters)
@@ -297,7 +482,12 @@ class ParamAnalyzer:
             node, self._is_parameter_assignment
         ):
             param_info = extract_parameter_info_from_assignment(
-                assignment_node, target_name, self.imports, self._current_file_content
+                assignment_node,
+                target_name,
+                self.imports,
+                self._current_source,
+                self._parameter_classes,
+                self._keyword_arguments,
             )
             if param_info:
                 parameters.append(param_info)
@@ -359,7 +549,7 @@ class ParamAnalyzer:
         for base_cls in cls.__mro__:
             if hasattr(base_cls, "param") and hasattr(base_cls.param, param_name):
                 # Check if this class actually defines the parameter (not just inherits it)
-                if param_name in getattr(base_cls, "_param_names", []):
+                if param_name in _param_names_of(base_cls):
                     return base_cls
                 # Fallback: check if the parameter object is defined in this class's dict
                 if hasattr(base_cls, "_param_watchers") or param_name in base_cls.__dict__:
@@ -388,15 +578,29 @@ class ParamAnalyzer:
         # Fallback: just use the filename with module info
         return f"{library_name}/{path.name}"
 
-    def _discover_external_param_classes(self, tree: Node) -> None:
-        """Pre-pass to discover all external Parameterized classes using tree-sitter queries."""
-        # Use optimized query to find all function calls
-        for call_node, _captures in find_calls(tree):
-            if _treesitter.is_function_call(call_node):
-                full_class_path = self.import_resolver.resolve_full_class_path(call_node)
-                # Only analyze if this is from an imported library we care about
-                if self._is_from_allowed_library(full_class_path):
-                    self._analyze_external_class_ast(full_class_path)
+    def _discover_external_param_classes(
+        self, call_matches: list[tuple[Node, dict[str, Node]]]
+    ) -> None:
+        """Pre-pass to discover all external Parameterized classes from the calls in a file."""
+        # Calls only resolve to an allowed library through an import of it, so files
+        # importing nothing from those libraries can skip resolving every call
+        allowed_libraries = self.external_inspector.allowed_libraries
+        if not any(
+            module.partition(".")[0] in allowed_libraries for module in self.imports.values()
+        ):
+            return
+
+        # Every match is a call node, and its captures already hold the called function,
+        # so the path is resolved from the function node without inspecting the call again
+        resolve_full_class_path = self.import_resolver.resolve_full_class_path
+        for _call_node, captures in call_matches:
+            function_node = captures.get("function")
+            if function_node is None:
+                continue
+            full_class_path = resolve_full_class_path(function_node)
+            # Only analyze if this is from an imported library we care about
+            if self._is_from_allowed_library(full_class_path):
+                self._analyze_external_class_ast(full_class_path)
 
     def _is_from_allowed_library(self, full_class_path: str | None) -> bool:
         """Check if a class path is from an allowed external library.
@@ -420,99 +624,68 @@ class ParamAnalyzer:
         self, class_name: str, param_classes: dict[str, ParameterizedInfo], document_content: str
     ) -> str | None:
         """Resolve a class name from context, handling both direct class names and variable names using tree-sitter."""
+        # Completion and hover resolve the same names repeatedly between edits. Results
+        # are only cached against this analyzer's own param_classes, which are reset
+        # together with the cache whenever a new document version is analyzed.
+        if param_classes is not self.param_classes:
+            return self._resolve_class_name(class_name, param_classes, document_content)
+
+        cache = self._resolved_class_names
+        key = (class_name, document_content)
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        resolved = cache[key] = self._resolve_class_name(
+            class_name, param_classes, document_content
+        )
+        if len(cache) > _RESOLVED_CLASS_NAMES_MAXSIZE:
+            cache.popitem(last=False)
+        return resolved
+
+    def _resolve_class_name(
+        self, class_name: str, param_classes: dict[str, ParameterizedInfo], document_content: str
+    ) -> str | None:
+        """Resolve a class name from context without caching."""
         # If it's already a known param class, return it (search by unique key or base name)
-        if class_name in param_classes:
-            return class_name
-        # Search by base name if not found directly
-        for key in param_classes:
-            if key.startswith(f"{class_name}:"):
-                return key
+        key = self._find_param_class_key(class_name, param_classes)
+        if key:
+            return key
 
         # If it's a variable name, try to find its assignment in the document using tree-sitter
+        # Look for assignments like: variable_name = ClassName(...)
         if document_content:
-            # Parse the document with tree-sitter
-            tree = _treesitter.parser.parse(document_content, error_recovery=True)
-
-            # Look for assignments like: variable_name = ClassName(...)
-            for _assignment_node, captures in find_assignments(tree.root_node):
-                # Get the target (left side of assignment)
-                target_node = captures.get("target")
-                if not target_node:
-                    continue
-
-                # Check if the target matches our variable name
-                target_name = _treesitter.get_value(target_node)
-                if target_name != class_name:
-                    continue
-
-                # Get the value (right side of assignment)
-                value_node = captures.get("value")
-                if not value_node or value_node.type != "call":
-                    continue
-
-                # Get the function being called (the class name)
-                function_node = None
-                if hasattr(value_node, "child_by_field_name"):
-                    function_node = value_node.child_by_field_name("function")
-
-                if not function_node:
-                    continue
-
-                # Extract the class name from the function node
-                assigned_class = self._extract_class_name_from_node(function_node)
-                if not assigned_class:
-                    continue
-
+            call_assignments = self._call_assignments.get(document_content)
+            if call_assignments is None:
+                # Parsed once per document and analysis, and dropped with the next one
+                call_assignments = self._call_assignments[document_content] = (
+                    _call_assignment_index(document_content)
+                )
+            for assigned_class in call_assignments.get(class_name, ()):
                 # Check if the assigned class is a known param class (search by unique key or base name)
-                if assigned_class in param_classes:
-                    return assigned_class
-                # Search by base name if not found directly
-                for key in param_classes:
-                    if key.startswith(f"{assigned_class}:"):
-                        return key
-
-                # Check if it's an external class
-                if "." in assigned_class:
-                    # Handle dotted names like hv.Curve
-                    parts = assigned_class.split(".")
-                    if len(parts) >= 2:
-                        alias = parts[0]
-                        class_part = ".".join(parts[1:])
-                        if alias in self.imports:
-                            full_module = self.imports[alias]
-                            full_class_path = f"{full_module}.{class_part}"
-                            class_info = self._analyze_external_class_ast(full_class_path)
-                            if class_info:
-                                # Return the original dotted name for external class handling
-                                return assigned_class
+                key = self._find_param_class_key(assigned_class, param_classes)
+                if key:
+                    return key
+
+                # Check if it's an external class, handling dotted names like hv.Curve
+                alias, _, class_part = assigned_class.partition(".")
+                full_module = self.imports.get(alias) if class_part else None
+                if full_module:
+                    full_class_path = f"{full_module}.{class_part}"
+                    class_info = self._analyze_external_class_ast(full_class_path)
+                    if class_info:
+                        # Return the original dotted name for external class handling
+                        return assigned_class
 
         return None
 
-    def _extract_class_name_from_node(self, node: Node) -> str | None:
-        """Extract a class name from a function node (handles both simple and dotted names)."""
-        if node.type == "identifier":
-            # Simple class name like: MyClass
-            return _treesitter.get_value(node)
-        elif node.type == "attribute":
-            # Dotted name like: hv.Curve
-            # Build the full dotted name by walking the attribute chain
-            parts = []
-            current = node
-            while current and current.type == "attribute":
-                # Get the attribute name
-                if hasattr(current, "child_by_field_name"):
-                    attr_node = current.child_by_field_name("attribute")
-                    if attr_node:
-                        parts.insert(0, _treesitter.get_value(attr_node))
-                    # Move to the object part
-                    current = current.child_by_field_name("object")
-                else:
-                    break
-
-            # Add the final identifier
-            if current and current.type == "identifier":
-                parts.insert(0, _treesitter.get_value(current))
-
-            return ".".join(parts) if parts else None
-
-        return None
+    @staticmethod
+    def _find_param_class_key(
+        class_name: str, param_classes: dict[str, ParameterizedInfo]
+    ) -> str | None:
+        """Find the param_classes key for a class name, matching unique keys or base names."""
+        if class_name in param_classes:
+            return class_name
+        # Unique keys have the form "ClassName:line_number"
+        prefix = f"{class_name}:"
+        return next((key for key in param_classes if key.startswith(prefix)), None)
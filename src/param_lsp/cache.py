@@ -1,24 +1,33 @@
-"""Cache management for external library introspection results."""
+"""Cache management for external library introspection and workspace analysis results."""
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
 import time
 from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import msgspec
 import platformdirs
 
 from ._logging import get_logger
+from ._types import AnalysisResult, TypeErrorDict
 from .models import ParameterizedInfo  # noqa: TC001
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = get_logger(__name__, "cache")
 
 CACHE_VERSION = (1, 2, 0)
 _re_no = re.compile(r"\d+")
 
+# Workspace file entries analyzed longer ago than this are dropped on flush
+WORKSPACE_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
 
 class CacheMetadata(msgspec.Struct):
     """Metadata for a library cache."""
@@ -38,6 +47,28 @@ class LibraryCache(msgspec.Struct):
     parameter_types: list[str] = msgspec.field(default_factory=list)
 
 
+class WorkspaceFileEntry(msgspec.Struct):
+    """Cached analysis result of a workspace file."""
+
+    content_hash: str
+    analyzed_at: int
+    # Content hashes of the workspace files the result depends on, transitively
+    dependencies: dict[str, str]
+    # Hash of the installed library versions the result was analyzed with
+    environment: str
+    param_classes: dict[str, ParameterizedInfo]
+    imports: dict[str, str]
+    type_errors: list[TypeErrorDict]
+
+
+class WorkspaceCache(msgspec.Struct):
+    """Complete cache structure for a workspace."""
+
+    workspace_root: str
+    cache_version: tuple[int, int, int]
+    files: dict[str, WorkspaceFileEntry] = msgspec.field(default_factory=dict)
+
+
 @cache
 def parse_version(version_str: str) -> tuple[int, ...]:
     """Parse a version string into a tuple of integers."""
@@ -414,3 +445,178 @@ class ExternalLibraryCache:
 
 # Global cache instance
 external_library_cache = ExternalLibraryCache()
+
+
+def content_hash(content: str) -> str:
+    """Hash the content of a file for cache validation."""
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def environment_hash(library_versions: dict[str, str]) -> str:
+    """Hash the installed library versions, which analysis results depend on."""
+    return content_hash(
+        ",".join(f"{name}=={version}" for name, version in sorted(library_versions.items()))
+    )
+
+
+def _file_content_hash(file_path: str) -> str | None:
+    """Hash the content of a file on disk, or None if it cannot be read."""
+    try:
+        return content_hash(Path(file_path).read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class WorkspaceFileCache:
+    """Disk cache of workspace file analysis results, keyed by path and content hash.
+
+    A result also depends on the workspace files it imports from and on the installed
+    library versions, so entries record both and are only reused while they match.
+    The cache file is only read on the first lookup, and changes are kept in memory
+    until flush().
+    """
+
+    def __init__(self, workspace_root: str):
+        self.workspace_root = workspace_root
+        # Created on the first write
+        self.cache_dir = Path(platformdirs.user_cache_dir("param-lsp", "param-lsp"))
+        self._data: WorkspaceCache | None = None
+        self._dirty = False
+        # Files whose entry was checked or written in this session, and so is current
+        self._current: set[str] = set()
+
+    @property
+    def _caching_enabled(self) -> bool:
+        """Check if caching is enabled (disabled in tests), on every use.
+
+        Instances are shared per workspace root, so the environment is not read once
+        at creation.
+        """
+        return os.getenv("PARAM_LSP_DISABLE_CACHE", "").lower() not in ("1", "true")
+
+    @property
+    def cache_path(self) -> Path:
+        """Get the cache file path for the workspace."""
+        root_hash = content_hash(self.workspace_root)
+        cache_str = string_version(CACHE_VERSION, "_")
+        return self.cache_dir / f"workspace-{root_hash}-{cache_str}.msgpack"
+
+    def _load(self) -> WorkspaceCache:
+        """Load the workspace cache from disk on first use."""
+        if self._data is not None:
+            return self._data
+
+        data = WorkspaceCache(workspace_root=self.workspace_root, cache_version=CACHE_VERSION)
+        cache_path = self.cache_path
+        if cache_path.exists():
+            try:
+                with cache_path.open("rb") as f:
+                    existing_data = msgspec.msgpack.decode(f.read(), type=WorkspaceCache)
+                if (
+                    existing_data.workspace_root == self.workspace_root
+                    and tuple(existing_data.cache_version) == CACHE_VERSION
+                ):
+                    data = existing_data
+            except (msgspec.DecodeError, msgspec.ValidationError, OSError) as e:
+                logger.debug(f"Failed to read workspace cache {cache_path}: {e}")
+
+        self._data = data
+        return data
+
+    def get(self, file_path: str, content: str, environment: str) -> AnalysisResult | None:
+        """Get the cached analysis result of a file.
+
+        The result is only returned if the content of the file and of every workspace
+        file it depends on is unchanged, and it was analyzed in the same environment.
+        """
+        if not self._caching_enabled:
+            return None
+
+        entry = self._load().files.get(file_path)
+        if (
+            entry is None
+            or entry.environment != environment
+            or entry.content_hash != content_hash(content)
+        ):
+            return None
+        for dependency_path, dependency_hash in entry.dependencies.items():
+            if _file_content_hash(dependency_path) != dependency_hash:
+                return None
+        self._current.add(file_path)
+        return AnalysisResult(
+            param_classes=dict(entry.param_classes),
+            imports=dict(entry.imports),
+            type_errors=list(entry.type_errors),
+        )
+
+    def set(
+        self,
+        file_path: str,
+        content: str,
+        result: AnalysisResult,
+        environment: str,
+        dependencies: Iterable[str] = (),
+    ) -> None:
+        """Cache the analysis result of a file in memory.
+
+        ``dependencies`` are the workspace files whose results were used for the
+        analysis. Their entries provide the content hashes the result depends on, so
+        the result is only cached if they are all current.
+        """
+        if not self._caching_enabled:
+            return
+
+        files = self._load().files
+        dependency_hashes: dict[str, str] = {}
+        for dependency_path in dependencies:
+            dependency_entry = files.get(dependency_path)
+            if dependency_entry is None or dependency_path not in self._current:
+                # What the result depends on is unknown, so it cannot be validated later
+                self._current.discard(file_path)
+                if files.pop(file_path, None) is not None:
+                    self._dirty = True
+                return
+            dependency_hashes[dependency_path] = dependency_entry.content_hash
+            dependency_hashes.update(dependency_entry.dependencies)
+
+        files[file_path] = WorkspaceFileEntry(
+            content_hash=content_hash(content),
+            analyzed_at=int(time.time()),
+            dependencies=dependency_hashes,
+            environment=environment,
+            param_classes=dict(result["param_classes"]),
+            imports=dict(result["imports"]),
+            type_errors=list(result["type_errors"]),
+        )
+        self._current.add(file_path)
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write pending changes to disk, dropping entries older than the maximum age."""
+        if not self._caching_enabled or not self._dirty or self._data is None:
+            return
+
+        cutoff = int(time.time()) - WORKSPACE_CACHE_MAX_AGE
+        files = self._data.files
+        for file_path in [path for path, entry in files.items() if entry.analyzed_at < cutoff]:
+            del files[file_path]
+
+        # Written to a temporary file first, so a concurrent reader never sees a
+        # partially written cache
+        cache_path = self.cache_path
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with temp_path.open("wb") as f:
+                f.write(msgspec.msgpack.encode(self._data))
+            temp_path.replace(cache_path)
+            logger.debug(f"Flushed workspace cache to {cache_path}")
+        except OSError as e:
+            logger.debug(f"Failed to write workspace cache: {e}")
+        self._dirty = False
+
+
+@cache
+def workspace_file_cache(workspace_root: str) -> WorkspaceFileCache:
+    """Get the shared disk cache of a workspace."""
+    return WorkspaceFileCache(workspace_root)
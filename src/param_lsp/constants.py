@@ -24,36 +24,39 @@ EXCLUDED_DIRS = {
 }
 
 # Parameter type mapping for type checking and validation
-# Maps param type names to qualified Python type strings
+# Maps param type names to tuples of qualified Python type strings
 PARAM_TYPE_MAP = {
     "Number": ("builtins.int", "builtins.float"),
-    "Integer": "builtins.int",
-    "String": "builtins.str",
-    "Boolean": "builtins.bool",
-    "List": "builtins.list",
-    "Tuple": "builtins.tuple",
-    "Dict": "builtins.dict",
+    "Integer": ("builtins.int",),
+    "String": ("builtins.str",),
+    "Boolean": ("builtins.bool",),
+    "List": ("builtins.list",),
+    "Tuple": ("builtins.tuple",),
+    "Dict": ("builtins.dict",),
     "Array": ("builtins.list", "builtins.tuple"),
-    "Range": "builtins.tuple",
-    "Date": "builtins.str",
-    "CalendarDate": "builtins.str",
-    "Filename": "builtins.str",
-    "Foldername": "builtins.str",
-    "Path": "builtins.str",
-    "Color": "builtins.str",
-    "Selector": "builtins.object",
-    "ObjectSelector": "builtins.object",
-    "ListSelector": "builtins.list",
+    "Range": ("builtins.tuple",),
+    "Date": ("builtins.str",),
+    "CalendarDate": ("builtins.str",),
+    "Filename": ("builtins.str",),
+    "Foldername": ("builtins.str",),
+    "Path": ("builtins.str",),
+    "Color": ("builtins.str",),
+    "Selector": ("builtins.object",),
+    "ObjectSelector": ("builtins.object",),
+    "ListSelector": ("builtins.list",),
 }
 
 # Parameter types that are considered to be numeric
-NUMERIC_PARAMETER_TYPES = {"Integer", "Number", "Float"}
+NUMERIC_PARAMETER_TYPES = frozenset({"Integer", "Number", "Float"})
+
+# Parameter types whose values are validated against their bounds
+BOUNDED_PARAMETER_TYPES = frozenset({"Number", "Integer"})
 
 # Parameter types that are considered containers
-CONTAINER_PARAMETER_TYPES = {"List", "Tuple"}
+CONTAINER_PARAMETER_TYPES = frozenset({"List", "Tuple"})
 
 # Selector parameter types that support objects
-SELECTOR_PARAM_TYPES = ("Selector", "ObjectSelector", "ListSelector")
+SELECTOR_PARAM_TYPES = frozenset({"Selector", "ObjectSelector", "ListSelector"})
 
 # =============================================================================
 # LSP SERVER CONSTANTS
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 import msgspec
@@ -21,6 +22,11 @@ class ParameterInfo(msgspec.Struct):
     item_type: str | None = None  # For List parameters (qualified type name like "builtins.str")
     length: int | None = None  # For Tuple parameters
 
+    def __post_init__(self) -> None:
+        # Parameter types come from a small set of names, so all instances, including
+        # those decoded from the cache, share one string per type
+        self.cls = sys.intern(self.cls)
+
 
 class ParameterizedInfo(msgspec.Struct):
     """Information about a Parameterized class."""
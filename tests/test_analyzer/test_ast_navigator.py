@@ -6,6 +6,8 @@ from param_lsp._analyzer.ast_navigator import (
     ImportHandler,
     ParameterDetector,
     SourceAnalyzer,
+    source_text,
+    source_text_from_lines,
 )
 from param_lsp._treesitter import parser
 
@@ -97,6 +99,24 @@ class TestParameterDetector:
 
         assert not detector.is_parameter_call(call_node)
 
+    def test_is_parameter_call_detected_types(self):
+        """Test imported calls are matched against detected parameter types, including relative imports."""
+        imports = {
+            "Children": "..viewable.Children",
+            "IntSlider": "panel.widgets.IntSlider",
+            "Custom": "panel.viewable.Children",
+        }
+        detector = ParameterDetector(imports, {"panel.viewable.Children", "Bare"})
+
+        assert detector.is_parameter_call(_get_first_statement("Children()"))
+        assert detector.is_parameter_call(_get_first_statement("Custom()"))
+        assert not detector.is_parameter_call(_get_first_statement("IntSlider()"))
+        assert detector._parameter_type_imports == {
+            "..viewable.Children": True,
+            "panel.viewable.Children": True,
+            "panel.widgets.IntSlider": False,
+        }
+
 
 class TestImportHandler:
     """Test ImportHandler functionality."""
@@ -168,6 +188,30 @@ class TestImportHandler:
 
         assert imports == {"Int": "param.Integer"}
 
+    def test_handle_import_from_parenthesized_and_wildcard(self):
+        """Test parenthesized and wildcard from-imports only record the imported names."""
+        tree = parser.parse(
+            "from param import (\n    Integer,\n    String as Str,\n)\nfrom panel import *\n"
+        )
+
+        imports = {}
+        handler = ImportHandler(imports)
+        for child in tree.root_node.children:
+            handler.handle_import_from(child)
+
+        assert imports == {"Integer": "param.Integer", "Str": "param.String"}
+
+    def test_handle_dispatches_on_node_type(self):
+        """Test handle dispatches both import forms and ignores other statements."""
+        tree = parser.parse("import param as p\nfrom param import Integer\nx = 1\n")
+
+        imports = {}
+        handler = ImportHandler(imports)
+        for child in tree.root_node.children:
+            handler.handle(child)
+
+        assert imports == {"p": "param", "Integer": "param.Integer"}
+
 
 class TestSourceAnalyzer:
     """Test SourceAnalyzer functionality."""
@@ -192,6 +236,12 @@ class TestSourceAnalyzer:
         line = "items = [1, 2, 3]"
         assert not SourceAnalyzer.looks_like_parameter_assignment(line)
 
+    def test_looks_like_parameter_assignment_literal_with_call_inside(self):
+        """Test that literals containing calls or parentheses are not detected."""
+        assert not SourceAnalyzer.looks_like_parameter_assignment('title = "Widget("')
+        assert not SourceAnalyzer.looks_like_parameter_assignment("items = [func(1)]")
+        assert not SourceAnalyzer.looks_like_parameter_assignment("flag = True or check()")
+
     def test_extract_multiline_definition_simple(self):
         """Test extraction of simple single-line definition."""
         source_lines = ["width = param.Integer(default=100)"]
@@ -260,3 +310,104 @@ class TestSourceAnalyzer:
         ]
         result = SourceAnalyzer.find_parameter_line_in_source(source_lines, 0, "width")
         assert result is None
+
+    def test_find_parameter_line_in_source_skips_comments_and_prefixes(self):
+        """Test that commented-out lines and longer names are not matched."""
+        source_lines = [
+            "class MyWidget(param.Parameterized):",
+            "    # width = param.Integer(default=1)",
+            "    max_width = param.Integer(default=10)",
+            "    width = param.Integer(default=100)",
+        ]
+        result = SourceAnalyzer.find_parameter_line_in_source(source_lines, 10, "width")
+        assert result == 13
+
+    def test_find_parameter_lines_in_source(self):
+        """Test finding several parameter lines in a single pass."""
+        source_lines = [
+            "class MyWidget(param.Parameterized):",
+            "    width = param.Integer(default=100)",
+            "    height = param.Integer(default=50)",
+        ]
+        result = SourceAnalyzer.find_parameter_lines_in_source(
+            source_lines, 5, ["height", "width", "depth"]
+        )
+        assert result == {"width": 6, "height": 7}
+
+    def test_extract_multiline_definition_ignores_brackets_in_strings_and_comments(self):
+        """Test that brackets inside strings, comments and triple strings are ignored."""
+        source_lines = [
+            "    label = param.String(  # closes later )",
+            "        default='(',",
+            '        doc="""Escaped \\" quote',
+            '        and an unmatched [ bracket""",',
+            "    )",
+            "    other = param.Integer()",
+        ]
+        result = SourceAnalyzer.extract_multiline_definition(source_lines, 0)
+        assert result == "\n".join(line.rstrip() for line in source_lines[:5]).strip()
+
+    def test_extract_multiline_definition_unterminated(self):
+        """Test that an unterminated definition falls back to the character scanner."""
+        source_lines = ["width = param.Integer(", "    default=1,"]
+        result = SourceAnalyzer.extract_multiline_definition(source_lines, 0)
+        assert result == "width = param.Integer(\n    default=1,"
+
+    def test_find_definition_end_single_line(self, monkeypatch):
+        """Test balanced single-line definitions end on their line without tokenizing."""
+        from param_lsp._analyzer import ast_navigator
+
+        tokenized = []
+        generate_tokens = ast_navigator.tokenize.generate_tokens
+
+        def counting_generate_tokens(readline):
+            tokenized.append(readline)
+            return generate_tokens(readline)
+
+        monkeypatch.setattr(ast_navigator.tokenize, "generate_tokens", counting_generate_tokens)
+        source_lines = ["    width = param.Integer(default=1, bounds=(0, 10))", "    other = 1"]
+        assert SourceAnalyzer._find_definition_end(source_lines, 0) == 0
+        assert tokenized == []
+
+        # Lines that may hide brackets or continue on the next line are tokenized
+        for first_line in ("x = f(')'", "x = f(  # (", "x = (1 + \\", "x = f("):
+            assert SourceAnalyzer._find_definition_end([first_line, ")"], 0) == 1
+        assert len(tokenized) == 4
+
+    def test_find_parameter_line_index(self):
+        """Test parameter lines are found through the shared source text."""
+        buf = source_text_from_lines(
+            [
+                "class MyWidget(param.Parameterized):",
+                "    count = 1",
+                "    # width = param.Integer()",
+                "    width = param.Integer(default=100)",
+                "    height = param.Integer(default=50)",
+                "    label = param.String(doc='height = param.Integer()')",
+            ]
+        )
+        assert SourceAnalyzer._find_parameter_line_index(buf, "width") == 3
+        assert SourceAnalyzer._find_parameter_line_index(buf, "height") == 4
+        assert SourceAnalyzer._find_parameter_line_index(buf, "count") is None
+        assert SourceAnalyzer._find_parameter_line_index(buf, "depth") is None
+
+    def test_source_text(self):
+        """Test lines are located and sliced through the line start offsets."""
+        buf = source_text("a = 1\nb = param.Integer(\n    default=2\n)")
+        assert buf.line_count == 4
+        assert buf.line_index(0) == 0
+        assert buf.line_index(buf.text.index("default")) == 2
+        assert buf.line_span(1, 3) == "b = param.Integer(\n    default=2\n)"
+        assert buf.line_span(3, 10) == ")"
+        assert source_text_from_lines(buf.text.split("\n")) == buf
+
+    def test_scan_multiline_definition(self):
+        """Test the fallback scanner skips brackets inside strings."""
+        source_lines = [
+            "label = param.String(",
+            "    default='(', doc=\"[{\",",
+            ")",
+            "other = 1",
+        ]
+        result = SourceAnalyzer._scan_multiline_definition(source_lines, 0)
+        assert result == "\n".join(source_lines[:3])
@@ -211,3 +211,23 @@ class TestClass(param.Parameterized):
         for warning in empty_default_warnings:
             assert warning["severity"] == "warning"
             assert "empty default but bounds specified" in warning["message"]
+
+    def test_non_empty_default_with_bounds_no_warning(self, analyzer):
+        """Test containers with items, including a lone comment, are not reported as empty."""
+        code_py = """\
+import param
+
+class TestClass(param.Parameterized):
+    list_with_bounds = param.List(default=[1], bounds=(1, 5))
+    tuple_with_bounds = param.Tuple(default=(1,), bounds=(1, 3))
+    commented_list = param.List(default=[
+        # placeholder
+    ], bounds=(1, 5))
+"""
+
+        result = analyzer.analyze_file(code_py)
+
+        empty_default_warnings = [
+            e for e in result["type_errors"] if e["code"] == "empty-default-with-bounds"
+        ]
+        assert empty_default_warnings == []
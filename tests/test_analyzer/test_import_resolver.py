@@ -8,6 +8,7 @@ import pytest
 
 from src.param_lsp._analyzer.import_resolver import ImportResolver
 from src.param_lsp._treesitter import parser, walk_tree
+from src.param_lsp._types import AnalysisResult
 
 
 class TestImportResolver:
@@ -161,6 +162,46 @@ class TestImportResolver:
         # Should return None for non-existent modules
         assert result is None
 
+    def test_resolve_module_path_cached(self, tmp_path):
+        """Test resolve_module_path caches resolved paths but retries misses."""
+        (tmp_path / "mymodule.py").write_text("x = 1\n")
+        resolver = ImportResolver(workspace_root=str(tmp_path))
+
+        expected = str(tmp_path / "mymodule.py")
+        assert resolver.resolve_module_path("mymodule") == expected
+        assert resolver.resolve_module_path("missing_module_xyz") is None
+        assert resolver.module_path_cache == {("mymodule", None): expected}
+
+        # Cached results are returned without touching the filesystem again
+        (tmp_path / "mymodule.py").unlink()
+        assert resolver.resolve_module_path("mymodule") == expected
+
+        # A module created after a failed lookup resolves
+        (tmp_path / "missing_module_xyz.py").write_text("x = 1\n")
+        assert resolver.resolve_module_path("missing_module_xyz") == str(
+            tmp_path / "missing_module_xyz.py"
+        )
+
+    def test_analyze_imported_module_forgets_moved_module(self, tmp_path):
+        """Test a module moved into a package resolves to its new file."""
+        (tmp_path / "mymodule.py").write_text("x = 1\n")
+        resolver = ImportResolver(
+            workspace_root=str(tmp_path),
+            analyze_file_func=lambda content, path: AnalysisResult(
+                param_classes={}, imports={"path": path}, type_errors=[]
+            ),
+        )
+        assert resolver.analyze_imported_module("mymodule")["imports"]["path"] == str(
+            tmp_path / "mymodule.py"
+        )
+
+        (tmp_path / "mymodule.py").unlink()
+        (tmp_path / "mymodule").mkdir()
+        (tmp_path / "mymodule" / "__init__.py").write_text("x = 2\n")
+        assert resolver.analyze_imported_module("mymodule")["imports"]["path"] == str(
+            tmp_path / "mymodule" / "__init__.py"
+        )
+
     def test_resolve_module_path_no_workspace(self):
         """Test resolve_module_path without workspace root."""
         resolver = ImportResolver(workspace_root=None)
@@ -218,6 +259,29 @@ class TestImportResolver:
         result = resolver.analyze_imported_module("test.module")
         assert result == cached_result
 
+    def test_analyze_imported_module_reanalyzes_edited_file(self, tmp_path):
+        """Test cached module results are dropped once the module file changes."""
+        module_file = tmp_path / "widgets.py"
+        module_file.write_text("x = 1\n")
+        analyzed = []
+
+        def analyze_file(content, file_path=None):
+            analyzed.append(content)
+            return {"param_classes": {}, "imports": {}, "type_errors": []}
+
+        resolver = ImportResolver(workspace_root=str(tmp_path), analyze_file_func=analyze_file)
+        first = resolver.analyze_imported_module("widgets")
+        assert resolver.analyze_imported_module("widgets") is first
+        assert analyzed == ["x = 1\n"]
+
+        module_file.write_text("x = 2\n")
+        stat = module_file.stat()
+        os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert resolver.analyze_imported_module("widgets") is not first
+        assert analyzed == ["x = 1\n", "x = 2\n"]
+        assert resolver.analyze_imported_module("widgets") is resolver.module_cache["widgets"]
+        assert len(analyzed) == 2
+
     def test_get_imported_param_class_info_no_import(self, resolver):
         """Test get_imported_param_class_info with unknown import."""
         result = resolver.get_imported_param_class_info("TestClass", "unknown_import")
@@ -234,3 +234,33 @@ S().x = "not_int"  # Should detect error for inherited parameter
         # Should detect type error
         assert len(result["type_errors"]) == 1
         assert result["type_errors"][0]["code"] == "runtime-type-mismatch"
+
+    def test_inheritance_processing_order_chain_and_cycle(self, analyzer):
+        """Test a reversed inheritance chain resolves and circular bases still get processed."""
+        code_py = """\
+import param
+
+class C(B):
+    c = param.Number(1.0)
+
+class B(A):
+    b = param.Boolean(True)
+
+class A(param.Parameterized):
+    a = param.Integer(5)
+
+class X(Y, param.Parameterized):
+    x = param.Integer(1)
+
+class Y(X, param.Parameterized):
+    y = param.Integer(2)
+"""
+
+        result = analyzer.analyze_file(code_py)
+
+        param_classes = result["param_classes"]
+        c_class = get_class(param_classes, "C", raise_if_none=True)
+        assert set(c_class.parameters) >= {"a", "b", "c"}
+        assert c_class.parameters["a"].cls == "Integer"
+        assert "x" in get_class(param_classes, "X", raise_if_none=True).parameters
+        assert "y" in get_class(param_classes, "Y", raise_if_none=True).parameters
@@ -4,7 +4,11 @@ Tests for the parameter_extractor module.
 
 from __future__ import annotations
 
+import pytest
+
+from param_lsp._analyzer.ast_navigator import source_text
 from param_lsp._analyzer.parameter_extractor import (
+    _extract_source_definition,
     extract_boolean_value,
     extract_bounds_from_call,
     extract_default_from_call,
@@ -16,6 +20,7 @@ from param_lsp._analyzer.parameter_extractor import (
     is_none_value,
     is_parameter_assignment,
     is_parameter_call,
+    resolve_parameter_class,
 )
 from param_lsp._treesitter import parser
 
@@ -68,6 +73,19 @@ class TestExtractNumericValue:
         node = parse_expression("1e3")
         assert extract_numeric_value(node) == 1000.0
 
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [("0x1F", 31), ("0o17", 15), ("0b101", 5), ("1_000", 1000), ("00", 0)],
+    )
+    def test_extract_integer_literal_forms(self, code, expected):
+        node = parse_expression(code)
+        assert extract_numeric_value(node) == expected
+
+    @pytest.mark.parametrize("code", ["1j", "1.5j", "2J"])
+    def test_extract_imaginary_is_none(self, code):
+        node = parse_expression(code)
+        assert extract_numeric_value(node) is None
+
     def test_extract_none_value(self):
         node = parse_expression("None")
         assert extract_numeric_value(node) is None
@@ -112,6 +130,13 @@ class TestExtractStringValue:
         node = parse_expression("'''another'''")
         assert extract_string_value(node) == "another"
 
+    def test_extract_prefixed_strings(self):
+        """Test string prefixes are removed together with the quotes."""
+        assert extract_string_value(parse_expression(r"r'\d+'")) == r"\d+"
+        assert extract_string_value(parse_expression('b"bytes"')) == "bytes"
+        assert extract_string_value(parse_expression('Rb"""raw"""')) == "raw"
+        assert extract_string_value(parse_expression('f"{name}"')) == "{name}"
+
     def test_extract_non_string(self):
         node = parse_expression("42")
         assert extract_string_value(node) is None
@@ -258,6 +283,19 @@ class TestGetKeywordArguments:
         assert isinstance(kwargs, dict)
         assert len(kwargs) == 0
 
+    def test_kwargs_cache(self):
+        """Test arguments are memoized by call node when a cache is given."""
+        node = parse_expression("param.Integer(default=1, doc='x')")
+        cache = {}
+        kwargs = get_keyword_arguments(node, cache)
+        assert list(kwargs) == ["default", "doc"]
+        assert list(cache) == [node]
+
+        # Callers get a copy, so changing it does not change the cached arguments
+        kwargs.pop("doc")
+        assert list(get_keyword_arguments(node, cache)) == ["default", "doc"]
+        assert get_keyword_arguments(node, cache) is not cache[node]
+
 
 class TestExtractFromCall:
     """Test extraction from parameter calls."""
@@ -279,3 +317,52 @@ class TestExtractFromCall:
         default = extract_default_from_call(node)
         # Should return a node or None
         assert default is None or hasattr(default, "type")
+
+
+class TestResolveParameterClass:
+    """Test resolution of the parameter class of a call."""
+
+    def test_resolve_parameter_class(self):
+        imports = {"p": "param", "Int": "param.Integer", "Other": "panel.widgets.Other"}
+        assert resolve_parameter_class(parse_expression("p.String()"), imports) == {
+            "type": "String",
+            "module": "param",
+        }
+        assert resolve_parameter_class(parse_expression("Int()"), imports) == {
+            "type": "Integer",
+            "module": "param",
+        }
+        assert resolve_parameter_class(parse_expression("Other()"), imports) == {
+            "type": "Other",
+            "module": "param",
+        }
+        assert resolve_parameter_class(parse_expression("pn.Other()"), imports) is None
+
+    def test_resolve_parameter_class_cache(self):
+        """Test results are memoized by call node when a cache is given."""
+        node = parse_expression("param.Integer()")
+        cache = {}
+        result = resolve_parameter_class(node, {}, cache)
+        assert result == {"type": "Integer", "module": "param"}
+        assert cache == {node: result}
+        assert resolve_parameter_class(node, {}, cache) is result
+
+        missing = parse_expression("pn.Other()")
+        assert resolve_parameter_class(missing, {}, cache) is None
+        assert cache[missing] is None
+
+
+class TestExtractSourceDefinition:
+    """Test extracting source definitions from file content."""
+
+    def test_extract_source_definition(self):
+        """Test that the definition keeps its indentation."""
+        buf = source_text(
+            "class A(param.Parameterized):\n    x = param.Integer(\n        default=1\n    )\n"
+        )
+        result = _extract_source_definition(buf, 1, 3)
+        assert result == "    x = param.Integer(\n        default=1\n    )"
+
+    def test_extract_source_definition_out_of_range(self):
+        """Test that a line index outside the content returns None."""
+        assert _extract_source_definition(source_text("x = 1"), 5, 5) is None
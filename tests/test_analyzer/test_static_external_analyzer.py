@@ -133,6 +133,11 @@ class NotParameterized:
         assert my_widget_info.parameters["value"].cls == "Integer"
         assert my_widget_info.parameters["name"].cls == "String"
 
+        # Lines already split by the caller give the same result
+        lines: list[str] = [*test_code.split("\n")]
+        presplit = self.static_analyzer._analyze_file_ast(tree.root_node, test_code, lines)
+        assert presplit == file_analysis
+
     def test_complex_parameter_extraction(self):
         """Test extraction of complex parameter definitions."""
         test_code = """
@@ -234,6 +239,49 @@ class Widget3(param.Parameterized):
         result = self.static_analyzer.analyze_external_class("nonexistent.module.Class")
         assert result is None
 
+    def test_class_body_skips_method_definitions(self):
+        """Test parameters in nested blocks are found, but not assignments in methods."""
+        test_code = """
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default=1)
+
+    if True:
+        label = param.String()
+
+    @param.depends("value", watch=True)
+    def _update(self):
+        local = param.Number()
+
+    async def _fetch(self):
+        other = param.Number()
+"""
+        from src.param_lsp._treesitter import parser
+
+        tree = parser.parse(test_code)
+        widget_info = self.static_analyzer._analyze_file_ast(tree.root_node, test_code)["Widget"]
+
+        assert widget_info is not None
+        assert set(widget_info.parameters) == {"value", "label"}
+
+    def test_base_matches_with_class_names(self):
+        """Test simple base names match through the class name set like the path scan."""
+        from src.param_lsp._analyzer.static_external_analyzer import _class_names_of
+
+        classes = {"panel.layout.base.ListPanel", "panel.viewable.Children", "Bare"}
+        names = _class_names_of(classes)
+        assert names == {"ListPanel", "Children"}
+        for base in ("ListPanel", "Children", "Bare", "Missing", "layout.base.ListPanel"):
+            expected = self.static_analyzer._base_matches_parameterized_class(base, classes)
+            assert (
+                self.static_analyzer._base_matches_parameterized_class(base, classes, names)
+                == expected
+            )
+            assert self.static_analyzer._base_matches_parameter_type(base, classes, names) == (
+                self.static_analyzer._base_matches_parameter_type(base, classes)
+            )
+
     def test_caching_behavior(self):
         """Test that analysis results are properly cached."""
         pytest.importorskip("panel")
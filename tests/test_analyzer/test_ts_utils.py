@@ -18,6 +18,16 @@ from param_lsp._treesitter import (
     walk_tree,
 )
 from param_lsp._treesitter.parser import parse
+from param_lsp._treesitter.queries import (
+    find_attribute_assignments,
+    find_calls,
+    find_classes,
+    find_imports,
+    find_imports_and_classes,
+    find_imports_classes_and_calls,
+    find_param_depends_decorators,
+    find_validation_targets,
+)
 
 
 class TestBasicUtils:
@@ -66,6 +76,104 @@ class TestBasicUtils:
         assert "=" in values
         assert "42" in values
 
+    def test_walk_tree_preorder(self):
+        """Test walk_tree yields nodes in depth-first pre-order."""
+        tree = parse("x = f(1)\ny = 2")
+        values = [get_value(node) for node in walk_tree(tree.root_node) if not node.children]
+        assert values == ["x", "=", "f", "(", "1", ")", "y", "=", "2"]
+
+    def test_find_imports_classes_and_calls(self):
+        """Test the single-pass query matches the separate import, class and call queries."""
+        code = """\
+import param
+from panel import widgets
+
+class Outer(param.Parameterized):
+    value = param.Integer(default=int("1"))
+
+    class Inner:
+        pass
+
+obj = Outer(value=widgets.IntSlider())
+"""
+        tree = parse(code)
+        imports, classes, calls = find_imports_classes_and_calls(tree)
+        assert imports == find_imports(tree)
+        assert classes == find_classes(tree)
+        assert calls == find_calls(tree)
+        assert len(imports) == 2
+        assert len(classes) == 2
+        assert len(calls) == 4
+
+    def test_find_validation_targets(self):
+        """Test the single-pass query matches the separate queries used for validation."""
+        code = """\
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default=1)
+
+    @param.depends("value", watch=True)
+    def _update(self):
+        self.value = int("2")
+
+w = Widget(value=3)
+w.value = 4
+"""
+        tree = parse(code)
+        classes, assignments, calls, decorators = find_validation_targets(tree)
+        assert classes == [node for node, _ in find_classes(tree)]
+        assert assignments == [
+            (node, captures["object"], captures["attr_name"], captures["value"])
+            for node, captures in find_attribute_assignments(tree)
+        ]
+        assert calls == [node for node, _ in find_calls(tree)]
+        assert decorators == [node for node, _ in find_param_depends_decorators(tree)]
+        assert (len(classes), len(assignments), len(calls), len(decorators)) == (1, 2, 4, 1)
+
+    def test_analysis_queries_share_one_pass(self, monkeypatch):
+        """Test the analyzer and validation queries walk the same tree only once."""
+        from param_lsp._treesitter import queries
+
+        executed = []
+        execute_query = queries._execute_query
+
+        def counting_execute_query(query, node):
+            executed.append(node)
+            return execute_query(query, node)
+
+        monkeypatch.setattr(queries, "_execute_query", counting_execute_query)
+        tree = parse("import param\n\nclass A(param.Parameterized):\n    x = param.Integer()\n")
+        imports, classes, calls = find_imports_classes_and_calls(tree)
+        class_nodes, _, call_nodes, _ = find_validation_targets(tree.root_node)
+        assert len(executed) == 1
+        assert class_nodes == [node for node, _ in classes]
+        assert call_nodes == [node for node, _ in calls]
+        assert len(imports) == 1
+
+        # A new tree runs the query again
+        find_validation_targets(parse("x = 1"))
+        assert len(executed) == 2
+
+    def test_find_imports_and_classes(self):
+        """Test imports and class definitions, including nested ones, are found in document order."""
+        code = """\
+import param
+
+class Outer(param.Parameterized):
+    from panel import widgets
+
+    class Inner:
+        pass
+"""
+        tree = parse(code)
+        import_nodes, class_nodes = find_imports_and_classes(tree)
+        assert [node.type for node in import_nodes] == [
+            "import_statement",
+            "import_from_statement",
+        ]
+        assert [get_class_name(node) for node in class_nodes] == ["Outer", "Inner"]
+
 
 class TestClassUtils:
     """Test class-related utility functions."""
@@ -6,7 +6,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from src.param_lsp._analyzer.validation import ParameterValidator
+from src.param_lsp._analyzer.validation import ParameterValidator, _format_bounds
 from src.param_lsp._treesitter import parser, walk_tree
 from src.param_lsp.models import ParameterInfo, ParameterizedInfo
 
@@ -272,16 +272,143 @@ class TestParameterValidator:
         result = validator._parse_bounds_format((0, 10))
         assert result == (0, 10, True, True)  # inclusive on both sides
 
+    def test_parse_bounds_format_inclusive(self, validator):
+        """Test _parse_bounds_format returns four element bounds unchanged."""
+        bounds = (0, None, False, True)
+        assert validator._parse_bounds_format(bounds) is bounds
+
     def test_parse_bounds_format_invalid(self, validator):
         """Test _parse_bounds_format with invalid bounds."""
         result = validator._parse_bounds_format((1, 2, 3))  # 3 elements, invalid
         assert result is None
 
-    def test_format_bounds_description(self, validator):
-        """Test _format_bounds_description."""
-        description = validator._format_bounds_description(0, 10, True, True)
+    def test_format_bounds(self):
+        """Test _format_bounds."""
+        description = _format_bounds(0, 10, True, True)
         assert "0" in description
         assert "10" in description
+        # Cached per distinct bounds, keeping int and float bounds apart
+        assert _format_bounds(0, 10, True, True) is description
+        assert _format_bounds(0.0, None, False, True) == "(0.0, ∞]"
+
+    def test_effective_bounds(self, validator):
+        """Test _effective_bounds keeps bounds exact and makes missing bounds infinite."""
+        assert validator._effective_bounds(0, 10, True, True) == (0, 10)
+        assert validator._effective_bounds(0, 10, False, False) == (0, 10)
+        assert validator._effective_bounds(None, None, True, True) == (
+            float("-inf"),
+            float("inf"),
+        )
+
+    def test_compile_bounds(self, validator):
+        """Test _compile_bounds precomputes limits and description once per bounds."""
+        compiled = validator._compile_bounds((0, 10, True, False))
+        assert compiled == (0, 10, True, False, "[0, 10)")
+        assert validator._compile_bounds((0, 10, True, False)) is compiled
+        assert validator._compile_bounds((1, 2, 3)) is None
+        # Equal int and float bounds keep their own description
+        assert validator._compile_bounds((0.0, 10.0, True, False))[4] == "[0.0, 10.0)"
+
+    def test_bounds_violation(self, validator):
+        """Test _bounds_violation reports the value and description only when outside bounds."""
+        compiled = validator._compile_bounds((0, 10, True, False))
+        tree = parser.parse("a = 10\nb = 5\nc = 'x'\n")
+        values = [
+            statement.children[0].child_by_field_name("right")
+            for statement in tree.root_node.children
+        ]
+        assert validator._bounds_violation(values[0], compiled) == (10, "[0, 10)")
+        assert validator._bounds_violation(values[1], compiled) is None
+        assert validator._bounds_violation(values[2], compiled) is None
+
+    def test_bounds_violation_exclusive_bounds(self, validator):
+        """Test exclusive bounds reject only the bound itself, also for floats."""
+        compiled = validator._compile_bounds((0.5, 1.5, False, False))
+        tree = parser.parse("a = 0.5\nb = 0.5000000001\nc = 1.5\nd = 1\n")
+        values = [
+            statement.children[0].child_by_field_name("right")
+            for statement in tree.root_node.children
+        ]
+        assert [validator._bounds_violation(value, compiled) is None for value in values] == [
+            False,
+            True,
+            False,
+            True,
+        ]
+
+    def test_bounds_violation_large_int_bounds(self, validator):
+        """Test int bounds beyond float precision and range are compared exactly."""
+        tree = parser.parse(f"a = {2**60 + 1}\nb = {2**60}\nc = 5\n")
+        values = [
+            statement.children[0].child_by_field_name("right")
+            for statement in tree.root_node.children
+        ]
+        compiled = validator._compile_bounds((2**60, None, False, True))
+        assert validator._bounds_violation(values[0], compiled) is None
+        assert validator._bounds_violation(values[1], compiled) is not None
+
+        huge = validator._compile_bounds((10**400, None, True, True))
+        assert validator._bounds_violation(values[2], huge) is not None
+
+    def test_extract_container_items(self, validator):
+        """Test list and tuple items skip punctuation but keep every element."""
+        tree = parser.parse("a = [1, 'x',  # note\n  *rest]\nb = (1, 2,)\nc = []\n")
+        values = [
+            statement.children[0].child_by_field_name("right")
+            for statement in tree.root_node.children
+        ]
+        list_items = validator._extract_list_items(values[0])
+        assert [item.type for item in list_items] == ["integer", "string", "comment", "list_splat"]
+        tuple_items = validator._extract_tuple_items(values[1])
+        assert [item.type for item in tuple_items] == ["integer", "integer"]
+        assert validator._extract_list_items(values[2]) is None
+        assert validator._extract_tuple_items(values[0]) is None
+
+    def test_numeric_value_is_memoized(self, validator):
+        """Test _numeric_value caches values per node across fresh node wrappers."""
+        tree = parser.parse("x = -1.5\n")
+        assignment = tree.root_node.children[0].children[0]
+        value_node = assignment.child_by_field_name("right")
+        assert validator._numeric_value(value_node) == -1.5
+        assert len(validator._state.numeric) == 1
+        assert validator._numeric_value(assignment.child_by_field_name("right")) == -1.5
+        assert len(validator._state.numeric) == 1
+
+    def test_resolve_full_class_path_from_attribute(self, validator):
+        """Test _resolve_full_class_path_from_attribute builds dotted paths through imports."""
+        validator.imports["pn"] = "panel"
+        tree = parser.parse("pn.widgets.IntSlider\nfoo().bar.Baz\n")
+        attr_nodes = [
+            node
+            for node in walk_tree(tree.root_node)
+            if node.type == "attribute"
+            and node.parent is not None
+            and node.parent.type == "expression_statement"
+        ]
+        assert validator._resolve_full_class_path_from_attribute(attr_nodes[0]) == (
+            "panel.widgets.IntSlider"
+        )
+        assert validator._resolve_full_class_path_from_attribute(attr_nodes[1]) == "bar.Baz"
+        # Memoized per node for the pass
+        assert list(validator._state.class_paths.values()) == [
+            "panel.widgets.IntSlider",
+            "bar.Baz",
+        ]
+        validator._state.class_paths[attr_nodes[1]] = "cached.Baz"
+        assert validator._resolve_full_class_path_from_attribute(attr_nodes[1]) == "cached.Baz"
+
+    def test_compatible_types(self, validator):
+        """Test _compatible_types resolves the inferable types accepted for expected types."""
+        assert validator._compatible_types(("builtins.float",)) == {
+            "builtins.float",
+            "builtins.int",
+        }
+        assert validator._compatible_types(("builtins.str",)) == {"builtins.str"}
+        assert validator._compatible_types(("mymodule.Custom",)) == frozenset()
+        # Memoized, and shared with the type checks of parameter types
+        accepted = validator._compatible_types(("builtins.str",))
+        assert validator._compatible_types(("builtins.str",)) is accepted
+        assert validator._type_checks["String"][1] is accepted
 
     def test_get_parameter_type_from_class_existing(self, validator):
         """Test _get_parameter_type_from_class with existing parameter."""
@@ -298,25 +425,93 @@ class TestParameterValidator:
         param_type = validator._get_parameter_type_from_class("MissingClass", "test_param")
         assert param_type is None
 
-    def test_get_parameter_allow_none_default_false(self, validator):
-        """Test _get_parameter_allow_None with default False."""
-        allow_none = validator._get_parameter_allow_None("TestClass", "test_param")
-        assert allow_none is False
-
-    def test_get_parameter_allow_none_missing_param(self, validator):
-        """Test _get_parameter_allow_None with missing parameter."""
-        allow_none = validator._get_parameter_allow_None("TestClass", "missing_param")
+    def test_check_table_allow_none_default_false(self, validator):
+        """Test the check table stores allow_None, which defaults to False."""
+        _type_check, allow_none, _bounds, _cls = validator._get_check_table("TestClass")[
+            "test_param"
+        ]
         assert allow_none is False
 
-    def test_get_parameter_bounds_existing(self, validator):
-        """Test _get_parameter_bounds with existing bounds."""
-        bounds = validator._get_parameter_bounds("TestClass", "numeric_param")
-        assert bounds == (0, 100)
+    def test_check_table_bounds(self, validator):
+        """Test the check table stores compiled bounds only for parameters with bounds."""
+        table = validator._get_check_table("TestClass")
+        numeric_bounds = table["numeric_param"][2]
+        assert numeric_bounds is not None
+        assert numeric_bounds[:2] == (0, 100)
+        assert table["test_param"][2] is None
+
+    def test_get_check_table(self, validator):
+        """Test _get_check_table folds type, allow_None and bounds per parameter."""
+        table = validator._get_check_table("TestClass")
+        type_check, allow_none, bounds, cls = table["numeric_param"]
+        assert type_check == validator._type_checks["Number"]
+        assert (allow_none, cls) == (False, "Number")
+        # Bounds are stored compiled, shared with _compile_bounds
+        assert bounds is validator._compile_bounds((0, 100))
+        assert bounds[:2] == (0, 100)
+        assert table["test_param"][1:] == (False, None, "String")
+        # Parameter types without a type mapping have no type check
+        assert table["pam"][0] is None
+        assert "missing_param" not in table
+        assert validator._get_check_table("MissingClass") == {}
+
+    def test_type_checks(self, validator):
+        """Test _type_checks resolves compatible inferred types per parameter type."""
+        expected_types, accepted_types = validator._type_checks["Number"]
+        assert expected_types == ("builtins.int", "builtins.float")
+        assert accepted_types == {"builtins.int", "builtins.float"}
+        assert validator._type_checks["Boolean"][1] == {"builtins.bool"}
+        assert validator._type_checks["String"][0] == ("builtins.str",)
+        assert "builtins.str" in validator._type_checks["Selector"][1]
+
+    def test_lookup_param_info_is_memoized(self, validator):
+        """Test _lookup_param_info caches lookups until the next analysis pass."""
+        param_info = validator._lookup_param_info("TestClass", "numeric_param")
+        assert param_info is not None
+        assert param_info.bounds == (0, 100)
+        assert validator._state.param_info["TestClass"]["numeric_param"] is param_info
+
+        # Missing parameters are cached as well
+        assert validator._lookup_param_info("TestClass", "missing_param") is None
+        assert "missing_param" in validator._state.param_info["TestClass"]
+
+        validator.check_parameter_types(parser.parse("x = 1").root_node, ["x = 1"])
+        assert validator._state.param_info == {}
+
+    def test_external_param_index(self, validator):
+        """Test _get_external_param_index maps parameters to the first defining class."""
+        slider = ParameterizedInfo(name="IntSlider")
+        slider.add_parameter(ParameterInfo(name="value", cls="Integer"))
+        slider.add_parameter(ParameterInfo(name="start", cls="Integer"))
+        text = ParameterizedInfo(name="TextInput")
+        text.add_parameter(ParameterInfo(name="value", cls="String"))
+        validator.external_param_classes.update(
+            {
+                "panel.widgets.IntSlider": slider,
+                "panel.widgets.Missing": None,
+                "panel.widgets.TextInput": text,
+            }
+        )
 
-    def test_get_parameter_bounds_missing(self, validator):
-        """Test _get_parameter_bounds with missing bounds."""
-        bounds = validator._get_parameter_bounds("TestClass", "test_param")
-        assert bounds is None
+        index = validator._get_external_param_index()
+        assert index == {
+            "value": "panel.widgets.IntSlider",
+            "start": "panel.widgets.IntSlider",
+        }
+
+    def test_local_class_keys(self, validator):
+        """Test _get_local_class_keys maps base class names to their first unique key."""
+        validator.param_classes["Outer.Inner:7"] = ParameterizedInfo(name="Outer.Inner")
+        assert validator._get_local_class_keys() == {
+            "TestClass": "TestClass:1",
+            "Outer.Inner": "Outer.Inner:7",
+        }
+        assert validator._has_class_with_base_name("TestClass")
+        assert not validator._has_class_with_base_name("Test")
+
+        code = "TestClass()\nOther()\n"
+        calls = [node for node in walk_tree(parser.parse(code).root_node) if node.type == "call"]
+        assert [validator._get_instance_class(call) for call in calls] == ["TestClass:1", "Other"]
 
     def test_create_type_error(self, validator):
         """Test _create_type_error method."""
@@ -370,6 +565,21 @@ class TestClass(param.Parameterized):
         validator._check_class_parameter_defaults(class_nodes[0], lines)
         assert len(validator.type_errors) > initial_errors
 
+    def test_check_parameter_default_type_none(self, validator):
+        """Test a None default is accepted regardless of an explicit allow_None."""
+        code = """
+class TestClass(param.Parameterized):
+    test_param = param.String(default=None, allow_None=False)
+"""
+        tree = parser.parse(code)
+        class_nodes = [
+            node for node in walk_tree(tree.root_node) if node.type == "class_definition"
+        ]
+
+        initial_errors = len(validator.type_errors)
+        validator._check_class_parameter_defaults(class_nodes[0], code.split("\n"))
+        assert len(validator.type_errors) == initial_errors
+
     def test_check_parameter_types_integration(self, validator):
         """Test check_parameter_types integration method."""
         code = """
@@ -602,6 +812,32 @@ class TestClass(param.Parameterized):
         params = validator._get_class_parameters("MissingClass")
         assert len(params) == 0
 
+    def test_get_class_methods_from_node(self, validator):
+        """Test plain, decorated and async methods are found, but not nested classes."""
+        code = """
+class TestClass(param.Parameterized):
+    value = param.Integer()
+
+    def plain(self):
+        pass
+
+    @param.depends("value")
+    def decorated(self):
+        pass
+
+    async def fetch(self):
+        pass
+
+    @dataclass
+    class Nested:
+        def inner(self):
+            pass
+"""
+        tree = parser.parse(code)
+        class_node = tree.root_node.children[0]
+        methods = validator._get_class_methods_from_node(class_node)
+        assert methods == {"plain", "decorated", "fetch"}
+
     def test_check_param_depends_duplicate_class_names(self, validator):
         """Test @param.depends with duplicate class names - should use last definition."""
         code = """
@@ -9,7 +9,14 @@ from unittest.mock import Mock, patch
 import msgspec
 import pytest
 
-from param_lsp.cache import ExternalLibraryCache, external_library_cache
+from param_lsp._types import AnalysisResult
+from param_lsp.cache import (
+    WORKSPACE_CACHE_MAX_AGE,
+    ExternalLibraryCache,
+    WorkspaceFileCache,
+    environment_hash,
+    external_library_cache,
+)
 from param_lsp.models import ParameterInfo, ParameterizedInfo
 from tests.conftest import _get_library_version_from_env
 
@@ -319,6 +326,121 @@ class TestExternalLibraryCache:
             assert "value" in result.parameters
 
 
+class TestWorkspaceFileCache:
+    """Test the WorkspaceFileCache functionality."""
+
+    @staticmethod
+    def _cache(temp_dir, workspace_root="/workspace"):
+        cache = WorkspaceFileCache(workspace_root)
+        cache.cache_dir = Path(temp_dir)
+        return cache
+
+    @staticmethod
+    def _result() -> AnalysisResult:
+        class_info = ParameterizedInfo(name="Widget")
+        class_info.add_parameter(ParameterInfo(name="value", cls="Integer", default="1"))
+        return AnalysisResult(
+            param_classes={"Widget:2": class_info}, imports={"param": "param"}, type_errors=[]
+        )
+
+    def test_roundtrip_keyed_by_content(self, enable_cache_for_test):
+        """Test results are persisted on flush and only reused for unchanged content."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = self._cache(temp_dir)
+            cache.set("/workspace/widget.py", "content", self._result(), "env")
+            assert not cache.cache_path.exists()
+            cache.flush()
+            assert cache.cache_path.exists()
+
+            reloaded = self._cache(temp_dir)
+            result = reloaded.get("/workspace/widget.py", "content", "env")
+            assert result is not None
+            assert result["param_classes"]["Widget:2"].parameters["value"].cls == "Integer"
+            # Independently decoded parameter types share the interned string
+            other = self._cache(temp_dir).get("/workspace/widget.py", "content", "env")
+            assert other is not None
+            assert (
+                result["param_classes"]["Widget:2"].parameters["value"].cls
+                is other["param_classes"]["Widget:2"].parameters["value"].cls
+            )
+            assert result["imports"] == {"param": "param"}
+            assert reloaded.get("/workspace/widget.py", "changed content", "env") is None
+            assert reloaded.get("/workspace/other.py", "content", "env") is None
+            assert (
+                self._cache(temp_dir, "/other").get("/workspace/widget.py", "content", "env")
+                is None
+            )
+
+    def test_keyed_by_environment(self, enable_cache_for_test):
+        """Test results analyzed with other library versions are not reused."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = self._cache(temp_dir)
+            environment = environment_hash({"param": "2.2.0"})
+            cache.set("/workspace/widget.py", "content", self._result(), environment)
+            assert cache.get("/workspace/widget.py", "content", environment) is not None
+            other = environment_hash({"param": "2.3.0"})
+            assert cache.get("/workspace/widget.py", "content", other) is None
+
+    def test_keyed_by_dependencies(self, enable_cache_for_test):
+        """Test results are only reused while the files they depend on are unchanged."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir) / "base.py"
+            base.write_text("base")
+            middle = Path(temp_dir) / "middle.py"
+            middle.write_text("middle")
+            cache = self._cache(temp_dir)
+            cache.set(str(base), "base", self._result(), "env")
+            cache.set(str(middle), "middle", self._result(), "env", [str(base)])
+            cache.set("/workspace/top.py", "top", self._result(), "env", [str(middle)])
+            cache.flush()
+
+            # Dependencies are recorded transitively
+            reloaded = self._cache(temp_dir)
+            assert reloaded.get("/workspace/top.py", "top", "env") is not None
+            base.write_text("changed")
+            assert reloaded.get("/workspace/top.py", "top", "env") is None
+            assert reloaded.get(str(middle), "middle", "env") is None
+
+    def test_unknown_dependency_not_cached(self, enable_cache_for_test):
+        """Test results depending on files without a current entry are not cached."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = self._cache(temp_dir)
+            cache.set("/workspace/top.py", "top", self._result(), "env")
+            cache.set("/workspace/top.py", "top", self._result(), "env", ["/workspace/base.py"])
+            assert cache.get("/workspace/top.py", "top", "env") is None
+
+    def test_flush_drops_old_entries(self, enable_cache_for_test):
+        """Test entries analyzed longer ago than the maximum age are dropped on flush."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = self._cache(temp_dir)
+            cache.set("/workspace/old.py", "old", self._result(), "env")
+            cache.set("/workspace/new.py", "new", self._result(), "env")
+            cache._load().files["/workspace/old.py"].analyzed_at -= WORKSPACE_CACHE_MAX_AGE + 1
+            cache.flush()
+
+            reloaded = self._cache(temp_dir)
+            assert reloaded.get("/workspace/old.py", "old", "env") is None
+            assert reloaded.get("/workspace/new.py", "new", "env") is not None
+
+    def test_disabled(self, monkeypatch):
+        """Test nothing is cached when caching is disabled, checked on every use."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = self._cache(temp_dir)
+            cache.cache_dir = Path(temp_dir) / "cache"
+            cache.set("/workspace/widget.py", "content", self._result(), "env")
+            cache.flush()
+            assert not cache.cache_dir.exists()
+            assert cache.get("/workspace/widget.py", "content", "env") is None
+
+            # Enabled later for the same instance, the directory is created on flush
+            monkeypatch.setenv("PARAM_LSP_DISABLE_CACHE", "0")
+            cache.set("/workspace/widget.py", "content", self._result(), "env")
+            assert not cache.cache_dir.exists()
+            cache.flush()
+            assert cache.cache_path.exists()
+            assert cache.get("/workspace/widget.py", "content", "env") is not None
+
+
 class TestCacheIntegration:
     """Test cache integration with the analyzer."""
 
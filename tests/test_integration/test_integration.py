@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+
 from tests.util import get_class
 
 
@@ -280,3 +282,306 @@ class ValidClass(param.Parameterized):
         # Should still extract the valid parts
         valid_class = get_class(result["param_classes"], "ValidClass", raise_if_none=True)
         assert valid_class.parameters["valid_param"].cls == "String"
+
+    def test_resolve_class_name_from_context(self, analyzer):
+        """Test resolving variable names to the param class they were instantiated from."""
+        code_py = """\
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default=1)
+
+other = 1
+w = Widget(value=2)
+w.value = 3
+"""
+        result = analyzer.analyze_file(code_py)
+        param_classes = result["param_classes"]
+        widget_key = next(key for key in param_classes if key.startswith("Widget:"))
+
+        assert analyzer.resolve_class_name_from_context("w", param_classes, code_py) == widget_key
+        assert analyzer.resolve_class_name_from_context("Widget", param_classes, code_py) == (
+            widget_key
+        )
+        assert analyzer.resolve_class_name_from_context("other", param_classes, code_py) is None
+
+        # Results are cached until the next analysis
+        assert analyzer._resolved_class_names[("w", code_py)] == widget_key
+        analyzer.analyze_file(code_py.replace("other = 1", "other = 2"))
+        assert not analyzer._resolved_class_names
+
+    def test_unchanged_content_reuses_analysis(self, analyzer):
+        """Test re-analyzing unchanged content returns the previous result."""
+        code_py = """\
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default=1)
+"""
+        result = analyzer.analyze_file(code_py, "widget.py")
+        assert analyzer.analyze_file(code_py, "widget.py") is result
+        assert get_class(result["param_classes"], "Widget") is not None
+
+        changed = analyzer.analyze_file(code_py.replace("Widget", "Panel"), "widget.py")
+        assert get_class(changed["param_classes"], "Panel") is not None
+        assert get_class(changed["param_classes"], "Widget") is None
+
+    def test_unchanged_content_reanalyzes_edited_import(self, tmp_path):
+        """Test unchanged content is analyzed again when an imported module changed."""
+        from param_lsp.analyzer import ParamAnalyzer
+
+        module_file = tmp_path / "mod.py"
+        module_file.write_text(
+            "import param\n\nclass A(param.Parameterized):\n    x = param.Integer()\n"
+        )
+        main_file = tmp_path / "main.py"
+        code_py = "from mod import A\n\nclass B(A):\n    pass\n\nB(x='a')\n"
+        main_file.write_text(code_py)
+
+        analyzer = ParamAnalyzer(workspace_root=str(tmp_path))
+        result = analyzer.analyze_file(code_py, str(main_file))
+        assert len(result["type_errors"]) == 1
+        assert analyzer.analyze_file(code_py, str(main_file)) is result
+
+        module_file.write_text(
+            "import param\n\nclass A(param.Parameterized):\n    x = param.String()\n"
+        )
+        stat = module_file.stat()
+        os.utime(module_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert analyzer.analyze_file(code_py, str(main_file))["type_errors"] == []
+
+    def test_workspace_cache_tracks_dependencies(self, tmp_path, monkeypatch):
+        """Test a persisted result is not reused after a module it inherits from changed."""
+        from param_lsp.analyzer import ParamAnalyzer
+        from param_lsp.cache import workspace_file_cache
+
+        monkeypatch.setenv("PARAM_LSP_DISABLE_CACHE", "0")
+
+        def restart():
+            workspace_file_cache.cache_clear()
+            workspace_file_cache(str(tmp_path)).cache_dir = tmp_path / "cache"
+            return ParamAnalyzer(workspace_root=str(tmp_path))
+
+        base_file = tmp_path / "base.py"
+        base_file.write_text(
+            "import param\n\nclass A(param.Parameterized):\n    x = param.Integer()\n"
+        )
+        (tmp_path / "mod.py").write_text("from base import A\n\nclass B(A):\n    pass\n")
+        code_py = "from mod import B\n\nclass C(B):\n    pass\n\nC(x='a')\n"
+
+        try:
+            assert (
+                len(restart().analyze_file(code_py, str(tmp_path / "main.py"))["type_errors"]) == 1
+            )
+            assert (tmp_path / "cache").exists()
+
+            base_file.write_text(
+                "import param\n\nclass A(param.Parameterized):\n    x = param.String()\n"
+            )
+            assert restart().analyze_file(code_py, str(tmp_path / "main.py"))["type_errors"] == []
+        finally:
+            workspace_file_cache.cache_clear()
+
+    def test_class_names_and_bases_memoized(self, analyzer):
+        """Test class names and bases are computed once per class node and analysis."""
+        code_py = """\
+import param
+
+class Base(param.Parameterized):
+    value = param.Integer(default=1)
+
+class Child(Base):
+    other = param.String()
+"""
+        result = analyzer.analyze_file(code_py, "memo.py")
+        assert get_class(result["param_classes"], "Child") is not None
+        assert sorted(name for name in analyzer._class_names.values() if name) == [
+            "Base",
+            "Child",
+        ]
+        for node, bases in analyzer._class_bases.items():
+            assert analyzer._get_class_bases(node) is bases
+
+        analyzer.analyze_file(code_py.replace("Child", "Panel"), "memo.py")
+        assert "Child" not in analyzer._class_names.values()
+
+    def test_keyword_arguments_shared_per_analysis(self, analyzer):
+        """Test call arguments are extracted once per analysis for the analyzer and validator."""
+        code_py = """\
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default="a", doc="Value")
+
+Widget(value=1)
+"""
+        result = analyzer.analyze_file(code_py, "kwargs.py")
+        assert len(result["type_errors"]) == 1
+        assert sorted(sorted(kwargs) for kwargs in analyzer._keyword_arguments.values()) == [
+            ["default", "doc"],
+            ["value"],
+        ]
+
+        analyzer.analyze_file(code_py.replace("Widget(value=1)", ""), "kwargs.py")
+        assert list(map(list, analyzer._keyword_arguments.values())) == [["default", "doc"]]
+
+    def test_external_discovery_skipped_without_allowed_imports(self, analyzer, monkeypatch):
+        """Test calls are only resolved for external classes when an allowed library is imported."""
+        resolved = []
+        resolve = analyzer.import_resolver.resolve_full_class_path
+
+        def resolve_full_class_path(node):
+            resolved.append(node)
+            return resolve(node)
+
+        monkeypatch.setattr(
+            analyzer.import_resolver, "resolve_full_class_path", resolve_full_class_path
+        )
+
+        analyzer.analyze_file("import os\nfrom .local import Widget\n\nWidget(path=os.getcwd())\n")
+        assert resolved == []
+
+        analyzer.analyze_file("import os\nimport param\n\nparam.Parameterized(name=os.getcwd())\n")
+        assert resolved
+        # Paths are resolved from the captured function nodes, not the call nodes
+        assert [node.text for node in resolved] == [b"param.Parameterized", b"os.getcwd"]
+
+    def test_class_paths_shared_with_validator(self, analyzer):
+        """Test called functions resolved by the analyzer are reused by the validator."""
+        code_py = """\
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default=1)
+
+param.Parameterized(name="a")
+Widget(value="b")
+"""
+        result = analyzer.analyze_file(code_py, "paths.py")
+        assert [e["code"] for e in result["type_errors"]] == ["constructor-type-mismatch"]
+
+        class_paths = analyzer.validator._class_path_cache
+        assert class_paths is analyzer.import_resolver.class_path_cache
+        assert {node.text: path for node, path in class_paths.items()} == {
+            b"param.Integer": "param.Integer",
+            b"param.Parameterized": "param.Parameterized",
+            b"Widget": "Widget",
+        }
+        assert analyzer.validator._state.class_paths == {}
+
+    def test_runtime_assignments_index_scope_parameters_once(self, analyzer):
+        """Test runtime assignments in the same scope reuse the classes found in it."""
+        code_py = """\
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default=1)
+
+class Plain:
+    pass
+
+w = Widget()
+w.value = "a"
+w.value = "b"
+
+def build():
+    x = Widget()
+    x.value = "c"
+"""
+        result = analyzer.analyze_file(code_py, "scope.py")
+        runtime_errors = [e for e in result["type_errors"] if e["code"] == "runtime-type-mismatch"]
+        assert [e["line"] for e in runtime_errors] == [9, 10]
+
+        # The module and the function scope are each searched once
+        scope_param_owners = analyzer.validator._state.scope_param_owners
+        assert list(scope_param_owners.values()) == [
+            {"value": "Widget:2"},
+            {},
+        ]
+
+    def test_scope_parameters_use_collected_classes(self, analyzer, monkeypatch):
+        """Test scope indexes pick their classes from the pass instead of querying the scope."""
+        from param_lsp._analyzer import validation
+
+        def fail_find_classes(tree):
+            msg = "scope classes should come from the validation pass"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(validation, "find_classes", fail_find_classes)
+        code_py = """\
+import param
+
+class Outer(param.Parameterized):
+    size = param.Integer(default=1)
+
+def build():
+    class Inner(param.Parameterized):
+        count = param.Integer(default=1)
+
+    inner = Inner()
+    inner.count = "a"
+"""
+        analyzer.analyze_file(code_py, "scopes.py")
+        scope_param_owners = analyzer.validator._state.scope_param_owners
+        assert list(scope_param_owners.values()) == [{"count": "Inner:6"}]
+
+    def test_runtime_assignments_use_check_table(self, analyzer):
+        """Test runtime assignments check type, allow_None and bounds from the check table."""
+        code_py = """\
+import param
+
+class Widget(param.Parameterized):
+    value = param.Integer(default=1, bounds=(0, 10))
+    label = param.String(default=None, allow_None=True)
+
+w = Widget()
+w.value = 11
+w.value = "a"
+w.label = None
+"""
+        result = analyzer.analyze_file(code_py, "runtime.py")
+        assert [(e["line"], e["code"]) for e in result["type_errors"]] == [
+            (7, "bounds-violation"),
+            (8, "runtime-type-mismatch"),
+        ]
+        assert set(analyzer.validator._state.check_tables["Widget:2"]) == {"value", "label"}
+
+    def test_call_assignment_index(self, analyzer):
+        """Test indexing call assignments by target name, including dotted class names."""
+        from param_lsp.analyzer import _call_assignment_index
+
+        code_py = """\
+import holoviews as hv
+
+w = Widget()
+c = hv.element.Curve([])
+w = Other()
+x = 1
+"""
+        index = _call_assignment_index(code_py)
+        assert index == {"w": ["Widget", "Other"], "c": ["hv.element.Curve"]}
+
+        # Indexed once per document for the current analysis, and dropped with the next
+        analyzer.resolve_class_name_from_context("w", {}, code_py)
+        assert analyzer._call_assignments == {code_py: index}
+        analyzer.analyze_file("x = 1\n")
+        assert not analyzer._call_assignments
+
+    def test_find_parameter_defining_class(self, analyzer):
+        """Test the defining class is found through the memoized parameter names."""
+        from types import SimpleNamespace
+
+        from param_lsp.analyzer import _param_names_of
+
+        class Base:
+            param = SimpleNamespace(value=1)
+            _param_names = ("value",)
+
+        class Child(Base):
+            param = SimpleNamespace(value=1, size=2)
+            _param_names = ("size",)
+
+        assert analyzer._find_parameter_defining_class(Child, "size") is Child
+        assert analyzer._find_parameter_defining_class(Child, "value") is Base
+        assert _param_names_of(Child) == frozenset({"size"})
+        assert _param_names_of(Child) is _param_names_of(Child)
@@ -226,3 +226,13 @@ UnknownClass().param.x."""
         assert len(completions) == 0, (
             f"Expected 0 completions for unknown class, got {len(completions)}"
         )
+
+    def test_partial_attribute(self):
+        """Test the word typed after a parameter attribute prefix is extracted."""
+        from param_lsp._server.completion import _partial_attribute
+
+        assert _partial_attribute("P().param.x.de", ".x.") == "de"
+        assert _partial_attribute("P().param.x.", ".x.") == ""
+        assert _partial_attribute("P().param.xx.de", ".x.") == ""
+        assert _partial_attribute("P().param.x.rx.val", ".x.rx.") == "val"
+        assert _partial_attribute("P().param.x.de fa", ".x.") == ""